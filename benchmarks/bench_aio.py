@@ -0,0 +1,108 @@
+# -*- coding:utf-8 -*-
+"""
+Event loop latency benchmark for rendering keyboards in async handlers.
+
+Many concurrent handlers render large keyboards, while a probe coroutine
+measures how late the loop wakes it up. Blocking renders delay the probe
+by the whole batch, offloaded ones only by the executor round trips.
+
+Usage:
+    python benchmarks/bench_aio.py [--handlers 200] [--buttons 100] [--processes 2]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable = C0413
+from keyboa.keyboard import Keyboa
+
+PROBE_INTERVAL = 0.001
+
+
+async def probe(delays: list, stop: asyncio.Event) -> None:
+    """
+    :param delays: lateness of every wake-up in seconds
+    :param stop:
+    :return:
+    """
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        delays.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+
+async def handler(keyboa: Keyboa, mode: str, executor) -> str:
+    """
+    :param keyboa:
+    :param mode:
+    :param executor:
+    :return:
+    """
+    if mode == "blocking":
+        return keyboa.slice(as_json=True)
+    return await keyboa.arender(as_json=True, executor=executor)
+
+
+async def run(mode: str, handlers: int, buttons: int, executor) -> tuple:
+    """
+    :param mode:
+    :param handlers:
+    :param buttons:
+    :param executor:
+    :return: total time and delays of the probe
+    """
+    keyboards = [
+        Keyboa(
+            items=[(f"item {index}", f"&id={index}") for index in range(buttons)],
+            front_marker=f"&user={user}",
+            alignment=True,
+        )
+        for user in range(handlers)
+    ]
+    delays = []
+    stop = asyncio.Event()
+    probing = asyncio.ensure_future(probe(delays, stop))
+    await asyncio.sleep(PROBE_INTERVAL)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[handler(keyboa, mode, executor) for keyboa in keyboards])
+    total = time.perf_counter() - started
+
+    stop.set()
+    await probing
+    return total, delays
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--handlers", type=int, default=200)
+    parser.add_argument("--buttons", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{args.handlers} concurrent handlers, {args.buttons} buttons each")
+    print(f"{'mode':>10} {'total ms':>10} {'p50 lag ms':>11} {'max lag ms':>11}")
+    with ThreadPoolExecutor(max_workers=4) as threads, ProcessPoolExecutor(
+        max_workers=args.processes
+    ) as processes:
+        for mode, executor in (
+            ("blocking", None),
+            ("threads", threads),
+            ("processes", processes),
+        ):
+            total, delays = asyncio.run(run(mode, args.handlers, args.buttons, executor))
+            delays = delays or [0.0]
+            print(
+                f"{mode:>10} {total * 1000:>10.1f} "
+                f"{statistics.median(delays) * 1000:>11.2f} {max(delays) * 1000:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
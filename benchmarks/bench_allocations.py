@@ -0,0 +1,113 @@
+# -*- coding:utf-8 -*-
+"""
+Memory and allocation benchmark for button creation.
+
+Compares a Button dataclass per item (as Keyboa did before) with
+build_button, which Keyboa.convert_items_to_buttons uses now,
+and the size of Button objects with ButtonSpec objects.
+
+Usage:
+    python benchmarks/bench_allocations.py [--renders 100000] [--buttons 100]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable = C0413
+from keyboa.button import Button, ButtonSpec, build_button
+
+FRONT_MARKER = "&item="
+BACK_MARKER = "$"
+
+
+def render_with_dataclass(items: list) -> list:
+    """
+    :param items:
+    :return:
+    """
+    return [
+        Button(
+            button_data=item,
+            front_marker=FRONT_MARKER,
+            back_marker=BACK_MARKER,
+            copy_text_to_callback=True,
+        ).generate()
+        for item in items
+    ]
+
+
+def render_with_build_button(items: list) -> list:
+    """
+    :param items:
+    :return:
+    """
+    return [build_button(item, FRONT_MARKER, BACK_MARKER, True) for item in items]
+
+
+def retained_size(factory, items: list) -> int:
+    """
+    :param factory:
+    :param items:
+    :return: bytes held by objects created by factory for every item,
+        not counting the item itself
+    """
+    tracemalloc.start()
+    objects = [factory(item) for item in items]
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def churn(render, items: list, renders: int) -> tuple:
+    """
+    :param render:
+    :param items:
+    :param renders:
+    :return: seconds spent and the peak of traced memory while rendering
+    """
+    start = time.perf_counter()
+    for _render in range(renders):
+        render(items)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _render in range(max(renders // 100, 1)):
+        render(items)
+    _size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--renders", type=int, default=100000)
+    parser.add_argument("--buttons", type=int, default=100)
+    args = parser.parse_args()
+
+    items = [f"item {number}" for number in range(args.buttons)]
+
+    dataclass_size = retained_size(
+        lambda item: Button(item, FRONT_MARKER, BACK_MARKER, True), items
+    )
+    prepared = [Button.prepare(item, FRONT_MARKER, BACK_MARKER, True) for item in items]
+    spec_size = retained_size(lambda pair: ButtonSpec(*pair), prepared)
+    print(f"{args.buttons} Button objects:     {dataclass_size:>8} bytes")
+    print(f"{args.buttons} ButtonSpec objects: {spec_size:>8} bytes")
+
+    print(f"\n{args.buttons}-button keyboard rendered {args.renders} times")
+    print(f"{'path':>18} {'seconds':>10} {'peak, bytes':>12}")
+    for name, render in (
+        ("Button.generate", render_with_dataclass),
+        ("build_button", render_with_build_button),
+    ):
+        seconds, peak = churn(render, items, args.renders)
+        print(f"{name:>18} {seconds:>10.2f} {peak:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding:utf-8 -*-
+"""
+Throughput benchmark for CallbackCodec with and without side-table stores.
+
+Usage:
+    python benchmarks/bench_codec.py [--number 100000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable = C0413
+from keyboa.codec import CallbackCodec, MemoryCallbackStore, SqliteCallbackStore
+
+KEYS = ("city", "street", "house", "apartments")
+SHORT = {"city": "London", "street": "Baker Street", "apartments": "221b"}
+LONG = {"city": "London", "street": "Baker Street " * 4, "house": 221, "page": 12}
+
+
+def throughput(function, number: int) -> float:
+    """
+    :param function:
+    :param number:
+    :return: calls per second
+    """
+    return number / min(timeit.repeat(function, number=number, repeat=3))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        codecs = (
+            ("keys", CallbackCodec(KEYS), SHORT),
+            ("memory store", CallbackCodec(KEYS, store=MemoryCallbackStore()), LONG),
+            (
+                "sqlite store",
+                CallbackCodec(
+                    KEYS, store=SqliteCallbackStore(os.path.join(directory, "cb.sqlite"))
+                ),
+                LONG,
+            ),
+        )
+
+        print(f"{'codec':>14} {'size':>6} {'encode/s':>12} {'decode/s':>12}")
+        for name, codec, pairs in codecs:
+            data = codec.encode(pairs)
+            number = args.number if "sqlite" not in name else args.number // 10
+            encode = throughput(lambda: codec.encode(pairs), number)
+            decode = throughput(lambda: codec.decode(data), number)
+            print(f"{name:>14} {len(data):>6} {encode:>12.0f} {decode:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+"""
+Benchmark for combining many keyboards into one.
+
+Compares Keyboa.combine and Keyboa.combine_json with the previous
+implementation, which validated and re-rendered every button
+of the combined keyboard as a new Keyboa.
+
+Usage:
+    python benchmarks/bench_combine.py [--number 1000] [--keyboards 10]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable = C0413
+from keyboa.keyboard import Keyboa
+
+BUTTONS_IN_KEYBOARD = 10
+
+
+def legacy_combine(keyboards):
+    """
+    Combine as it was implemented before
+    :param keyboards:
+    :return:
+    """
+    for keyboard in keyboards:
+        Keyboa.is_keyboard_proper_type(keyboard)
+    data = Keyboa.merge_keyboards_data(keyboards)
+    return Keyboa(items=data).keyboard
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--keyboards", type=int, default=10)
+    args = parser.parse_args()
+
+    keyboas = [
+        Keyboa(
+            items=[
+                (f"item {index}", f"&id={index}") for index in range(BUTTONS_IN_KEYBOARD)
+            ],
+            front_marker=f"&block={block}",
+            items_in_row=5,
+        )
+        for block in range(args.keyboards)
+    ]
+    markups = [keyboa.keyboard for keyboa in keyboas]
+    fragments = [keyboa.to_json() for keyboa in keyboas]
+    expected = legacy_combine(markups).to_json()
+    assert Keyboa.combine(markups).to_json() == expected
+    assert Keyboa.combine_json(fragments) == expected
+
+    print(
+        f"{args.number} combines of {args.keyboards} keyboards "
+        f"with {BUTTONS_IN_KEYBOARD} buttons"
+    )
+    for name, function in (
+        ("legacy", lambda: legacy_combine(markups)),
+        ("combine", lambda: Keyboa.combine(markups)),
+        ("combine from generator", lambda: Keyboa.combine(iter(markups))),
+        ("combine_json", lambda: Keyboa.combine_json(fragments)),
+    ):
+        seconds = min(timeit.repeat(function, number=args.number, repeat=3))
+        print(f"{name:>24} {seconds * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
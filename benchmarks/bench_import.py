@@ -0,0 +1,62 @@
+# -*- coding:utf-8 -*-
+"""
+Import time of keyboa compared with pyTelegramBotAPI types.
+
+Every statement runs in a fresh interpreter with -X importtime.
+The cumulative time of top-level imports is reported
+without the modules that the interpreter imports at startup.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = "%s/../" % os.path.dirname(os.path.abspath(__file__))
+
+STATEMENTS = (
+    ("keyboa", "import keyboa"),
+    ("keyboa + json", "import keyboa; keyboa.Keyboa(items=[1, 2, 3]).to_json()"),
+    ("telebot.types", "import telebot.types"),
+)
+
+
+def import_microseconds(statement: str) -> int:
+    """
+    :param statement:
+    :return: cumulative import time of all top-level modules
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not name.startswith(" ") or name.startswith("  "):
+            continue
+        total += int(cumulative)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    startup = min(import_microseconds("pass") for _ in range(args.repeat))
+    print(f"{'statement':>14} {'ms':>8}")
+    for name, statement in STATEMENTS:
+        microseconds = min(import_microseconds(statement) for _ in range(args.repeat))
+        print(f"{name:>14} {(microseconds - startup) / 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
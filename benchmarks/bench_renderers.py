@@ -0,0 +1,44 @@
+# -*- coding:utf-8 -*-
+"""
+Benchmark of rendering a keyboard for a library other than telebot.
+
+Compares building telebot markup and converting it, which is what
+bots on other libraries had to do, with rendering verified buttons directly.
+
+Usage:
+    python benchmarks/bench_renderers.py [--items 100] [--number 1000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable = C0413
+from keyboa import Keyboa
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    items = [(f"Item {number}", number) for number in range(args.items)]
+    options = {"items_in_row": 4, "front_marker": "&item="}
+    keyboa = Keyboa(items=items, **options)
+    assert keyboa.render("dict") == keyboa.keyboard.to_dict()
+
+    print(f"{args.items} items, {args.number} renders")
+    for name, function in (
+        ("convert", lambda: Keyboa(items=items, **options).keyboard.to_dict()),
+        ("render", lambda: Keyboa(items=items, **options).render("dict")),
+        ("re-render", lambda: keyboa.render("dict")),
+    ):
+        seconds = min(timeit.repeat(function, number=args.number, repeat=3))
+        print(f"{name:>10} {args.number / seconds:>10.0f} keyboards/s")
+
+
+if __name__ == "__main__":
+    main()
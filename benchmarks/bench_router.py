@@ -0,0 +1,65 @@
+# -*- coding:utf-8 -*-
+"""
+Lookup benchmark for CallbackRouter with many routes.
+
+Compares the trie lookup with a linear scan over prefixes,
+which is what ad-hoc handlers with startswith checks do.
+
+Usage:
+    python benchmarks/bench_router.py [--routes 10000] [--number 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable = C0413
+from keyboa.router import CallbackRouter
+
+
+def linear_resolve(prefixes: list, data: str):
+    """
+    :param prefixes: sorted from the longest to the shortest
+    :param data:
+    :return:
+    """
+    for prefix in prefixes:
+        if data.startswith(prefix):
+            return prefix
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--routes", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    prefixes = [f"&menu{number}=" for number in range(args.routes)]
+    router = CallbackRouter()
+    for prefix in prefixes:
+        router.register(prefix, len)
+    longest_first = sorted(prefixes, key=len, reverse=True)
+
+    random.seed(0)
+    data = [f"{random.choice(prefixes)}item&id=123$" for _ in range(1000)]
+    assert all(
+        router.resolve(item).prefix == linear_resolve(longest_first, item)
+        for item in data
+    )
+
+    print(f"{args.routes} routes, {args.number} lookups")
+    for name, function in (
+        ("trie", lambda: [router.resolve(item) for item in data]),
+        ("linear", lambda: [linear_resolve(longest_first, item) for item in data]),
+    ):
+        number = max(args.number // len(data), 1)
+        seconds = min(timeit.repeat(function, number=number, repeat=3))
+        print(f"{name:>8} {number * len(data) / seconds:>12.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# -*- coding:utf-8 -*-
+"""
+Benchmark for the row building step of Keyboa.
+
+Compares the single-pass Keyboa.chunked with the previous implementation,
+which built every row with buttons.pop(0) and therefore was quadratic.
+
+Usage:
+    python benchmarks/bench_rows.py [--sizes 100 10000 1000000] [--repeat 3]
+
+Keep in mind that the legacy implementation takes minutes for 1M items.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+from keyboa.keyboard import Keyboa  # pylint: disable = C0413
+
+ITEMS_IN_ROW = 5
+
+
+def legacy_rows(buttons: list, items_in_row: int) -> list:
+    """
+    Row building as it was implemented before Keyboa.chunked
+    :param buttons:
+    :param items_in_row:
+    :return:
+    """
+    rows = []
+    rows_in_keyboard = len(buttons) // items_in_row
+    for _row in range(rows_in_keyboard):
+        rows.append([buttons.pop(0) for _button in range(items_in_row)])
+    if buttons:
+        rows.append(buttons)
+    return rows
+
+
+def chunked_rows(buttons: list, items_in_row: int) -> list:
+    """
+    :param buttons:
+    :param items_in_row:
+    :return:
+    """
+    return list(Keyboa.chunked(buttons, items_in_row))
+
+
+def measure(function, size: int, repeat: int) -> float:
+    """
+    Return the best time of building rows from size items.
+    The source list is created outside of the measured code,
+    because the legacy implementation consumes it.
+    :param function:
+    :param size:
+    :param repeat:
+    :return:
+    """
+    timer = timeit.Timer(
+        stmt="function(buttons, items_in_row)",
+        setup="buttons = list(range(size))",
+        globals={"function": function, "size": size, "items_in_row": ITEMS_IN_ROW},
+    )
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    assert chunked_rows(list(range(23)), ITEMS_IN_ROW) == legacy_rows(
+        list(range(23)), ITEMS_IN_ROW
+    )
+
+    print(f"{'items':>10} {'legacy, s':>12} {'chunked, s':>12} {'speedup':>10}")
+    for size in args.sizes:
+        legacy = measure(legacy_rows, size, args.repeat)
+        chunked = measure(chunked_rows, size, args.repeat)
+        print(f"{size:>10} {legacy:>12.6f} {chunked:>12.6f} {legacy / chunked:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
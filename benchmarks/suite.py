@@ -0,0 +1,213 @@
+# -*- coding:utf-8 -*-
+"""
+Benchmark suite for every render path of Keyboa.
+
+Every scenario is timed with timeit: the number of calls is calibrated
+to take about --time seconds, and the best of --repeat runs is reported
+in nanoseconds per call. Results can be saved as a JSON baseline
+and compared with it later, e.g. before and after a change.
+
+Usage:
+    python benchmarks/suite.py [--filter keyboard] [--save baseline.json]
+    python benchmarks/suite.py --compare baseline.json [--threshold 0.2]
+
+The compare mode exits with code 1 if any scenario is slower than
+the baseline by more than the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+# pylint: disable = C0413
+from telebot.types import InlineKeyboardButton
+
+from keyboa import Button, Keyboa, KeyboaTemplate
+
+BUTTONS = 100
+FRONT_MARKER = "&menu="
+BACK_MARKER = "$"
+
+INPUTS = {
+    "str": lambda index: f"item {index}",
+    "int": lambda index: index,
+    "tuple": lambda index: (f"item {index}", f"id={index}"),
+    "dict": lambda index: {f"item {index}": f"id={index}"},
+    "dict_text": lambda index: {"text": f"item {index}", "callback_data": f"{index}"},
+    "button": lambda index: InlineKeyboardButton(
+        text=f"item {index}", callback_data=f"{index}"
+    ),
+}
+
+
+def flat(kind: str, count: int = BUTTONS) -> list:
+    """
+    :param kind: one of INPUTS
+    :param count:
+    :return:
+    """
+    return [INPUTS[kind](index) for index in range(count)]
+
+
+def structured(kind: str, count: int = BUTTONS, items_in_row: int = 4) -> list:
+    """
+    :param kind: one of INPUTS
+    :param count:
+    :param items_in_row:
+    :return:
+    """
+    items = flat(kind, count)
+    return [
+        items[start : start + items_in_row] for start in range(0, count, items_in_row)
+    ]
+
+
+def scenarios() -> Dict[str, Callable]:
+    """
+    :return: name and function of every scenario
+    """
+    cases = {}
+    for kind in INPUTS:
+        items = flat(kind)
+        rows = structured(kind)
+        cases[f"button.generate[{kind}]"] = lambda item=items[0]: Button(
+            button_data=item, front_marker=FRONT_MARKER, back_marker=BACK_MARKER
+        ).generate()
+        cases[f"keyboard.flat[{kind}]"] = lambda items=items: Keyboa(
+            items=items, items_in_row=4
+        ).keyboard
+        cases[f"keyboard.structured[{kind}]"] = lambda rows=rows: Keyboa(
+            items=rows
+        ).keyboard
+        cases[f"keyboard.to_json[{kind}]"] = lambda items=items: Keyboa(
+            items=items, items_in_row=4
+        ).to_json()
+
+    items = flat("str")
+    rows = structured("str")
+    keyboa = Keyboa(items=items, items_in_row=4, front_marker=FRONT_MARKER)
+    compiled = keyboa.compile()
+    cached = Keyboa(items=items, items_in_row=4, cache_markup=True)
+    markups = [Keyboa(items=flat("tuple", 10), items_in_row=5).keyboard] * 10
+    fragments = [markup.to_json() for markup in markups]
+    template = KeyboaTemplate(
+        items=items, items_in_row=4, front_marker=FRONT_MARKER, back_marker="&id={id}$"
+    )
+
+    cases.update(
+        {
+            "keyboard.markers": lambda: Keyboa(
+                items=items,
+                items_in_row=4,
+                front_marker=FRONT_MARKER,
+                back_marker=BACK_MARKER,
+            ).keyboard,
+            "keyboard.alignment": lambda: Keyboa(items=items, alignment=True).keyboard,
+            "keyboard.alignment_reverse": lambda: Keyboa(
+                items=items, alignment=(2, 3, 4, 5), alignment_reverse=True
+            ).keyboard,
+            "keyboard.row_width": lambda: Keyboa(items=items, row_width=30).keyboard,
+            "keyboard.validation": lambda: Keyboa(items=rows),
+            "slice.half": lambda: keyboa(slice(0, BUTTONS // 2)),
+            "slice.step": lambda: keyboa(slice(0, None, 3)),
+            "slice.cached": lambda: cached(slice(0, BUTTONS // 2)),
+            "compiled.keyboard": lambda: compiled.keyboard,
+            "compiled.to_json": compiled.to_json,
+            "combine": lambda: Keyboa.combine(markups),
+            "combine_json": lambda: Keyboa.combine_json(fragments),
+            "template.render": lambda: template.render(id=123),
+            "render_many.markers": lambda: list(
+                keyboa.render_many(
+                    ({"back_marker": f"&user={user}"} for user in range(10)),
+                    as_json=True,
+                )
+            ),
+            "fingerprint.cold": lambda: Keyboa(items=rows).fingerprint(),
+        }
+    )
+    return cases
+
+
+def measured(function: Callable, seconds: float, repeat: int) -> float:
+    """
+    :param function:
+    :param seconds: approximate time of one run
+    :param repeat: the number of runs
+    :return: nanoseconds per call in the best run
+    """
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    number = max(int(number * seconds / max(elapsed, 1e-9)), 1)
+    return min(timer.repeat(number=number, repeat=repeat)) / number * 1e9
+
+
+def compared(results: Dict[str, float], baseline: Dict[str, float], threshold: float):
+    """
+    :param results:
+    :param baseline:
+    :param threshold: allowed slowdown, e.g. 0.2 for 20%
+    :return: names of regressed scenarios
+    """
+    regressions = []
+    for name, nanoseconds in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<36} {nanoseconds:>12.0f} ns   (new)")
+            continue
+        change = nanoseconds / previous - 1
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<36} {nanoseconds:>12.0f} ns {change:>+8.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--filter", default="", help="run scenarios containing it")
+    parser.add_argument("--time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="save results to a JSON baseline")
+    parser.add_argument("--compare", help="compare results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = {}
+    for name, function in scenarios().items():
+        if args.filter in name:
+            results[name] = measured(function, args.time, args.repeat)
+            if not args.compare:
+                print(f"{name:<36} {results[name]:>12.0f} ns")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compared(results, baseline, args.threshold)
+        if regressions:
+            print(
+                f"{len(regressions)} scenarios regressed "
+                f"by more than {args.threshold:.0%}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
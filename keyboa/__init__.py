@@ -1,7 +1,63 @@
 # -*- coding:utf-8 -*-
 """
 Import from here
+
+Modules are imported on the first access to their names,
+so "import keyboa" does not import pyTelegramBotAPI or any other
+dependency until it is needed.
 """
 
-from keyboa.keyboard import Keyboa
-from keyboa.button import Button
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from keyboa.keyboard import Keyboa
+    from keyboa.button import Button, ButtonSpec, build_button
+    from keyboa.compiled import CompiledKeyboa
+    from keyboa.ir import KeyboardIR
+    from keyboa.editable import EditableKeyboard
+    from keyboa.paginator import Paginator
+    from keyboa.template import KeyboaTemplate
+    from keyboa.cache import LRUCache
+    from keyboa.codec import CallbackCodec, MemoryCallbackStore, SqliteCallbackStore
+    from keyboa.persistent import SqliteKeyboardCache
+    from keyboa.router import CallbackRouter
+    from keyboa.diff import KeyboardDiff, diff_keyboards
+    from keyboa.renderers import Renderer
+
+
+MODULES = {
+    "Keyboa": "keyboa.keyboard",
+    "Button": "keyboa.button",
+    "ButtonSpec": "keyboa.button",
+    "build_button": "keyboa.button",
+    "CompiledKeyboa": "keyboa.compiled",
+    "KeyboardIR": "keyboa.ir",
+    "EditableKeyboard": "keyboa.editable",
+    "Paginator": "keyboa.paginator",
+    "KeyboaTemplate": "keyboa.template",
+    "LRUCache": "keyboa.cache",
+    "CallbackCodec": "keyboa.codec",
+    "MemoryCallbackStore": "keyboa.codec",
+    "SqliteCallbackStore": "keyboa.codec",
+    "SqliteKeyboardCache": "keyboa.persistent",
+    "CallbackRouter": "keyboa.router",
+    "KeyboardDiff": "keyboa.diff",
+    "diff_keyboards": "keyboa.diff",
+    "Renderer": "keyboa.renderers",
+}
+
+__all__ = list(MODULES)
+
+
+def __getattr__(name: str):
+    module = MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
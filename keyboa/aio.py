@@ -0,0 +1,175 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains asyncio helpers, so that building large keyboards
+in handlers of async bots does not block the event loop.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from operator import getitem
+from typing import TYPE_CHECKING, AsyncIterable, Optional, Union
+
+
+from keyboa.keyboard import Keyboa
+from keyboa.source import BaseItemSource, ItemSource, StreamedSlice
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup
+
+OFFLOAD_THRESHOLD = 30
+
+
+class AsyncItemSource(BaseItemSource):
+    """
+    The same as ItemSource, but for async iterables, e.g. async database cursors.
+    Items are consumed only as far as the requested slice needs,
+    and are kept for further slices.
+
+    :iterable: AsyncIterable - any async iterable of InlineButtonData objects or rows.
+    """
+
+    def __init__(self, iterable: AsyncIterable) -> None:
+        super().__init__()
+        self._iterator = iterable.__aiter__()
+        self._lock = None
+
+    async def has_index(self, index: int) -> bool:
+        """
+        :param index: non-negative index
+        :return: True if the iterable has at least index + 1 items
+        """
+        await self._fill(index + 1)
+        return index < len(self._consumed)
+
+    async def collect(self, slice_: slice = slice(None, None, None)) -> list:
+        """
+        :param slice_: items to collect
+        :return: items of the slice, checked against Telegram limits
+        """
+        bounds = self.forward_slice(slice_)
+        if bounds is None:
+            await self._fill(None)
+            items = self._consumed_slice(slice_)
+        else:
+            start, stop, step = bounds
+            streamed = StreamedSlice()
+            while (stop is None or start < stop) and await self.has_index(start):
+                streamed.append(self._consumed[start])
+                start += step
+            items = streamed.items
+
+        self.is_row_in_limits(items)
+        return items
+
+    async def _fill(self, count: Optional[int]) -> None:
+        """
+        Consume items until there are count of them, or all if count is None
+        :param count:
+        :return:
+        """
+        if self.exhausted or (count is not None and count <= len(self._consumed)):
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while not self.exhausted and (count is None or len(self._consumed) < count):
+                try:
+                    # anext() is available since Python 3.10 only
+                    # pylint: disable = C2801
+                    self._consumed.append(await self._iterator.__anext__())
+                except StopAsyncIteration:
+                    self.exhausted = True
+
+
+async def arender(
+    keyboa: Keyboa,
+    slice_: slice = slice(None, None, None),
+    *,
+    as_json: bool = False,
+    executor: Optional[Executor] = None,
+    threshold: int = OFFLOAD_THRESHOLD,
+) -> Union["InlineKeyboardMarkup", str]:
+    """
+    Small keyboards are rendered in place, since a round trip to an executor
+    costs more than the render itself. Larger ones and lazy sources
+    are rendered in the executor by a copy of the keyboard,
+    so concurrent renders of one instance do not share any state.
+    :param keyboa:
+    :param slice_: items to render
+    :param as_json: return serialized keyboard instead of InlineKeyboardMarkup
+    :param executor: thread or process pool. If not specified,
+        the default executor of the loop is used.
+    :param threshold: the maximum number of buttons rendered in place
+    :return:
+    """
+    items = keyboa.items
+    if not isinstance(items, ItemSource):
+        items = items[slice_]
+        buttons = sum(len(item) if isinstance(item, list) else 1 for item in items)
+        if buttons <= threshold:
+            return keyboa.slice(slice_, as_json=as_json)
+
+    loop = asyncio.get_running_loop()
+    options = {**keyboa.options, "cache_markup": False}
+    in_processes = isinstance(executor, ProcessPoolExecutor)
+    if in_processes:
+        options["button_cache"] = None
+    if isinstance(items, ItemSource):
+        # The source cannot be passed to other processes,
+        # so it is sliced in a thread of this one.
+        items = await loop.run_in_executor(
+            None if in_processes else executor, getitem, items, slice_
+        )
+        slice_ = slice(None)
+    elif in_processes:
+        slice_ = slice(None)
+    else:
+        items = keyboa.items
+
+    return await loop.run_in_executor(
+        executor, rendered, type(keyboa), items, options, slice_, as_json
+    )
+
+
+async def arender_source(
+    items: Union[AsyncIterable, AsyncItemSource],
+    slice_: slice = slice(None, None, None),
+    *,
+    as_json: bool = False,
+    executor: Optional[Executor] = None,
+    threshold: int = OFFLOAD_THRESHOLD,
+    **keyboa_options,
+) -> Union["InlineKeyboardMarkup", str]:
+    """
+    Collect only the items of the slice from an async iterable and render them.
+    Keep an AsyncItemSource to render further slices of the same iterable.
+    :param items: AsyncIterable or AsyncItemSource
+    :param slice_: items to render
+    :param as_json: return serialized keyboard instead of InlineKeyboardMarkup
+    :param executor: see arender()
+    :param threshold: see arender()
+    :param keyboa_options: keyword arguments for Keyboa
+    :return:
+    """
+    if not isinstance(items, AsyncItemSource):
+        items = AsyncItemSource(items)
+    keyboa = Keyboa(items=await items.collect(slice_), **keyboa_options)
+    return await arender(
+        keyboa, as_json=as_json, executor=executor, threshold=threshold
+    )
+
+
+def rendered(
+    keyboa_type, items, options: dict, slice_: slice, as_json: bool
+) -> Union["InlineKeyboardMarkup", str]:
+    """
+    Executor function
+    :param keyboa_type:
+    :param items:
+    :param options:
+    :param slice_:
+    :param as_json:
+    :return:
+    """
+    return keyboa_type(items=items, **options).slice(slice_, as_json=as_json)
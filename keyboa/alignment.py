@@ -0,0 +1,44 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains precomputed row layouts for auto alignment.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from keyboa.constants import MAXIMUM_ITEMS_IN_KEYBOARD
+
+
+class AlignmentPlanner:
+    """
+    For every alignment spec, the number of items in a row is calculated
+    once for all possible numbers of buttons, and the table is shared
+    between all keyboards with the same spec.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def table(alignment_range: Tuple[int, ...]) -> Tuple[Optional[int], ...]:
+        """
+        :param alignment_range: dividers in the order they should be tried
+        :return: the first divider of every number of items from 0 to
+            MAXIMUM_ITEMS_IN_KEYBOARD, or None if there is no such divider
+        """
+        return tuple(
+            next((divider for divider in alignment_range if not count % divider), None)
+            for count in range(MAXIMUM_ITEMS_IN_KEYBOARD + 1)
+        )
+
+    @classmethod
+    def items_in_row(
+        cls, alignment_range: Tuple[int, ...], count: int
+    ) -> Optional[int]:
+        """
+        :param alignment_range: dividers in the order they should be tried
+        :param count: the number of items
+        :return: the first divider of count or None
+        """
+        table = cls.table(alignment_range)
+        if count < len(table):
+            return table[count]
+        return next((divider for divider in alignment_range if not count % divider), None)
@@ -6,10 +6,26 @@ This module contains basic class with initial Keyboa data.
 
 from typing import Union, Iterable, Optional
 from keyboa.button import Button
+from keyboa.cache import LRUCache
+from keyboa.source import ItemSource
 from keyboa.base_check import BaseCheck
+from keyboa.fingerprint import canonical, canonical_option, combined, digest
+from keyboa.metrics import instrumented
 from keyboa.constants import (
     BlockItems,
     CallbackDataMarker,
+    CACHED_SLICES,
+)
+
+FINGERPRINTED = (
+    "items",
+    "items_in_row",
+    "front_marker",
+    "back_marker",
+    "copy_text_to_callback",
+    "alignment",
+    "alignment_reverse",
+    "row_width",
 )
 
 
@@ -18,7 +34,7 @@ class Base(BaseCheck):  # pylint: disable = R0902
     Base initial class for Keyboa
     """
 
-    def __init__(
+    def __init__(  # pylint: disable = R0913
         self,
         items: BlockItems,
         *,
@@ -28,7 +44,19 @@ class Base(BaseCheck):  # pylint: disable = R0902
         copy_text_to_callback: Optional[bool] = True,
         alignment: Union[bool, Iterable] = None,
         alignment_reverse: Optional[bool] = None,
+        row_width: Optional[int] = None,
+        button_cache: Optional[LRUCache] = None,
+        cache_markup: Optional[bool] = False,
     ) -> None:
+        self._paginators = {}
+        self._markups = {}
+        self._serialized_markups = {}
+        self._ir_cells = {}
+        self._irs = LRUCache(maxsize=CACHED_SLICES)
+        self._batch_renderer = None
+        self._digests = {}
+        self._fingerprint = None
+
         self._items = None
         self.items = items
 
@@ -50,24 +78,44 @@ class Base(BaseCheck):  # pylint: disable = R0902
         self._alignment_reverse = None
         self.alignment_reverse = alignment_reverse
 
-        self._items_sliced = None
+        self._row_width = None
+        self.row_width = row_width
+
+        self._button_cache = None
+        self.button_cache = button_cache
+
+        self._cache_markup = False
+        self.cache_markup = cache_markup
 
     @property
-    def items(self) -> BlockItems:
+    def items(self) -> Union[BlockItems, ItemSource]:
         return self._items
 
     @items.setter
     def items(self, items_value) -> None:
         if items_value is None or not items_value:
             raise ValueError("Items should not be None")
+        if self.is_lazy_items(items_value):
+            self._items = (
+                items_value
+                if isinstance(items_value, ItemSource)
+                else ItemSource(items_value)
+            )
+            self._invalidate("items")
+            return
         if not isinstance(items_value, list):
             items_value = [
                 items_value,
             ]
 
+        self._verify_items(items_value)
+        self._items = items_value
+        self._invalidate("items")
+
+    @instrumented("validation")
+    def _verify_items(self, items_value: list) -> None:
         self.is_all_items_in_limits(items_value)
         self.is_row_in_limits(items_value)
-        self._items = items_value
 
     @property
     def items_in_row(self) -> int:
@@ -77,6 +125,7 @@ class Base(BaseCheck):  # pylint: disable = R0902
     def items_in_row(self, items_in_row_value) -> None:
         self.is_items_in_row_limits(items_in_row_value)
         self._items_in_row = items_in_row_value
+        self._invalidate("items_in_row")
 
     @property
     def front_marker(self) -> CallbackDataMarker:
@@ -86,6 +135,7 @@ class Base(BaseCheck):  # pylint: disable = R0902
     def front_marker(self, front_marker_value) -> None:
         Button.get_checked_marker(front_marker_value)
         self._front_marker = front_marker_value
+        self._invalidate("front_marker")
 
     @property
     def back_marker(self) -> CallbackDataMarker:
@@ -95,6 +145,7 @@ class Base(BaseCheck):  # pylint: disable = R0902
     def back_marker(self, back_marker_value) -> None:
         Button.get_checked_marker(back_marker_value)
         self._back_marker = back_marker_value
+        self._invalidate("back_marker")
 
     @property
     def copy_text_to_callback(self) -> bool:
@@ -107,6 +158,7 @@ class Base(BaseCheck):  # pylint: disable = R0902
                 "'copy_text_to_callback' should have only bool or none type"
             )
         self._copy_text_to_callback = copy_text_to_callback_value
+        self._invalidate("copy_text_to_callback")
 
     @property
     def alignment(self) -> Union[bool, Iterable]:
@@ -115,12 +167,11 @@ class Base(BaseCheck):  # pylint: disable = R0902
 
     @alignment.setter
     def alignment(self, alignment_value) -> None:
-        if alignment_value is None or isinstance(alignment_value, bool):
-            self._alignment = alignment_value
-            return
-        self.is_alignment_iterable(alignment_value)
-        self.is_alignment_in_limits(alignment_value)
+        if not (alignment_value is None or isinstance(alignment_value, bool)):
+            self.is_alignment_iterable(alignment_value)
+            self.is_alignment_in_limits(alignment_value)
         self._alignment = alignment_value
+        self._invalidate("alignment")
 
     @property
     def alignment_reverse(self) -> bool:
@@ -129,3 +180,90 @@ class Base(BaseCheck):  # pylint: disable = R0902
     @alignment_reverse.setter
     def alignment_reverse(self, alignment_reverse_value) -> None:
         self._alignment_reverse = alignment_reverse_value
+        self._invalidate("alignment_reverse")
+
+    @property
+    def row_width(self) -> Optional[int]:
+        return self._row_width
+
+    @row_width.setter
+    def row_width(self, row_width_value) -> None:
+        self.is_row_width_valid(row_width_value)
+        self._row_width = row_width_value
+        self._invalidate("row_width")
+
+    @property
+    def button_cache(self) -> Optional[LRUCache]:
+        return self._button_cache
+
+    @button_cache.setter
+    def button_cache(self, button_cache_value) -> None:
+        if not isinstance(button_cache_value, (LRUCache, type(None))):
+            raise TypeError("'button_cache' should have only LRUCache or none type")
+        self._button_cache = button_cache_value
+
+    @property
+    def cache_markup(self) -> bool:
+        return self._cache_markup
+
+    @cache_markup.setter
+    def cache_markup(self, cache_markup_value) -> None:
+        if not isinstance(cache_markup_value, (bool, type(None))):
+            raise TypeError("'cache_markup' should have only bool or none type")
+        self._cache_markup = cache_markup_value
+        self._invalidate("cache_markup")
+
+    @property
+    def options(self) -> dict:
+        """
+        Keyword arguments of the current instance, except items
+        :return:
+        """
+        return {
+            "items_in_row": self.items_in_row,
+            "front_marker": self.front_marker,
+            "back_marker": self.back_marker,
+            "copy_text_to_callback": self.copy_text_to_callback,
+            "alignment": self.alignment,
+            "alignment_reverse": self.alignment_reverse,
+            "row_width": self.row_width,
+            "button_cache": self.button_cache,
+            "cache_markup": self.cache_markup,
+        }
+
+    def fingerprint(self) -> str:
+        """
+        Stable hash of items and all options that affect the rendered keyboard.
+        Every part is hashed once after its attribute is set, so repeated calls
+        cost nothing. Changes of items made in place are not tracked,
+        assign the items again instead.
+        :return: hex digest, equal for equal keyboards in every process
+        """
+        if self._fingerprint is None:
+            if isinstance(self.items, ItemSource):
+                raise TypeError("Keyboards with lazy items cannot be fingerprinted.")
+            for attribute in FINGERPRINTED:
+                if attribute not in self._digests:
+                    self._digests[attribute] = digest(
+                        getattr(self, attribute),
+                        canonical if attribute == "items" else canonical_option,
+                    )
+            self._fingerprint = combined(
+                self._digests[attribute] for attribute in FINGERPRINTED
+            )
+        return self._fingerprint
+
+    def _invalidate(self, attribute: Optional[str] = None) -> None:
+        """
+        Drop everything that was rendered with the previous attribute values
+        :param attribute: the changed attribute
+        :return:
+        """
+        self._digests.pop(attribute, None)
+        self._fingerprint = None
+        self._paginators = {}
+        self._markups = {}
+        self._serialized_markups = {}
+        self._ir_cells = {}
+        self._irs = LRUCache(maxsize=CACHED_SLICES)
+        self._batch_renderer = None
@@ -6,8 +6,7 @@ This module contains all checks for Keyboa Base class parameters
 
 from typing import Iterable
 
-from telebot.types import InlineKeyboardMarkup
-
+from keyboa.lazy_types import is_button, is_markup
 from keyboa.constants import (
     MAXIMUM_ITEMS_IN_KEYBOARD,
     MINIMUM_ITEMS_IN_LINE,
@@ -21,10 +20,27 @@ class BaseCheck:
     """
 
     @staticmethod
-    def is_all_items_in_limits(items) -> None:
+    def is_lazy_items(items) -> bool:
+        """
+        :param items:
+        :return: True for iterables which are neither a list nor InlineButtonData,
+            e.g. generators, ranges or database cursors
+        """
+        return (
+            isinstance(items, Iterable)
+            and not isinstance(items, (list, str, tuple, dict))
+            and not is_button(items)
+        )
+
+    @classmethod
+    def is_all_items_in_limits(cls, items) -> None:
         items_in_keyboard = sum(
             len(row) if isinstance(row, list) else 1 for row in items
         )
+        cls.is_keyboard_size_in_limits(items_in_keyboard)
+
+    @staticmethod
+    def is_keyboard_size_in_limits(items_in_keyboard: int) -> None:
         if items_in_keyboard > MAXIMUM_ITEMS_IN_KEYBOARD:
             value_error_message_keyboard = (
                 "Telegram Bot API limit exceeded: The keyboard should have "
@@ -89,9 +105,26 @@ class BaseCheck:
             )
             raise TypeError(type_error_message)
 
+    @staticmethod
+    def is_row_width_valid(row_width) -> None:
+        """
+        :param row_width:
+        :return:
+        """
+        if row_width is None:
+            return
+        if isinstance(row_width, bool) or not isinstance(row_width, int):
+            raise TypeError(
+                f"Row width cannot be {type(row_width)}. Only int or None allowed."
+            )
+        if row_width < 1:
+            raise ValueError(
+                f"Row width should be a positive number. You entered {row_width}."
+            )
+
     @staticmethod
     def is_keyboard_proper_type(keyboard) -> None:
-        if keyboard and not isinstance(keyboard, InlineKeyboardMarkup):
+        if keyboard and not is_markup(keyboard):
             type_error_message = (
                 "Keyboard to which the new items will be added "
                 f"should have InlineKeyboardMarkup type. Now it is a {type(keyboard)}"
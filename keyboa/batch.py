@@ -0,0 +1,203 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains batch rendering of one keyboard
+with different markers or items.
+"""
+
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
+
+from keyboa.button import Button, ButtonSpec
+from keyboa.serializer import Serializer
+from keyboa.constants import MAXIMUM_CBD_LENGTH
+from keyboa.lazy_types import inline_button, inline_markup, is_button
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup
+
+VARIANT_KEYS = ("items", "front_marker", "back_marker")
+
+
+class BatchRenderer:
+    """
+    Items of the keyboard are laid out and validated once,
+    so a variant with other markers costs only marker checks
+    and string concatenation for every button.
+    Variants with other items are validated as a new Keyboa.
+
+    :keyboa: Keyboa - the keyboard which attributes are used by default.
+    """
+
+    def __init__(self, keyboa) -> None:
+        self.keyboa = keyboa
+        self._rows: List[List[ButtonSpec]] = [
+            [self._prepared(item) for item in row] for row in keyboa.layout(slice(None))
+        ]
+        raw_callbacks = [
+            spec.callback_data
+            for row in self._rows
+            for spec in row
+            if spec.button is None
+        ]
+        self._raw_bytes = max((len(raw.encode()) for raw in raw_callbacks), default=0)
+        self._has_empty_raw = not all(raw_callbacks)
+
+    def _prepared(self, item) -> ButtonSpec:
+        """
+        :param item:
+        :return: spec with callback data without markers
+        """
+        if is_button(item) or (isinstance(item, dict) and item.get("text")):
+            return ButtonSpec.from_data(item)
+        text, raw_callback = Button.prepare_raw(item, self.keyboa.copy_text_to_callback)
+        return ButtonSpec(text, str(raw_callback))
+
+    def render(
+        self, variant: dict, as_json: bool = False
+    ) -> Union["InlineKeyboardMarkup", str]:
+        """
+        :param variant: dictionary with new values of "items", "front_marker"
+            or "back_marker". Missing values are taken from the keyboard.
+        :param as_json: return serialized keyboard instead of InlineKeyboardMarkup
+        :return:
+        """
+        unknown = set(variant) - set(VARIANT_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Only {VARIANT_KEYS} can be changed in a variant. "
+                f"You passed {sorted(unknown)}."
+            )
+
+        if "items" in variant:
+            keyboa = type(self.keyboa)(**{**self.keyboa.options, **variant})
+            return keyboa.to_json() if as_json else keyboa.keyboard
+
+        front_marker = str(
+            Button.get_checked_marker(
+                variant.get("front_marker", self.keyboa.front_marker)
+            )
+        )
+        back_marker = str(
+            Button.get_checked_marker(
+                variant.get("back_marker", self.keyboa.back_marker)
+            )
+        )
+        self._is_callback_data_in_limits(front_marker, back_marker)
+
+        if as_json:
+            return Serializer.keyboard(
+                [
+                    (
+                        spec.to_json()
+                        if spec.button is not None
+                        else Serializer.button(
+                            spec.text, front_marker + spec.callback_data + back_marker
+                        )
+                    )
+                    for spec in row
+                ]
+                for row in self._rows
+            )
+
+        keyboard = inline_markup()
+        for row in self._rows:
+            keyboard.row(
+                *[
+                    (
+                        inline_button(
+                            text=spec.text,
+                            callback_data=front_marker
+                            + spec.callback_data
+                            + back_marker,
+                        )
+                        if spec.button is None
+                        else spec.button
+                    )
+                    for spec in row
+                ]
+            )
+        return keyboard
+
+    def _is_callback_data_in_limits(self, front_marker: str, back_marker: str) -> None:
+        """
+        The same checks as Button.get_callback_data does, but for all buttons at once
+        :param front_marker:
+        :param back_marker:
+        :return:
+        """
+        if self._has_empty_raw and not front_marker and not back_marker:
+            raise ValueError("The callback data cannot be empty.")
+
+        longest = (
+            self._raw_bytes + len(front_marker.encode()) + len(back_marker.encode())
+        )
+        if longest > MAXIMUM_CBD_LENGTH:
+            size_error_message = (
+                "The callback data cannot be more than "
+                f"{MAXIMUM_CBD_LENGTH} bytes for one button. Your size is {longest}"
+            )
+            raise ValueError(size_error_message)
+
+    def render_many(
+        self,
+        variants: Iterable[dict],
+        as_json: bool = False,
+        processes: Optional[int] = None,
+        chunksize: int = 100,
+    ) -> Iterator[Union["InlineKeyboardMarkup", str]]:
+        """
+        :param variants: see render()
+        :param as_json: return serialized keyboards instead of InlineKeyboardMarkup
+        :param processes: the number of worker processes. If not specified,
+            variants are rendered one by one in the current process.
+        :param chunksize: the number of variants sent to a worker process at once
+        :return: keyboards in the order of variants
+        """
+        if not processes:
+            return (self.render(variant, as_json) for variant in variants)
+        return self._rendered_in_processes(variants, as_json, processes, chunksize)
+
+    def _rendered_in_processes(
+        self, variants: Iterable[dict], as_json: bool, processes: int, chunksize: int
+    ) -> Iterator[Union["InlineKeyboardMarkup", str]]:
+        """
+        Only a few chunks per process are submitted in advance,
+        so variants are consumed lazily as well.
+        """
+        # pylint: disable = C0415
+        from concurrent.futures import ProcessPoolExecutor
+
+        keyboa_type = type(self.keyboa)
+        items = self.keyboa.items[:]
+        options = {**self.keyboa.options, "button_cache": None, "cache_markup": False}
+        variants = iter(variants)
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = deque()
+            for chunk in iter(lambda: list(islice(variants, chunksize)), []):
+                pending.append(
+                    executor.submit(
+                        rendered_chunk, keyboa_type, items, options, chunk, as_json
+                    )
+                )
+                if len(pending) > 2 * processes:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+def rendered_chunk(
+    keyboa_type, items, options: dict, variants: list, as_json: bool
+) -> list:
+    """
+    Worker function for process pool
+    :param keyboa_type:
+    :param items:
+    :param options:
+    :param variants:
+    :param as_json:
+    :return:
+    """
+    renderer = BatchRenderer(keyboa_type(items=items, **options))
+    return list(renderer.render_many(variants, as_json))
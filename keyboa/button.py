@@ -4,9 +4,13 @@ This module contains all the necessary functions for
 creating buttons for telegram inline keyboards.
 """
 from dataclasses import dataclass
-from typing import Optional
-from telebot.types import InlineKeyboardButton
+from typing import TYPE_CHECKING, Optional, Tuple
 from keyboa.button_check import ButtonCheck
+from keyboa.cache import LRUCache
+from keyboa.frozen import Frozen
+from keyboa.lazy_types import inline_button, is_button
+from keyboa.metrics import instrumented
+from keyboa.serializer import Serializer
 from keyboa.constants import (
     InlineButtonData,
     CallbackDataMarker,
@@ -15,6 +19,11 @@ from keyboa.constants import (
     ButtonText,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardButton
+
+INTERNED_SPECS = LRUCache(maxsize=65536)
+
 
 @dataclass
 class Button(ButtonCheck):
@@ -49,7 +58,7 @@ class Button(ButtonCheck):
     def __call__(self, *args, **kwargs):
         return self.generate()
 
-    def generate(self) -> InlineKeyboardButton:
+    def generate(self) -> "InlineKeyboardButton":
         """
         This function creates an InlineKeyboardButton object from various data types,
         such as str, int, tuple, dict.
@@ -57,25 +66,70 @@ class Button(ButtonCheck):
 
         Covered by tests.
         """
+        self.is_auto_copy_text_to_callback()
+        return build_button(
+            self.button_data,
+            self.front_marker,
+            self.back_marker,
+            self.copy_text_to_callback,
+        )
 
-        if isinstance(self.button_data, InlineKeyboardButton):
-            return self.button_data
-
-        if isinstance(self.button_data, dict) and self.button_data.get("text"):
-            return InlineKeyboardButton(**self.button_data)
-
+    @property
+    def prepared_button(self) -> dict:
+        """
+        Verified text and callback data of the button
+        without creating an InlineKeyboardButton object.
+        Not applicable to InlineKeyboardButton and dictionaries with "text" key.
+        :return: dict with "text" and "callback_data" keys
+        """
         self.is_auto_copy_text_to_callback()
 
-        button_tuple = self._verified_button_tuple
-        text = self.get_text(button_tuple)
-        raw_callback = self.get_callback(button_tuple)
-        callback_data = self.get_callback_data(
-            raw_callback, self.front_marker, self.back_marker
+        text, callback_data = self.prepare(
+            self.button_data,
+            self.front_marker,
+            self.back_marker,
+            self.copy_text_to_callback,
         )
 
-        prepared_button = {"text": text, "callback_data": callback_data}
+        return {"text": text, "callback_data": callback_data}
+
+    @classmethod
+    def prepare(
+        cls,
+        button_data: InlineButtonData,
+        front_marker: CallbackDataMarker = str(),
+        back_marker: CallbackDataMarker = str(),
+        copy_text_to_callback: Optional[bool] = None,
+    ) -> Tuple[str, str]:
+        """
+        The same as prepared_button, but without creating a Button object.
+        :param button_data:
+        :param front_marker:
+        :param back_marker:
+        :param copy_text_to_callback:
+        :return: verified text and callback data
+        """
+        text, raw_callback = cls.prepare_raw(button_data, copy_text_to_callback)
+        callback_data = cls.get_callback_data(raw_callback, front_marker, back_marker)
+
+        return text, callback_data
+
+    @classmethod
+    def prepare_raw(
+        cls,
+        button_data: InlineButtonData,
+        copy_text_to_callback: Optional[bool] = None,
+    ) -> Tuple[str, CallbackDataMarker]:
+        """
+        :param button_data:
+        :param copy_text_to_callback:
+        :return: verified text and callback without markers, which may be empty
+        """
+        if copy_text_to_callback is None and isinstance(button_data, (str, int)):
+            copy_text_to_callback = True
 
-        return InlineKeyboardButton(**prepared_button)
+        button_tuple = cls._verified_button_tuple(button_data, copy_text_to_callback)
+        return cls.get_text(button_tuple), cls.get_callback(button_tuple)
 
     @property
     def button(self):
@@ -171,42 +225,182 @@ class Button(ButtonCheck):
             raise ValueError("Button text cannot be empty.")
         return text
 
-    @property
-    def _verified_button_tuple(self) -> tuple:
+    @classmethod
+    def _verified_button_tuple(
+        cls, button_data: InlineButtonData, copy_text_to_callback: Optional[bool]
+    ) -> tuple:
         """
+        :param button_data:
+        :param copy_text_to_callback:
         :return:
         """
-        self.is_button_data_proper_type(self.button_data)
+        cls.is_button_data_proper_type(button_data)
 
-        btn_tuple = self._raw_tuple_from_button_data
+        btn_tuple = cls._raw_tuple_from_button_data(button_data, copy_text_to_callback)
 
         if len(btn_tuple) == 1 or btn_tuple[1] is None:
             btn_tuple = (
                 btn_tuple[0],
-                btn_tuple[0] if self.copy_text_to_callback else str(),
+                btn_tuple[0] if copy_text_to_callback else str(),
             )
         return btn_tuple
 
-    @property
-    def _raw_tuple_from_button_data(self) -> tuple:
+    @staticmethod
+    def _raw_tuple_from_button_data(
+        button_data: InlineButtonData, copy_text_to_callback: Optional[bool]
+    ) -> tuple:
         """
+        :param button_data:
+        :param copy_text_to_callback:
         :return:
         """
-        if isinstance(self.button_data, (str, int)):
+        if isinstance(button_data, (str, int)):
             btn_tuple = (
-                self.button_data,
-                self.button_data if self.copy_text_to_callback else str(),
+                button_data,
+                button_data if copy_text_to_callback else str(),
             )
 
-        elif isinstance(self.button_data, dict):
-            if len(self.button_data.keys()) != 1:
+        elif isinstance(button_data, dict):
+            if len(button_data.keys()) != 1:
                 value_type_error = (
                     "Cannot convert dictionary to InlineButtonData object. "
                     "You passed more than one item, but did not add 'text' key."
                 )
                 raise ValueError(value_type_error)
 
-            btn_tuple = next(iter(self.button_data.items()))
+            btn_tuple = next(iter(button_data.items()))
         else:
-            btn_tuple = self.button_data
+            btn_tuple = button_data
         return btn_tuple
+
+
+@instrumented("button")
+def build_button(
+    button_data: InlineButtonData,
+    front_marker: CallbackDataMarker = str(),
+    back_marker: CallbackDataMarker = str(),
+    copy_text_to_callback: Optional[bool] = None,
+) -> "InlineKeyboardButton":
+    """
+    The same as Button(...).generate(), but without creating a Button object.
+    :param button_data:
+    :param front_marker:
+    :param back_marker:
+    :param copy_text_to_callback:
+    :return: InlineKeyboardButton
+    """
+    if is_button(button_data):
+        return button_data
+
+    if isinstance(button_data, dict) and button_data.get("text"):
+        return inline_button(**button_data)
+
+    text, callback_data = Button.prepare(
+        button_data, front_marker, back_marker, copy_text_to_callback
+    )
+    return inline_button(text=text, callback_data=callback_data)
+
+
+class ButtonSpec(Frozen):
+    """Immutable verified button data
+    :text: str - button text.
+    :callback_data: str - callback data with markers.
+    :button: InlineKeyboardButton - a ready button for items that Keyboa
+        passes to telebot as is, i.e. InlineKeyboardButton objects and
+        dictionaries with "text" key. None for all other items.
+    """
+
+    __slots__ = ("text", "callback_data", "button")
+
+    def __init__(
+        self,
+        text: str,
+        callback_data: Optional[str] = None,
+        button: Optional["InlineKeyboardButton"] = None,
+    ) -> None:
+        self.text = text
+        self.callback_data = callback_data
+        self.button = button
+        self._freeze()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(text={self.text!r}, "
+            f"callback_data={self.callback_data!r})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ButtonSpec):
+            return NotImplemented
+        return (self.text, self.callback_data, self.button) == (
+            other.text,
+            other.callback_data,
+            other.button,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.text, self.callback_data, id(self.button)))
+
+    @classmethod
+    def from_data(
+        cls,
+        button_data: InlineButtonData,
+        front_marker: CallbackDataMarker = str(),
+        back_marker: CallbackDataMarker = str(),
+        copy_text_to_callback: Optional[bool] = None,
+    ) -> "ButtonSpec":
+        """
+        :param button_data: the same data as for Button
+        :param front_marker:
+        :param back_marker:
+        :param copy_text_to_callback:
+        :return: ButtonSpec
+        """
+        if is_button(button_data) or (
+            isinstance(button_data, dict) and button_data.get("text")
+        ):
+            button = build_button(button_data)
+            return cls(button.text, button.callback_data, button)
+
+        return cls.interned(
+            *Button.prepare(button_data, front_marker, back_marker, copy_text_to_callback)
+        )
+
+    @classmethod
+    def interned(cls, text: str, callback_data: str) -> "ButtonSpec":
+        """
+        Equal buttons of all keyboards are the same object,
+        so keyboards with common buttons share them.
+        :param text:
+        :param callback_data:
+        :return: ButtonSpec without a ready button
+        """
+        key = (cls, text, callback_data)
+        spec = INTERNED_SPECS.get(key)
+        if spec is None:
+            spec = INTERNED_SPECS[key] = cls(text, callback_data)
+        return spec
+
+    def to_button(self) -> "InlineKeyboardButton":
+        """
+        :return: InlineKeyboardButton
+        """
+        if self.button is not None:
+            return self.button
+        return inline_button(text=self.text, callback_data=self.callback_data)
+
+    def to_dict(self) -> dict:
+        """
+        :return: the same as InlineKeyboardButton.to_dict()
+        """
+        if self.button is not None:
+            return self.button.to_dict()
+        return {"text": self.text, "callback_data": self.callback_data}
+
+    def to_json(self) -> str:
+        """
+        :return: the same as InlineKeyboardButton.to_json()
+        """
+        if self.button is not None:
+            return self.button.to_json()
+        return Serializer.button(self.text, self.callback_data)
@@ -5,7 +5,6 @@ This module contains all checks for Keyboa Button class parameters
 # pylint: disable = C0116
 
 from keyboa.constants import (
-    InlineKeyboardButton,
     InlineButtonData,
     callback_data_types,
     MAXIMUM_CBD_LENGTH,
@@ -21,7 +20,7 @@ class ButtonCheck:
     def is_button_data_proper_type(button_data) -> None:
         if not isinstance(button_data, (tuple, dict, str, int)):
             type_error_message = (
-                f"Cannot create {InlineKeyboardButton} from {type(button_data)}. "
+                f"Cannot create InlineKeyboardButton from {type(button_data)}. "
                 f"Please use {InlineButtonData} instead.\n"
                 "Probably you specified 'auto_alignment' or 'items_in_line' "
                 "parameter for StructuredSequence."
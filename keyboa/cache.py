@@ -0,0 +1,83 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a bounded cache for rendered keyboard parts.
+"""
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Any, Hashable
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class LRUCache:
+    """
+    Thread-safe cache with a limited number of entries.
+    When the cache is full, the least recently used entry is evicted.
+
+    :maxsize: int - the maximum number of entries. The default value is 1024.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(
+                f"Cache size should be a positive integer. You entered {maxsize}."
+            )
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        :param key:
+        :param default: value returned if there is no such key
+        :return:
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset statistics
+        :return:
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def info(self) -> CacheInfo:
+        """
+        :return: hits, misses, evictions, maxsize and current size of the cache
+        """
+        return CacheInfo(
+            self._hits, self._misses, self._evictions, self.maxsize, len(self._data)
+        )
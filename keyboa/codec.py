@@ -0,0 +1,283 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a compact codec for key=value callback chains
+and side-table stores that replace long payloads with short tokens.
+"""
+
+from abc import ABC, abstractmethod
+from base64 import b64decode, urlsafe_b64encode
+from hashlib import blake2b
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from keyboa.cache import LRUCache
+from keyboa.constants import MAXIMUM_CBD_LENGTH
+from keyboa.sqlite import SqliteDatabase
+
+CallbackValue = Union[str, int]
+CallbackPairs = Union[Dict[str, CallbackValue], Iterable[Tuple[str, CallbackValue]]]
+
+ENCODED_PREFIX = "~"
+TOKEN_PREFIX = "!"
+TOKEN_DIGEST_SIZE = 9
+
+
+class CallbackStore(ABC):
+    """
+    Base class for side-table stores.
+    Tokens are derived from payloads, so equal payloads get equal tokens
+    in every process that uses the same store.
+    """
+
+    @staticmethod
+    def token(payload: str) -> str:
+        """
+        :param payload:
+        :return: 12 characters of URL-safe base64
+        """
+        digest = blake2b(payload.encode(), digest_size=TOKEN_DIGEST_SIZE).digest()
+        return urlsafe_b64encode(digest).decode()
+
+    @abstractmethod
+    def put(self, payload: str) -> str:
+        """
+        :param payload:
+        :return: token for the payload
+        """
+
+    @abstractmethod
+    def get(self, token: str) -> Optional[str]:
+        """
+        :param token:
+        :return: payload or None if the token is unknown or evicted
+        """
+
+
+class MemoryCallbackStore(CallbackStore):
+    """
+    Store for a single process with a limited number of payloads.
+
+    :maxsize: int - the maximum number of payloads. The default value is 65536.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        self.cache = LRUCache(maxsize=maxsize)
+
+    def put(self, payload: str) -> str:
+        token = self.token(payload)
+        self.cache[token] = payload
+        return token
+
+    def get(self, token: str) -> Optional[str]:
+        return self.cache.get(token)
+
+
+class SqliteCallbackStore(SqliteDatabase, CallbackStore):
+    """
+    Store in a local SQLite file, which can be shared by several
+    worker processes and survives restarts.
+
+    :path: str - path to the database file.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS callbacks "
+        "(token TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+    )
+
+    def put(self, payload: str) -> str:
+        token = self.token(payload)
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO callbacks (token, payload) VALUES (?, ?)",
+                (token, payload),
+            )
+        return token
+
+    def get(self, token: str) -> Optional[str]:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT payload FROM callbacks WHERE token = ?", (token,)
+            ).fetchone()
+        return row[0] if row else None
+
+
+class CallbackCodec:
+    """
+    Encodes key=value pairs into a compact callback data string and back.
+
+    Pairs are packed into bytes, where every key, string and integer
+    takes a varint header, and then into URL-safe base64 without padding.
+    Keys listed in keys take one byte instead of their text.
+
+    :keys: Iterable[str] - frequently used keys. Every service that decodes
+        the data should use the same keys in the same order.
+
+    :store: CallbackStore - optional side table. If it is specified,
+        data longer than limit is replaced with a short token.
+
+    :limit: int - the maximum size of data in bytes. The default value is 64.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str] = (),
+        *,
+        store: Optional[CallbackStore] = None,
+        limit: int = MAXIMUM_CBD_LENGTH,
+    ) -> None:
+        self.keys = tuple(keys)
+        self._key_indexes = {key: index for index, key in enumerate(self.keys)}
+        self.store = store
+        self.limit = limit
+
+    def encode(self, pairs: CallbackPairs) -> str:
+        """
+        :param pairs: dictionary or sequence of (key, value) pairs,
+            where values are str or int
+        :return: callback data
+        """
+        data = ENCODED_PREFIX + self._packed(pairs)
+        if len(data) <= self.limit:
+            return data
+
+        if self.store is None:
+            size_error_message = (
+                f"The encoded callback data cannot be more than {self.limit} bytes. "
+                f"Your size is {len(data)}. Use a store to replace it with a token."
+            )
+            raise ValueError(size_error_message)
+        return TOKEN_PREFIX + self.store.put(data)
+
+    def decode(self, data: str) -> Dict[str, CallbackValue]:
+        """
+        :param data: callback data made by encode()
+        :return: dictionary of pairs in the original order
+        """
+        if data.startswith(TOKEN_PREFIX):
+            if self.store is None:
+                raise ValueError("Cannot decode a token without a store.")
+            payload = self.store.get(data[len(TOKEN_PREFIX) :])
+            if payload is None:
+                raise ValueError(f"Token {data} is unknown or expired.")
+            data = payload
+
+        if not data.startswith(ENCODED_PREFIX):
+            raise ValueError(f"Data {data!r} is not encoded by CallbackCodec.")
+        try:
+            return self._unpacked(data[len(ENCODED_PREFIX) :])
+        except (IndexError, ValueError) as error:
+            raise ValueError(f"Data {data!r} is corrupted.") from error
+
+    def extend(self, data: str, pairs: CallbackPairs) -> str:
+        """
+        Add pairs to the previously encoded data, e.g. to pass
+        the received callback to the next step as a back marker does.
+        :param data:
+        :param pairs:
+        :return: callback data
+        """
+        decoded = self.decode(data)
+        decoded.update(pairs)
+        return self.encode(decoded)
+
+    def _packed(self, pairs: CallbackPairs) -> str:
+        """
+        :param pairs:
+        :return:
+        """
+        packed = bytearray()
+        for key, value in pairs.items() if isinstance(pairs, dict) else pairs:
+            if not isinstance(key, str):
+                raise TypeError(f"Key cannot be {type(key)}. Only str allowed.")
+
+            index = self._key_indexes.get(key)
+            if index is None:
+                self._pack_string(packed, key)
+            else:
+                self._pack_varint(packed, index << 1)
+
+            if isinstance(value, bool) or not isinstance(value, (str, int)):
+                raise TypeError(
+                    f"Value cannot be {type(value)}. Only str or int allowed."
+                )
+            if isinstance(value, str):
+                self._pack_string(packed, value)
+            else:
+                zigzag = value << 1 if value >= 0 else (-value << 1) - 1
+                self._pack_varint(packed, zigzag << 1)
+
+        return urlsafe_b64encode(bytes(packed)).rstrip(b"=").decode()
+
+    def _unpacked(self, data: str) -> Dict[str, CallbackValue]:
+        """
+        :param data:
+        :return:
+        """
+        packed = b64decode(data + "=" * (-len(data) % 4), altchars=b"-_", validate=True)
+        pairs = {}
+        position = 0
+        while position < len(packed):
+            header, position = self._unpack_varint(packed, position)
+            if header & 1:
+                key, position = self._unpack_string(packed, position, header >> 1)
+            else:
+                key = self.keys[header >> 1]
+
+            header, position = self._unpack_varint(packed, position)
+            if header & 1:
+                pairs[key], position = self._unpack_string(
+                    packed, position, header >> 1
+                )
+            else:
+                zigzag = header >> 1
+                pairs[key] = zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+        return pairs
+
+    @classmethod
+    def _pack_string(cls, packed: bytearray, value: str) -> None:
+        """
+        :param packed:
+        :param value:
+        :return:
+        """
+        encoded = value.encode()
+        cls._pack_varint(packed, len(encoded) << 1 | 1)
+        packed += encoded
+
+    @staticmethod
+    def _pack_varint(packed: bytearray, value: int) -> None:
+        """
+        :param packed:
+        :param value:
+        :return:
+        """
+        while value > 0x7F:
+            packed.append(value & 0x7F | 0x80)
+            value >>= 7
+        packed.append(value)
+
+    @staticmethod
+    def _unpack_varint(packed: bytes, position: int) -> Tuple[int, int]:
+        """
+        :param packed:
+        :param position:
+        :return: value and the next position
+        """
+        value = shift = 0
+        while True:
+            byte = packed[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, position
+            shift += 7
+
+    @staticmethod
+    def _unpack_string(packed: bytes, position: int, length: int) -> Tuple[str, int]:
+        """
+        :param packed:
+        :param position:
+        :param length:
+        :return: value and the next position
+        """
+        return packed[position : position + length].decode(), position + length
@@ -0,0 +1,189 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains frozen keyboards which are validated once
+and rendered without any checks.
+"""
+
+from typing import TYPE_CHECKING, Optional, Union
+
+
+from keyboa.button import ButtonSpec
+from keyboa.cache import LRUCache
+from keyboa.constants import CACHED_SLICES
+from keyboa.frozen import Frozen
+from keyboa.ir import KeyboardIR, Rows
+from keyboa.keyboard import Keyboa
+from keyboa.renderers import Renderer, get_renderer
+from keyboa.serializer import Serializer
+from keyboa.lazy_types import inline_markup
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup
+
+LAYOUT_OPTIONS = ("items_in_row", "alignment", "alignment_reverse", "row_width")
+FLAT_LAYOUT_OPTIONS = ("items_in_row", "alignment", "row_width")
+
+
+class CompiledKeyboa(Frozen):
+    """
+    Result of Keyboa.compile() for static menus.
+    Every button is validated and prepared when the keyboard is compiled,
+    so renders only lay out ready buttons and skip all BaseCheck and Button checks.
+    The keyboard cannot be changed, compile a new one instead.
+
+    :debug: bool - class-wide default for the debug flag of new keyboards.
+        In debug mode every render is made by a regular Keyboa with all checks,
+        which is useful in tests.
+    """
+
+    debug = False
+
+    __slots__ = ("_items", "_options", "_layout", "_debug", "_irs")
+
+    def __init__(self, keyboa: Keyboa, debug: Optional[bool] = None) -> None:
+        items = keyboa.items[:]
+        items = [item[:] if isinstance(item, list) else item for item in items]
+        options = {**keyboa.options, "button_cache": None, "cache_markup": False}
+
+        if any(options[option] for option in FLAT_LAYOUT_OPTIONS):
+            cells = [self._spec(item, keyboa) for item in items]
+        else:
+            cells = [
+                [self._spec(element, keyboa) for element in item]
+                if isinstance(item, list)
+                else self._spec(item, keyboa)
+                for item in items
+            ]
+        layout = Keyboa(
+            items=cells, **{option: options[option] for option in LAYOUT_OPTIONS}
+        )
+        layout.layout(slice(None))
+
+        self._items = items
+        self._options = options
+        self._layout = layout
+        self._debug = debug
+        self._irs = LRUCache(maxsize=CACHED_SLICES)
+        self._freeze()
+
+    @staticmethod
+    def _spec(item, keyboa: Keyboa) -> ButtonSpec:
+        """
+        :param item:
+        :param keyboa:
+        :return:
+        """
+        return ButtonSpec.from_data(
+            item, keyboa.front_marker, keyboa.back_marker, keyboa.copy_text_to_callback
+        )
+
+    @property
+    def is_debug(self) -> bool:
+        """
+        :return: True if renders are checked
+        """
+        return self.debug if self._debug is None else self._debug
+
+    def _checked(self) -> Keyboa:
+        """
+        :return: a regular keyboard with the same items and options
+        """
+        items = [item[:] if isinstance(item, list) else item for item in self._items]
+        return Keyboa(items=items, **self._options)
+
+    def ir(self, slice_: slice = slice(None, None, None)) -> KeyboardIR:
+        """
+        The same as Keyboa.ir(). Buttons cannot be changed,
+        so the last slices are always kept.
+        :param slice_: items to render
+        :return: KeyboardIR
+        """
+        key = (slice_.start, slice_.stop, slice_.step)
+        keyboard = self._irs.get(key)
+        if keyboard is None:
+            keyboard = self._irs[key] = KeyboardIR(self._layout.layout(slice_))
+        return keyboard
+
+    def rows(self, slice_: slice = slice(None, None, None)) -> Rows:
+        """
+        :param slice_: items to render
+        :return: rows of prepared buttons, which cannot be changed
+        """
+        return self.ir(slice_).rows
+
+    def to_dict(self, slice_: slice = slice(None, None, None)) -> dict:
+        """
+        :param slice_: items to render
+        :return: the same as InlineKeyboardMarkup.to_dict()
+        """
+        if self.is_debug:
+            return self._checked().to_dict(slice_)
+        return {
+            "inline_keyboard": [
+                [spec.to_dict() for spec in row] for row in self.rows(slice_)
+            ]
+        }
+
+    def to_json(self, slice_: slice = slice(None, None, None)) -> str:
+        """
+        :param slice_: items to render
+        :return: the same as InlineKeyboardMarkup.to_json()
+        """
+        if self.is_debug:
+            return self._checked().to_json(slice_)
+        return Serializer.keyboard(
+            [spec.to_json() for spec in row] for row in self.rows(slice_)
+        )
+
+    def render(
+        self,
+        renderer: Union[str, Renderer] = "telebot",
+        slice_: slice = slice(None, None, None),
+    ):
+        """
+        :param renderer: see Keyboa.render()
+        :param slice_: items to render
+        :return: markup made by the renderer
+        """
+        if self.is_debug:
+            return self._checked().render(renderer, slice_)
+        return get_renderer(renderer).markup(self.rows(slice_))
+
+    def __call__(
+        self,
+        slice_: slice = slice(None, None, None),
+        *,
+        as_json: bool = False,
+    ) -> Union["InlineKeyboardMarkup", str]:
+        """
+        :return:
+        """
+        return self.slice(slice_, as_json=as_json)
+
+    def slice(
+        self,
+        slice_: slice = slice(None, None, None),
+        *,
+        as_json: bool = False,
+    ) -> Union["InlineKeyboardMarkup", str]:
+        """
+        :param slice_: items to render
+        :param as_json: return serialized keyboard instead of InlineKeyboardMarkup
+        :return:
+        """
+        if as_json:
+            return self.to_json(slice_)
+        if self.is_debug:
+            return self._checked().slice(slice_)
+
+        keyboard = inline_markup()
+        for row in self.rows(slice_):
+            keyboard.row(*[spec.to_button() for spec in row])
+        return keyboard
+
+    @property
+    def keyboard(self) -> "InlineKeyboardMarkup":
+        """
+        :return:
+        """
+        return self.slice()
@@ -3,11 +3,14 @@
 Module for constants and types
 """
 
-from typing import Union, List
+from typing import TYPE_CHECKING, Union, List
 
-from telebot.types import InlineKeyboardButton
+from keyboa.lazy_types import telebot_types
 
-InlineButtonData = Union[str, int, tuple, dict, InlineKeyboardButton]
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardButton
+
+InlineButtonData = Union[str, int, tuple, dict, "InlineKeyboardButton"]
 button_text_types = (str, int)
 ButtonText = Union[button_text_types]
 callback_data_types = (str, int, type(None))
@@ -28,3 +31,15 @@ MINIMUM_ITEMS_IN_LINE = 1
 DEFAULT_ITEMS_IN_LINE = MINIMUM_ITEMS_IN_LINE
 AUTO_ALIGNMENT_RANGE = range(3, 6)
 MAXIMUM_CBD_LENGTH = 64
+BUTTON_PADDING_WIDTH = 2
+CACHED_SLICES = 128
+
+
+def __getattr__(name: str):
+    """
+    InlineKeyboardButton is kept importable from here,
+    but telebot is imported only when it is accessed.
+    """
+    if name == "InlineKeyboardButton":
+        return telebot_types().InlineKeyboardButton
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,122 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a structural diff of keyboards, e.g. to skip
+edit_message_reply_markup calls that would not change anything.
+"""
+
+from collections import namedtuple
+from itertools import zip_longest
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+
+from keyboa.base import Base
+from keyboa.keyboard import Keyboa
+from keyboa.lazy_types import is_button, is_markup
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+CellChange = namedtuple("CellChange", ["row", "column", "old", "new"])
+
+KeyboardLike = Optional[Union["InlineKeyboardMarkup", Base, dict]]
+
+
+class KeyboardDiff:
+    """
+    Changed cells of a keyboard. A cell that exists only in one
+    of the keyboards has None as the other button.
+
+    :changes: Tuple[CellChange, ...] - cells with different buttons
+        in the order of rows, where buttons are dictionaries as in to_dict().
+    """
+
+    __slots__ = ("changes",)
+
+    def __init__(self, changes: Tuple[CellChange, ...] = ()) -> None:
+        self.changes = changes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(changes={len(self.changes)})"
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    @property
+    def unchanged(self) -> bool:
+        """
+        :return: True if editing the message would not change the keyboard
+        """
+        return not self.changes
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"[{change.row}][{change.column}] {change.old} -> {change.new}"
+            for change in self.changes
+        )
+
+
+def diff_keyboards(old: KeyboardLike, new: KeyboardLike) -> KeyboardDiff:
+    """
+    Compare keyboards cell by cell in a single pass over both of them.
+    Keyboa instances with equal fingerprints are equal without rendering.
+    :param old: InlineKeyboardMarkup, Keyboa or a dictionary as in to_dict().
+        None is a message without a keyboard, e.g. call.message.reply_markup.
+    :param new: the same
+    :return:
+    """
+    if isinstance(old, Base) and isinstance(new, Base):
+        try:
+            if old.fingerprint() == new.fingerprint():
+                return KeyboardDiff()
+        except TypeError:
+            pass
+
+    changes = []
+    for row, (old_row, new_row) in enumerate(
+        zip_longest(_rows(old), _rows(new), fillvalue=())
+    ):
+        for column, (old_button, new_button) in enumerate(
+            zip_longest(old_row, new_row)
+        ):
+            old_button = _button_dict(old_button)
+            new_button = _button_dict(new_button)
+            if old_button != new_button:
+                changes.append(CellChange(row, column, old_button, new_button))
+    return KeyboardDiff(tuple(changes))
+
+
+def _rows(keyboard: KeyboardLike) -> List[list]:
+    """
+    :param keyboard:
+    :return:
+    """
+    if keyboard is None:
+        return []
+    if isinstance(keyboard, Base):
+        return keyboard.to_dict()["inline_keyboard"]
+    if is_markup(keyboard):
+        return Keyboa.markup_rows(keyboard)
+    if isinstance(keyboard, dict):
+        return keyboard["inline_keyboard"]
+    raise TypeError(
+        f"Keyboard cannot be {type(keyboard)}. "
+        "Only InlineKeyboardMarkup, Keyboa, dict or None allowed."
+    )
+
+
+def _button_dict(
+    button: Optional[Union["InlineKeyboardButton", dict]],
+) -> Optional[dict]:
+    """
+    :param button:
+    :return:
+    """
+    if is_button(button):
+        return button.to_dict()
+    return button
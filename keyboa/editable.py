@@ -0,0 +1,300 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a keyboard which can be changed button by button,
+e.g. to toggle a checkbox or update a counter in a sent message.
+"""
+
+from typing import TYPE_CHECKING, FrozenSet, List, Optional, Tuple
+
+
+from keyboa.base_check import BaseCheck
+from keyboa.button import Button, build_button
+from keyboa.keyboard import Keyboa
+from keyboa.constants import (
+    BlockItems,
+    CallbackDataMarker,
+    FlatSequence,
+    InlineButtonData,
+)
+from keyboa.lazy_types import inline_markup
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+Cell = Tuple[int, int]
+
+
+class EditableKeyboard(BaseCheck):
+    """
+    Rows of ready buttons that are changed in place.
+    Only new or changed items are converted to buttons, and the limits
+    are checked against running totals, so every edit costs O(1)
+    plus shifting the affected row.
+
+    Cells whose buttons differ from the last commit() are tracked,
+    so a handler may skip edit_message_reply_markup if nothing changed.
+
+    :items: StructuredSequence - rows of items as for Keyboa without items_in_row.
+        Any item that is not a list takes a row alone.
+
+    :front_marker, back_marker, copy_text_to_callback: the same as for Keyboa.
+        They are applied to new items too.
+    """
+
+    def __init__(
+        self,
+        items: BlockItems,
+        *,
+        front_marker: CallbackDataMarker = "",
+        back_marker: CallbackDataMarker = "",
+        copy_text_to_callback: Optional[bool] = True,
+    ) -> None:
+        if not items:
+            raise ValueError("Items should not be None")
+        if not isinstance(items, list):
+            items = [items]
+        self.is_all_items_in_limits(items)
+        self.is_row_in_limits(items)
+
+        self.front_marker = Button.get_checked_marker(front_marker)
+        self.back_marker = Button.get_checked_marker(back_marker)
+        self.copy_text_to_callback = copy_text_to_callback
+
+        self._rows: List[List["InlineKeyboardButton"]] = [
+            self._buttons(row if isinstance(row, list) else [row]) for row in items
+        ]
+        self._total = sum(len(row) for row in self._rows)
+        self._dirty = set()
+
+    @classmethod
+    def from_markup(
+        cls, markup: "InlineKeyboardMarkup", **kwargs
+    ) -> "EditableKeyboard":
+        """
+        :param markup: e.g. call.message.reply_markup
+        :param kwargs: markers for new items
+        :return:
+        """
+        cls.is_keyboard_proper_type(markup)
+        return cls([list(row) for row in Keyboa.markup_rows(markup)], **kwargs)
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __getitem__(self, cell: Cell) -> "InlineKeyboardButton":
+        row, column = cell
+        return self._rows[row][column]
+
+    @property
+    def rows(self) -> int:
+        """
+        :return: the number of rows
+        """
+        return len(self._rows)
+
+    @property
+    def dirty(self) -> FrozenSet[Cell]:
+        """
+        :return: cells changed since the last commit()
+        """
+        return frozenset(self._dirty)
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        :return:
+        """
+        return bool(self._dirty)
+
+    @property
+    def keyboard(self) -> "InlineKeyboardMarkup":
+        """
+        Buttons are shared with the editable keyboard, rows are not.
+        :return:
+        """
+        keyboard = inline_markup()
+        for row in self._rows:
+            keyboard.row(*row)
+        return keyboard
+
+    def commit(self) -> "InlineKeyboardMarkup":
+        """
+        Mark all cells as clean, e.g. before edit_message_reply_markup.
+        :return: the current keyboard
+        """
+        self._dirty.clear()
+        return self.keyboard
+
+    def set_button(self, row: int, column: int, item: InlineButtonData) -> None:
+        """
+        :param row:
+        :param column:
+        :param item: new button data. The cell is not marked as changed
+            if the new button is equal to the old one.
+        :return:
+        """
+        row, column = self._cell(row, column)
+        button = self._button(item)
+        if button.to_dict() != self._rows[row][column].to_dict():
+            self._dirty.add((row, column))
+        self._rows[row][column] = button
+
+    def insert_button(
+        self, row: int, column: Optional[int], item: InlineButtonData
+    ) -> None:
+        """
+        :param row:
+        :param column: position in the row, None to append
+        :param item:
+        :return:
+        """
+        row = self._row(row)
+        buttons = self._rows[row]
+        self.is_items_in_row_limits(len(buttons) + 1)
+        self.is_keyboard_size_in_limits(self._total + 1)
+
+        column = (
+            len(buttons) if column is None else self._position(column, len(buttons))
+        )
+        buttons.insert(column, self._button(item))
+        self._total += 1
+        self._mark_row(row, column)
+
+    def remove_button(self, row: int, column: int) -> "InlineKeyboardButton":
+        """
+        A row without buttons is removed too.
+        :param row:
+        :param column:
+        :return: removed button
+        """
+        row, column = self._cell(row, column)
+        buttons = self._rows[row]
+        if len(buttons) == 1:
+            return self.remove_row(row)[0]
+
+        self._mark_row(row, column)
+        self._total -= 1
+        return buttons.pop(column)
+
+    def replace_row(self, row: int, items: FlatSequence) -> None:
+        """
+        :param row:
+        :param items:
+        :return:
+        """
+        row = self._row(row)
+        replaced = len(self._rows[row])
+        items = self._verified_row(items, replaced)
+        self._mark_row(row, 0)
+        self._rows[row] = self._buttons(items)
+        self._total += len(items) - replaced
+        self._mark_row(row, 0)
+
+    def insert_row(self, row: Optional[int], items: FlatSequence) -> None:
+        """
+        :param row: position of the new row, None to append
+        :param items:
+        :return:
+        """
+        items = self._verified_row(items, 0)
+        row = len(self._rows) if row is None else self._position(row, len(self._rows))
+        self._mark_rows(row)
+        self._rows.insert(row, self._buttons(items))
+        self._total += len(items)
+        self._mark_rows(row)
+
+    def remove_row(self, row: int) -> List["InlineKeyboardButton"]:
+        """
+        :param row:
+        :return: removed buttons
+        """
+        row = self._row(row)
+        if len(self._rows) == 1:
+            raise ValueError("The keyboard should have at least one row.")
+        self._mark_rows(row)
+        buttons = self._rows.pop(row)
+        self._total -= len(buttons)
+        self._mark_rows(row)
+        return buttons
+
+    def _verified_row(self, items: FlatSequence, replaced: int) -> list:
+        """
+        :param items:
+        :param replaced: the number of buttons which the row replaces
+        :return:
+        """
+        if not isinstance(items, list):
+            items = [items]
+        if not items:
+            raise ValueError("Row should not be empty")
+        self.is_items_in_row_limits(len(items))
+        self.is_keyboard_size_in_limits(self._total - replaced + len(items))
+        return items
+
+    def _button(self, item: InlineButtonData) -> "InlineKeyboardButton":
+        """
+        :param item:
+        :return:
+        """
+        return build_button(
+            item, self.front_marker, self.back_marker, self.copy_text_to_callback
+        )
+
+    def _buttons(self, items: FlatSequence) -> List["InlineKeyboardButton"]:
+        """
+        :param items:
+        :return:
+        """
+        return [self._button(item) for item in items]
+
+    def _row(self, row: int) -> int:
+        """
+        :param row:
+        :return: non-negative index of an existing row
+        """
+        if not -len(self._rows) <= row < len(self._rows):
+            raise IndexError(f"There is no row {row}.")
+        return row % len(self._rows)
+
+    def _cell(self, row: int, column: int) -> Cell:
+        """
+        :param row:
+        :param column:
+        :return: non-negative indexes of an existing cell
+        """
+        row = self._row(row)
+        buttons = self._rows[row]
+        if not -len(buttons) <= column < len(buttons):
+            raise IndexError(f"There is no button {column} in row {row}.")
+        return row, column % len(buttons)
+
+    @staticmethod
+    def _position(index: int, length: int) -> int:
+        """
+        :param index: insert position, may be negative as for list.insert()
+        :param length:
+        :return:
+        """
+        return max(0, min(length, index if index >= 0 else length + index))
+
+    def _mark_row(self, row: int, column: int) -> None:
+        """
+        Mark the cell and all cells after it in the row as changed.
+        Called before the row gets shorter and after it gets longer.
+        :param row:
+        :param column:
+        :return:
+        """
+        self._dirty.update(
+            (row, index) for index in range(column, len(self._rows[row]))
+        )
+
+    def _mark_rows(self, row: int) -> None:
+        """
+        Mark all cells of the row and the following rows as changed.
+        Called both before and after rows are shifted.
+        :param row:
+        :return:
+        """
+        for index in range(row, len(self._rows)):
+            self._mark_row(index, 0)
@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains stable hashing of keyboard definitions.
+"""
+
+from hashlib import blake2b
+
+from keyboa.lazy_types import is_button
+
+FINGERPRINT_DIGEST_SIZE = 16
+
+
+def canonical(value) -> tuple:
+    """
+    Types are kept, because 1 and "1" may give different buttons.
+    :param value: items or an option
+    :return: representation which repr() is stable between processes
+    """
+    if is_button(value):
+        return "InlineKeyboardButton", value.to_json()
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(canonical(element) for element in value)
+    if isinstance(value, dict):
+        return dict.__name__, tuple(
+            (canonical(key), canonical(element)) for key, element in value.items()
+        )
+    if isinstance(value, range):
+        return tuple.__name__, tuple(canonical(element) for element in value)
+    return type(value).__name__, value
+
+
+def canonical_option(value) -> tuple:
+    """
+    Unlike items, options give the same keyboard for any sequence type,
+    e.g. alignment=[2, 3] and alignment=(2, 3).
+    :param value: an option
+    :return: see canonical()
+    """
+    if isinstance(value, (list, tuple, range)):
+        return tuple.__name__, tuple(canonical(element) for element in value)
+    return canonical(value)
+
+
+def digest(value, canonicalize=canonical) -> bytes:
+    """
+    :param value: items or an option
+    :param canonicalize: canonical() for items, canonical_option() for options
+    :return: equal for equal values in every process
+    """
+    return blake2b(
+        repr(canonicalize(value)).encode(), digest_size=FINGERPRINT_DIGEST_SIZE
+    ).digest()
+
+
+def combined(digests) -> str:
+    """
+    :param digests: digests of all parts in a fixed order
+    :return: hex digest
+    """
+    return blake2b(b"".join(digests), digest_size=FINGERPRINT_DIGEST_SIZE).hexdigest()
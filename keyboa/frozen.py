@@ -0,0 +1,29 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a base class for objects
+that cannot be changed after they are made.
+"""
+
+
+class Frozen:
+    """
+    Attributes are assigned as usual in __init__,
+    and cannot be changed or deleted after _freeze() is called.
+    """
+
+    __slots__ = ("_frozen",)
+
+    def _freeze(self) -> None:
+        """
+        Forbid any further changes of the object
+        :return:
+        """
+        self._frozen = True  # pylint: disable = W0201  # set once by subclasses
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
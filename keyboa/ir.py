@@ -0,0 +1,121 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains an immutable representation of laid out keyboards,
+which is shared between slices, combined keyboards and renders.
+"""
+
+from itertools import chain
+from typing import Iterable, Optional, Tuple, Union
+
+from keyboa.base_check import BaseCheck
+from keyboa.button import ButtonSpec
+from keyboa.frozen import Frozen
+from keyboa.renderers import DictRenderer, JsonRenderer, Renderer, get_renderer
+
+Rows = Tuple[Tuple[ButtonSpec, ...], ...]
+
+
+class KeyboardIR(Frozen):
+    """
+    Rows of verified buttons as a tuple of tuples of ButtonSpec.
+    Buttons with the same text and callback data are interned,
+    and rows are never copied: slices and combined keyboards
+    share row tuples with the keyboards they are made of.
+    The object cannot be changed, so it is safe to keep and share it.
+
+    :rows: Iterable - rows of ButtonSpec objects.
+    """
+
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: Iterable[Iterable[ButtonSpec]] = ()) -> None:
+        self.rows = tuple(
+            row if isinstance(row, tuple) else tuple(row) for row in rows
+        )
+        self._freeze()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rows={len(self.rows)}, buttons={self.size})"
+
+    @property
+    def size(self) -> int:
+        """
+        :return: the number of buttons
+        """
+        return sum(map(len, self.rows))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, KeyboardIR):
+            return NotImplemented
+        return self.rows == other.rows
+
+    def __hash__(self) -> int:
+        return hash(self.rows)
+
+    def __getitem__(self, rows: slice) -> "KeyboardIR":
+        """
+        :param rows: slice of rows
+        :return: keyboard with the same row objects
+        """
+        if not isinstance(rows, slice):
+            raise TypeError(
+                f"Rows can be selected by slice only. You passed {type(rows)}."
+            )
+        return self._shared(self.rows[rows])
+
+    def __add__(self, other: "KeyboardIR") -> "KeyboardIR":
+        if not isinstance(other, KeyboardIR):
+            return NotImplemented
+        return self.combine((self, other))
+
+    @classmethod
+    def _shared(cls, rows: Rows) -> "KeyboardIR":
+        """
+        :param rows: tuple of row tuples, which is used as is
+        :return:
+        """
+        keyboard = cls.__new__(cls)
+        keyboard.rows = rows
+        keyboard._freeze()
+        return keyboard
+
+    @classmethod
+    def combine(cls, keyboards: Iterable[Optional["KeyboardIR"]]) -> "KeyboardIR":
+        """
+        The same as Keyboa.combine(), but rows are shared instead of copied.
+        Rows were checked when every keyboard was made,
+        so only the size of the result is checked.
+        :param keyboards: iterable of KeyboardIR objects, None are skipped
+        :return: KeyboardIR
+        """
+        keyboards = [keyboard for keyboard in keyboards if keyboard is not None]
+        for keyboard in keyboards:
+            if not isinstance(keyboard, KeyboardIR):
+                raise TypeError(
+                    f"Keyboard cannot be {type(keyboard)}. Only KeyboardIR allowed."
+                )
+        if not keyboards:
+            raise ValueError("Items should not be None")
+
+        combined = cls._shared(tuple(chain.from_iterable(k.rows for k in keyboards)))
+        BaseCheck.is_keyboard_size_in_limits(combined.size)
+        return combined
+
+    def render(self, renderer: Union[str, Renderer] = "telebot"):
+        """
+        :param renderer: see Keyboa.render()
+        :return: markup made by the renderer
+        """
+        return get_renderer(renderer).markup(self.rows)
+
+    def to_dict(self) -> dict:
+        """
+        :return: the same as InlineKeyboardMarkup.to_dict()
+        """
+        return DictRenderer().markup(self.rows)
+
+    def to_json(self) -> str:
+        """
+        :return: the same as InlineKeyboardMarkup.to_json()
+        """
+        return JsonRenderer().markup(self.rows)
@@ -5,76 +5,244 @@ creating complex and functional inline keyboards.
 """
 
 
-from typing import Union, Optional, Tuple
-from telebot.types import InlineKeyboardMarkup
+from typing import TYPE_CHECKING, Union, Optional, Iterator, Iterable, Tuple
 
+from keyboa.alignment import AlignmentPlanner
 from keyboa.base import Base
-from keyboa.button import Button
+from keyboa.lazy_types import inline_markup, is_button, is_markup
+from keyboa.metrics import instrumented
+from keyboa.button import Button, ButtonSpec, build_button
+from keyboa.ir import KeyboardIR, Rows
+from keyboa.renderers import DictRenderer, JsonRenderer, Renderer, get_renderer
+from keyboa.source import ItemSource
+from keyboa.serializer import Serializer, KEYBOARD_START, KEYBOARD_END, SEPARATOR
+from keyboa.width import packed_rows
 from keyboa.constants import (
     DEFAULT_ITEMS_IN_LINE,
+    MAXIMUM_ITEMS_IN_LINE,
     AUTO_ALIGNMENT_RANGE,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
 
-class Keyboa(Base):
+
+class Keyboa(Base):  # pylint: disable = R0904
     """Default Keyboa class"""
 
+    @instrumented("json")
+    def to_dict(self, slice_: slice = slice(None, None, None)) -> dict:
+        """
+        The same as InlineKeyboardMarkup.to_dict(), but without creating telebot objects
+        for items other than InlineKeyboardButton and dictionaries with "text" key.
+        :param slice_: items to render
+        :return:
+        """
+        return DictRenderer().markup(self.spec_rows(slice_))
+
+    @instrumented("json")
+    def to_json(self, slice_: slice = slice(None, None, None)) -> str:
+        """
+        The same as InlineKeyboardMarkup.to_json(), but without creating telebot objects
+        for items other than InlineKeyboardButton and dictionaries with "text" key.
+        :param slice_: items to render
+        :return:
+        """
+        return JsonRenderer().markup(self.spec_rows(slice_))
+
+    def ir(self, slice_: slice = slice(None, None, None)) -> KeyboardIR:
+        """
+        Immutable laid out buttons of the slice, which are shared by all renderers.
+        Equal buttons are interned, and rows of preformatted items are shared as is.
+        If cache_markup is set, every item is turned into buttons once,
+        when the first slice that contains it is made, and the results
+        of the last slices are kept until any attribute of the instance is changed.
+        Otherwise the keyboard is made on every call, as slice() does,
+        so changes of items made in place are rendered too.
+        :param slice_: items to render
+        :return: KeyboardIR
+        """
+        if not self.cache_markup:
+            return KeyboardIR(self._laid_out(self._cells(slice_)))
+
+        key = (slice_.start, slice_.stop, slice_.step)
+        keyboard = self._irs.get(key)
+        if keyboard is None:
+            keyboard = self._irs[key] = KeyboardIR(
+                self._laid_out(self._cells(slice_))
+            )
+        return keyboard
+
+    def spec_rows(self, slice_: slice = slice(None, None, None)) -> Rows:
+        """
+        :param slice_: items to render
+        :return: rows of buttons in the same order as in the rendered keyboard
+        """
+        return self.ir(slice_).rows
+
+    def render(
+        self,
+        renderer: Union[str, Renderer] = "telebot",
+        slice_: slice = slice(None, None, None),
+    ):
+        """
+        Render the keyboard into the markup of any supported library.
+        :param renderer: "telebot", "aiogram", "ptb" (python-telegram-bot),
+            "dict", "json" or a custom Renderer object
+        :param slice_: items to render
+        :return: markup made by the renderer
+        """
+        return get_renderer(renderer).markup(self.spec_rows(slice_))
+
     def __call__(
         self,
         slice_: slice = slice(None, None, None),
-    ) -> InlineKeyboardMarkup:
+        *,
+        as_json: bool = False,
+    ) -> Union["InlineKeyboardMarkup", str]:
         """
         :return:
         """
-        return self.slice(slice_)
+        return self.slice(slice_, as_json=as_json)
+
+    async def arender(
+        self,
+        slice_: slice = slice(None, None, None),
+        *,
+        as_json: bool = False,
+        executor=None,
+    ) -> Union["InlineKeyboardMarkup", str]:
+        """
+        The same as slice(), but large keyboards are rendered in an executor,
+        so the event loop is not blocked.
+        :param slice_: items to render
+        :param as_json: return serialized keyboard instead of InlineKeyboardMarkup
+        :param executor: thread or process pool, the default executor of the loop
+            if not specified
+        :return:
+        """
+        # pylint: disable = C0415, R0401
+        from keyboa.aio import arender
+
+        return await arender(self, slice_, as_json=as_json, executor=executor)
 
     def slice(
         self,
         slice_: slice = slice(None, None, None),
-    ) -> InlineKeyboardMarkup:
+        *,
+        as_json: bool = False,
+    ) -> Union["InlineKeyboardMarkup", str]:
         """
+        :param slice_: items to render
+        :param as_json: return serialized keyboard instead of InlineKeyboardMarkup
         :return:
         """
-        self._items_sliced = self.items[slice_]
+        if not self.cache_markup:
+            return self.to_json(slice_) if as_json else self._rendered(slice_)
 
-        keyboard = (
-            self._generated_keyboa
-            if self.items_in_row or self.alignment
-            else self._preformatted_keyboa
-        )
-        self._items_sliced = None
-        return keyboard
+        key = (slice_.start, slice_.stop, slice_.step)
+        if not as_json:
+            keyboard = self._markups.get(key)
+            if keyboard is None:
+                keyboard = self._markups[key] = self._rendered(slice_)
+            return keyboard
 
-    @property
-    def keyboard(self) -> InlineKeyboardMarkup:
+        serialized = self._serialized_markups.get(key)
+        if serialized is None:
+            serialized = self._serialized_markups[key] = self.to_json(slice_)
+        return serialized
+
+    def _rendered(self, slice_: slice) -> "InlineKeyboardMarkup":
         """
+        :param slice_:
         :return:
         """
-        return self.slice()
+        items = self.items[slice_]
+        if self._is_flat:
+            return self._generated_keyboa(items)
+        return self._preformatted_keyboa(items)
 
     @property
-    def _calculated_items_in_row(self) -> Optional[int]:
+    def keyboard(self) -> "InlineKeyboardMarkup":
         """
         :return:
         """
+        return self.slice()
 
-        items_in_row = None
+    def page(self, number: int, page_size: int) -> "InlineKeyboardMarkup":
+        """
+        Render one page of items with a navigation row.
+        Pages are cached until any attribute of the instance is changed.
+        A list of items is limited to 100 buttons as any other Keyboa items,
+        so pass a lazy iterable as items or use Paginator directly
+        for larger catalogs.
+        :param number: zero-based page number
+        :param page_size: the number of items on one page
+        :return: InlineKeyboardMarkup
+        """
+        # pylint: disable = C0415, R0401
+        from keyboa.paginator import Paginator
 
-        for divider in self.alignment_range:
-            if not len(self._items_sliced) % divider:
-                items_in_row = divider
-                break
+        paginator = self._paginators.get(page_size)
+        if paginator is None:
+            paginator = self._paginators[page_size] = Paginator(
+                self.items, page_size, **self.options
+            )
+        return paginator.page(number)
 
-        return items_in_row
+    def render_many(
+        self,
+        variants: Iterable[dict],
+        *,
+        as_json: bool = False,
+        processes: Optional[int] = None,
+        chunksize: int = 100,
+    ) -> Iterator[Union["InlineKeyboardMarkup", str]]:
+        """
+        Render the keyboard for every variant of markers or items.
+        Items of the instance are validated once for all variants that keep them.
+        :param variants: dictionaries with new values of "items", "front_marker"
+            or "back_marker". Missing values are taken from the instance.
+        :param as_json: yield serialized keyboards instead of InlineKeyboardMarkup
+        :param processes: the number of worker processes for very large batches
+        :param chunksize: the number of variants sent to a worker process at once
+        :return: lazy iterator over keyboards in the order of variants
+        """
+        # pylint: disable = C0415
+        from keyboa.batch import BatchRenderer
 
-    @property
-    def _verified_items_in_row(self) -> int:
+        if self._batch_renderer is None:
+            self._batch_renderer = BatchRenderer(self)
+        return self._batch_renderer.render_many(variants, as_json, processes, chunksize)
+
+    def compile(self, *, debug: Optional[bool] = None):
+        """
+        Validate all buttons once and freeze the keyboard for static menus.
+        :param debug: check every render as a regular Keyboa does.
+            If not specified, CompiledKeyboa.debug is used.
+        :return: CompiledKeyboa
+        """
+        # pylint: disable = C0415, R0401
+        from keyboa.compiled import CompiledKeyboa
+
+        return CompiledKeyboa(self, debug=debug)
+
+    def _calculated_items_in_row(self, count: int) -> Optional[int]:
         """
+        :param count: the number of items to lay out
+        :return:
+        """
+
+        return AlignmentPlanner.items_in_row(tuple(self.alignment_range), count)
+
+    def _verified_items_in_row(self, count: int) -> int:
+        """
+        :param count: the number of items to lay out
         :return:
         """
         items_in_row = self.items_in_row
         if self.alignment:
-            items_in_row = self._calculated_items_in_row
+            items_in_row = self._calculated_items_in_row(count)
 
         if not items_in_row:
             items_in_row = DEFAULT_ITEMS_IN_LINE
@@ -91,64 +259,230 @@ class Keyboa(Base):
         )
         return reversed(alignment_range) if self.alignment_reverse else alignment_range
 
-    @property
-    def _preformatted_keyboa(self) -> InlineKeyboardMarkup:
+    def _preformatted_keyboa(self, items) -> "InlineKeyboardMarkup":
         """
+        :param items:
         :return:
         """
-        self.verify_preformatted_items()
-        keyboard = InlineKeyboardMarkup()
-        for row in self._items_sliced:
-            buttons = self.convert_items_to_buttons(row)
-            keyboard.row(*buttons)
-        return keyboard
+        return self.assembled(
+            [
+                self.convert_items_to_buttons(row)
+                for row in self.verify_preformatted_items(items)
+            ]
+        )
 
-    def verify_preformatted_items(self) -> None:
+    def layout(self, slice_: slice) -> list:
         """
-        Check that every row in kb is a list
-        :return:
+        :param slice_:
+        :return: rows of items in the same order as buttons of the rendered keyboard
+        """
+        items = self.items[slice_]
+        if self._is_flat:
+            return list(self._rows(items))
+        return self.verify_preformatted_items(items)
+
+    @property
+    def _is_flat(self) -> bool:
+        """
+        :return: True if items are laid out by Keyboa, not by their structure
+        """
+        return bool(self.items_in_row or self.alignment or self.row_width)
+
+    def _cells(self, slice_: slice) -> tuple:
+        """
+        Only items of the slice are verified, as in slice().
+        :param slice_: items to render
+        :return: interned buttons of the items,
+            kept by item index if cache_markup is set
+        """
+        if isinstance(self.items, ItemSource) or not self.cache_markup:
+            return tuple(map(self._cell, self.items[slice_]))
+
+        cells = []
+        for index in range(len(self.items))[slice_]:
+            cell = self._ir_cells.get(index)
+            if cell is None:
+                cell = self._ir_cells[index] = self._cell(self.items[index])
+            cells.append(cell)
+        return tuple(cells)
+
+    def _cell(self, item) -> Union[ButtonSpec, Tuple[ButtonSpec, ...]]:
+        """
+        :param item:
+        :return: button of the item or row of buttons for a preformatted row
         """
-        for index, item in enumerate(self._items_sliced):
-            if not isinstance(item, list):
-                self._items_sliced[index] = [
-                    item,
-                ]
+        if not self._is_flat and isinstance(item, list):
+            return tuple(map(self._spec, item))
+        return self._spec(item)
 
+    def _laid_out(self, cells: tuple) -> Iterator[tuple]:
+        """
+        :param cells: see _cell()
+        :return: rows of buttons, preformatted rows are not copied
+        """
+        if self._is_flat:
+            return map(tuple, self._rows(list(cells)))
+        return (cell if isinstance(cell, tuple) else (cell,) for cell in cells)
+
+    @staticmethod
+    def verify_preformatted_items(items) -> list:
+        """
+        Check that every row in kb is a list. Items are not changed.
+        :param items:
+        :return: rows of items
+        """
+        return [item if isinstance(item, list) else [item] for item in items]
+
+    @instrumented("buttons")
     def convert_items_to_buttons(self, items) -> list:
         """
         :param items:
         :return:
         """
-        return [
-            Button(
-                button_data=item,
-                front_marker=self.front_marker,
-                back_marker=self.back_marker,
-                copy_text_to_callback=self.copy_text_to_callback,
-            ).generate()
-            for item in items
-        ]
+        if self.button_cache is None:
+            return [self._generated_button(item) for item in items]
+        return [self._cached_button(item) for item in items]
 
-    @property
-    def _generated_keyboa(self) -> InlineKeyboardMarkup:
+    def _generated_button(self, item) -> "InlineKeyboardButton":
+        """
+        :param item:
+        :return:
+        """
+        return build_button(
+            item, self.front_marker, self.back_marker, self.copy_text_to_callback
+        )
+
+    def _cached_button(self, item) -> "InlineKeyboardButton":
+        """
+        Take the button from button_cache or generate and put it there.
+        Items that cannot be used as a key are generated every time.
+        :param item:
+        :return:
         """
+        key = self.button_cache_key(item)
+        if key is None:
+            return self._generated_button(item)
+
+        button = self.button_cache.get(key)
+        if button is None:
+            button = self.button_cache[key] = self._generated_button(item)
+        return button
+
+    def _spec(self, item) -> ButtonSpec:
+        """
+        :param item:
         :return:
         """
-        keyboard = InlineKeyboardMarkup()
-        items_in_row = self._verified_items_in_row
-        rows_in_keyboard = len(self._items_sliced) // items_in_row
-        buttons = self.convert_items_to_buttons(self._items_sliced)
+        return ButtonSpec.from_data(
+            item, self.front_marker, self.back_marker, self.copy_text_to_callback
+        )
 
-        for _row in range(rows_in_keyboard):
-            keyboard.row(*[buttons.pop(0) for _button in range(items_in_row)])
+    def button_cache_key(self, item) -> Optional[tuple]:
+        """
+        Types are part of the key, because 1 == True, but they give different buttons.
+        :param item:
+        :return: hashable key or None if the item cannot be cached
+        """
+        if is_button(item):
+            return None
+
+        key = (
+            self._typed(item),
+            self._typed(self.front_marker),
+            self._typed(self.back_marker),
+            self.copy_text_to_callback,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
-        if buttons:
-            keyboard.row(*buttons)
+    @classmethod
+    def _typed(cls, value) -> tuple:
+        """
+        :param value:
+        :return:
+        """
+        if isinstance(value, tuple):
+            return tuple, tuple(cls._typed(element) for element in value)
+        if isinstance(value, dict):
+            return dict, tuple(
+                (cls._typed(key), cls._typed(element)) for key, element in value.items()
+            )
+        return type(value), value
+
+    def _generated_keyboa(self, items) -> "InlineKeyboardMarkup":
+        """
+        :param items:
+        :return:
+        """
+        buttons = self.convert_items_to_buttons(items)
+        return self.assembled(self._rows(buttons))
 
+    @staticmethod
+    @instrumented("rows")
+    def assembled(rows: Iterable[list]) -> "InlineKeyboardMarkup":
+        """
+        :param rows: rows of buttons
+        :return:
+        """
+        keyboard = inline_markup()
+        for row in rows:
+            keyboard.row(*row)
         return keyboard
 
+    def _rows(self, items: list) -> Iterator[list]:
+        """
+        :param items: items or buttons made of them
+        :return:
+        """
+        if self.row_width:
+            return packed_rows(
+                items,
+                map(self._item_text, items),
+                self.row_width,
+                self.items_in_row or MAXIMUM_ITEMS_IN_LINE,
+            )
+        return self.chunked(items, self._verified_items_in_row(len(items)))
+
+    def _item_text(self, item) -> str:
+        """
+        :param item:
+        :return: text of the button which will be made of the item
+        """
+        if isinstance(item, ButtonSpec) or is_button(item):
+            return item.text
+        if isinstance(item, dict) and item.get("text"):
+            return str(item["text"])
+        return str(Button.prepare_raw(item, self.copy_text_to_callback)[0])
+
     @staticmethod
-    def merge_keyboards_data(keyboards):
+    def chunked(items: list, items_in_row: int) -> Iterator[list]:
+        """
+        Split items into consecutive rows in a single pass.
+        Every row has items_in_row length except the last one,
+        which contains the remaining items if there are any.
+        :param items:
+        :param items_in_row:
+        :return:
+        """
+        for start in range(0, len(items), items_in_row):
+            yield items[start : start + items_in_row]
+
+    @staticmethod
+    def markup_rows(keyboard: "InlineKeyboardMarkup") -> list:
+        """
+        Newer versions of telebot keep rows in inline_keyboard
+        and warn on every access to keyboard.
+        :param keyboard:
+        :return: the list of rows of the keyboard itself
+        """
+        rows = getattr(keyboard, "inline_keyboard", None)
+        return keyboard.keyboard if rows is None else rows
+
+    @classmethod
+    def merge_keyboards_data(cls, keyboards):
         """
         :param keyboards:
         :return:
@@ -158,40 +492,81 @@ class Keyboa(Base):
             if keyboard is None:
                 continue
 
-            if not isinstance(keyboard, InlineKeyboardMarkup):
+            if not is_markup(keyboard):
                 type_error_message = (
                     f"Keyboard cannot be {type(keyboard)}. "
                     "Only InlineKeyboardMarkup allowed."
                 )
                 raise TypeError(type_error_message)
-            data.extend(keyboard.keyboard)
+            data.extend(cls.markup_rows(keyboard))
         return data
 
     @classmethod
+    @instrumented("combine")
     def combine(
         cls,
         keyboards: Optional[
-            Union[Tuple[InlineKeyboardMarkup, ...], InlineKeyboardMarkup]
+            Union[Iterable[Optional["InlineKeyboardMarkup"]], "InlineKeyboardMarkup"]
         ] = None,
-    ) -> InlineKeyboardMarkup:
+    ) -> "InlineKeyboardMarkup":
         """
         This function combines multiple InlineKeyboardMarkup objects into one.
+        Buttons are already validated, so only the limits of the result are checked.
 
-        :param keyboards: Sequence of InlineKeyboardMarkup objects.
-            Also could be presented as a standalone InlineKeyboardMarkup.
+        :param keyboards: Sequence or any other iterable of InlineKeyboardMarkup
+            objects. Also could be presented as a standalone InlineKeyboardMarkup.
 
         :return: InlineKeyboardMarkup
         """
 
         if keyboards is None:
-            return InlineKeyboardMarkup()
+            return inline_markup()
 
-        if isinstance(keyboards, InlineKeyboardMarkup):
+        if is_markup(keyboards):
             keyboards = (keyboards,)
 
-        for keyboard in keyboards:
-            cls.is_keyboard_proper_type(keyboard)
-
         data = cls.merge_keyboards_data(keyboards)
+        if not data:
+            raise ValueError("Items should not be None")
+        cls.is_keyboard_size_in_limits(sum(map(len, data)))
+        cls.is_row_in_limits(data)
+
+        keyboard = inline_markup()
+        cls.markup_rows(keyboard).extend(list(row) for row in data)
+        return keyboard
+
+    @classmethod
+    @instrumented("combine")
+    def combine_json(
+        cls, keyboards: Optional[Union[Iterable[Optional[str]], str]] = None
+    ) -> str:
+        """
+        The same as combine(), but for serialized keyboards, e.g. cached
+        results of keyboa(as_json=True) or to_json(). Keyboards are joined
+        as strings, without parsing.
+
+        :param keyboards: Sequence or any other iterable of serialized keyboards.
+            Also could be presented as a standalone string.
+
+        :return: serialized keyboard
+        """
+        if keyboards is None:
+            return Serializer.keyboard([])
+
+        if isinstance(keyboards, str):
+            keyboards = (keyboards,)
+
+        data = [
+            rows
+            for rows in (
+                Serializer.keyboard_rows(keyboard)
+                for keyboard in keyboards
+                if keyboard is not None
+            )
+            if rows is not None
+        ]
+        if not data:
+            raise ValueError("Items should not be None")
+        cls.is_keyboard_size_in_limits(sum(map(Serializer.buttons_in, data)))
 
-        return cls(items=data).keyboard
+        return KEYBOARD_START + SEPARATOR.join(data) + KEYBOARD_END
@@ -0,0 +1,66 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains lazy access to telebot types.
+
+pyTelegramBotAPI is imported only when a telebot object has to be created,
+so dictionaries and JSON can be rendered without importing it.
+An object cannot be an instance of a telebot type until telebot is imported,
+so type checks do not import it either.
+"""
+
+import sys
+from importlib import import_module
+
+TYPES_MODULE = "telebot.types"
+
+_types = None  # pylint: disable = C0103
+
+
+def telebot_types():
+    """
+    :return: telebot.types module, imported on the first call
+    """
+    global _types  # pylint: disable = W0603
+    if _types is None:
+        _types = import_module(TYPES_MODULE)
+    return _types
+
+
+def _loaded_types():
+    """
+    :return: telebot.types module if it is already imported, otherwise None
+    """
+    return _types or sys.modules.get(TYPES_MODULE)
+
+
+def is_button(value) -> bool:
+    """
+    :param value:
+    :return: True for InlineKeyboardButton objects
+    """
+    types = _loaded_types()
+    return types is not None and isinstance(value, types.InlineKeyboardButton)
+
+
+def is_markup(value) -> bool:
+    """
+    :param value:
+    :return: True for InlineKeyboardMarkup objects
+    """
+    types = _loaded_types()
+    return types is not None and isinstance(value, types.InlineKeyboardMarkup)
+
+
+def inline_button(**kwargs):
+    """
+    :param kwargs: fields of the button
+    :return: InlineKeyboardButton
+    """
+    return telebot_types().InlineKeyboardButton(**kwargs)
+
+
+def inline_markup():
+    """
+    :return: empty InlineKeyboardMarkup
+    """
+    return telebot_types().InlineKeyboardMarkup()
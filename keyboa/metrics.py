@@ -0,0 +1,145 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains optional instrumentation of render stages.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter_ns
+from typing import Callable, Iterator, List, Optional
+
+Hook = Callable[[str, int], None]
+
+HOOKS: List[Hook] = []
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    :param hook: callable which receives a stage name and its duration
+        in nanoseconds after every instrumented call
+    :return:
+    """
+    HOOKS.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    :param hook:
+    :return:
+    """
+    HOOKS.remove(hook)
+
+
+def instrumented(stage: str) -> Callable:
+    """
+    Report the duration of every call to hooks.
+    Without hooks, the only overhead is checking that the list is empty.
+    :param stage: name of the stage
+    :return: decorator
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not HOOKS:
+                return function(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = perf_counter_ns() - start
+                for hook in HOOKS:
+                    hook(stage, duration)
+
+        return wrapper
+
+    return decorator
+
+
+class Metrics:
+    """
+    Hook that counts calls and sums nanoseconds per stage.
+    Stages are "validation", "buttons", "rows", "json", "combine" and "button".
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.calls = defaultdict(int)
+        self.nanoseconds = defaultdict(int)
+
+    def __call__(self, stage: str, nanoseconds: int) -> None:
+        with self._lock:
+            self.calls[stage] += 1
+            self.nanoseconds[stage] += nanoseconds
+
+    def reset(self) -> None:
+        """
+        :return:
+        """
+        with self._lock:
+            self.calls.clear()
+            self.nanoseconds.clear()
+
+    def to_prometheus(self, prefix: str = "keyboa") -> str:
+        """
+        :param prefix:
+        :return: counters in Prometheus text exposition format
+        """
+        with self._lock:
+            stages = sorted(self.calls.items())
+            nanoseconds = dict(self.nanoseconds)
+
+        lines = [
+            f"# HELP {prefix}_stage_calls_total Calls of the render stage.",
+            f"# TYPE {prefix}_stage_calls_total counter",
+        ]
+        lines.extend(
+            f'{prefix}_stage_calls_total{{stage="{stage}"}} {calls}'
+            for stage, calls in stages
+        )
+        lines.extend(
+            [
+                f"# HELP {prefix}_stage_nanoseconds_total "
+                "Time spent in the render stage.",
+                f"# TYPE {prefix}_stage_nanoseconds_total counter",
+            ]
+        )
+        lines.extend(
+            f'{prefix}_stage_nanoseconds_total{{stage="{stage}"}} {nanoseconds[stage]}'
+            for stage, _calls in stages
+        )
+        return "\n".join(lines) + "\n"
+
+    def to_statsd(self, prefix: str = "keyboa") -> str:
+        """
+        Counters are not reset, call reset() after sending them
+        to report only the difference.
+        :param prefix:
+        :return: counters in statsd format, one per line
+        """
+        with self._lock:
+            stages = sorted(self.calls.items())
+            nanoseconds = dict(self.nanoseconds)
+
+        return "\n".join(
+            f"{prefix}.{stage}.calls:{calls}|c\n"
+            f"{prefix}.{stage}.nanoseconds:{nanoseconds[stage]}|c"
+            for stage, calls in stages
+        )
+
+
+@contextmanager
+def profiled(metrics: Optional[Metrics] = None) -> Iterator[Metrics]:
+    """
+    Collect metrics of all renders inside the block
+    :param metrics: existing metrics to add to
+    :return:
+    """
+    metrics = Metrics() if metrics is None else metrics
+    add_hook(metrics)
+    try:
+        yield metrics
+    finally:
+        remove_hook(metrics)
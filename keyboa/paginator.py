@@ -0,0 +1,192 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a paginator that splits long sequences of items
+into pages and renders each of them as a separate keyboard.
+"""
+
+from typing import TYPE_CHECKING, Optional, List, Tuple, Union, Iterable
+
+from keyboa.base_check import BaseCheck
+from keyboa.button import Button
+from keyboa.keyboard import Keyboa
+from keyboa.source import ItemSource
+from keyboa.constants import CallbackDataMarker, FlatSequence, StructuredSequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+
+class Paginator(BaseCheck):
+    """
+    Page boundaries are calculated once, and every rendered page is cached,
+    so serving a page costs only the buttons on that page.
+
+    :items: StructuredSequence or any other iterable - a whole catalog.
+        Unlike Keyboa items, it is not limited by the number of buttons,
+        only each page is.
+        Generators and other lazy iterables are consumed only as far as
+        the requested page and one item more, to know if the next page exists.
+        Until they are exhausted, the total number of pages is not shown.
+
+    :page_size: int - the number of items on one page.
+
+    :navigation_marker: CallbackDataMarker - a prefix for navigation callbacks.
+        The callback of a navigation button is the marker plus the page number.
+
+    :keyboa_options: keyword arguments passed to Keyboa for every page,
+        such as items_in_row, front_marker or alignment.
+
+    Rendered keyboards are shared between calls, so do not modify them.
+    """
+
+    previous_text = "‹"
+    next_text = "›"
+
+    def __init__(
+        self,
+        items: Union[StructuredSequence, Iterable],
+        page_size: int,
+        *,
+        navigation_marker: CallbackDataMarker = "page=",
+        **keyboa_options,
+    ) -> None:
+        if not items:
+            raise ValueError("Items should not be None")
+
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError(
+                f"Page size should be a positive integer. You entered {page_size}."
+            )
+
+        if self.is_lazy_items(items) and not isinstance(items, ItemSource):
+            items = ItemSource(items)
+
+        self.items = items
+        self.page_size = page_size
+        self.navigation_marker = Button.get_checked_marker(navigation_marker)
+        self.keyboa_options = keyboa_options
+
+        self._boundaries: Optional[List[Tuple[int, int]]] = (
+            None
+            if isinstance(items, ItemSource)
+            else [
+                (start, min(start + page_size, len(items)))
+                for start in range(0, len(items), page_size)
+            ]
+        )
+        self._pages = {}
+
+    @property
+    def pages(self) -> Optional[int]:
+        """
+        :return: the number of pages or None if a lazy source is not consumed yet
+        """
+        if self._boundaries is not None:
+            return len(self._boundaries)
+        if self.items.exhausted:
+            return -(-self.items.consumed // self.page_size)
+        return None
+
+    def __len__(self) -> int:
+        if self.pages is None:
+            raise TypeError(
+                "The number of pages is unknown until the items are consumed"
+            )
+        return self.pages
+
+    def __call__(self, number: int = 0) -> "InlineKeyboardMarkup":
+        return self.page(number)
+
+    def page(self, number: int) -> "InlineKeyboardMarkup":
+        """
+        :param number: zero-based page number
+        :return: InlineKeyboardMarkup with items of the page and a navigation row
+        """
+        keyboard = self._pages.get(number)
+        if keyboard is None:
+            keyboard = self._pages[number] = self._rendered_page(number)
+        return keyboard
+
+    def page_items(self, number: int) -> FlatSequence:
+        """
+        :param number: zero-based page number
+        :return: items of the page
+        """
+        if self._boundaries is None:
+            items = (
+                self.items[number * self.page_size : (number + 1) * self.page_size]
+                if isinstance(number, int) and number >= 0
+                else None
+            )
+            if not items:
+                raise ValueError(f"There is no page {number}.")
+            return items
+
+        if not isinstance(number, int) or not 0 <= number < len(self):
+            raise ValueError(
+                f"Page number should be from 0 to {len(self) - 1}. "
+                f"You entered {number}."
+            )
+        start, stop = self._boundaries[number]
+        return self.items[start:stop]
+
+    def has_next(self, number: int) -> bool:
+        """
+        :param number: zero-based page number
+        :return: True if there is a page after this one
+        """
+        if self._boundaries is None:
+            return self.items.has_index((number + 1) * self.page_size)
+        return number < len(self) - 1
+
+    def navigation_row(self, number: int) -> List["InlineKeyboardButton"]:
+        """
+        :param number: zero-based page number
+        :return: buttons leading to the previous and the next pages
+            and a button with the current page number between them.
+            A single page has no navigation.
+        """
+        has_next = self.has_next(number)
+        if number == 0 and not has_next:
+            return []
+
+        row = []
+        if number > 0:
+            row.append((self.previous_text, number - 1))
+        pages = self.pages
+        row.append((f"{number + 1}/{pages}" if pages else f"{number + 1}", number))
+        if has_next:
+            row.append((self.next_text, number + 1))
+
+        return [
+            Button(
+                button_data=(text, page),
+                front_marker=self.navigation_marker,
+            ).generate()
+            for text, page in row
+        ]
+
+    def parse(self, callback_data: str) -> Optional[int]:
+        """
+        :param callback_data: data received from a pressed button
+        :return: page number if the data belongs to the navigation row,
+            otherwise None
+        """
+        if not callback_data.startswith(self.navigation_marker):
+            return None
+        number = callback_data[len(self.navigation_marker) :]
+        return int(number) if number.isdecimal() and number.isascii() else None
+
+    def _rendered_page(self, number: int) -> "InlineKeyboardMarkup":
+        """
+        :param number:
+        :return:
+        """
+        items = self.page_items(number)
+        navigation = self.navigation_row(number)
+        self.is_all_items_in_limits(items + [navigation])
+
+        keyboard = Keyboa(items=items, **self.keyboa_options).keyboard
+        if navigation:
+            keyboard.row(*navigation)
+        return keyboard
@@ -0,0 +1,105 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a persistent cache of rendered keyboards,
+which is shared by worker processes and survives restarts.
+"""
+
+from typing import TYPE_CHECKING, Optional, Union
+
+
+from keyboa.keyboard import Keyboa
+from keyboa.sqlite import SqliteDatabase
+from keyboa.lazy_types import telebot_types
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup
+
+
+def content_hash(keyboa: Keyboa, slice_: slice = slice(None, None, None)) -> str:
+    """
+    :param keyboa:
+    :param slice_:
+    :return: fingerprint of the keyboard and the slice
+    """
+    return f"{keyboa.fingerprint()}:{slice_.start}:{slice_.stop}:{slice_.step}"
+
+
+class SqliteKeyboardCache(SqliteDatabase):
+    """
+    Rendered keyboards are stored as JSON in a local SQLite file
+    by the fingerprint of items and options, so a keyboard rendered
+    by one worker process is read by all others, and after restarts too.
+
+    :path: str - path to the database file.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS keyboards "
+        "(key TEXT PRIMARY KEY, keyboard TEXT NOT NULL)"
+    )
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self.connection.execute("SELECT COUNT(*) FROM keyboards").fetchone()
+        return row[0]
+
+    def key(self, keyboa: Keyboa, slice_: slice = slice(None, None, None)) -> str:
+        """
+        :param keyboa:
+        :param slice_:
+        :return:
+        """
+        return content_hash(keyboa, slice_)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        :param key:
+        :return: serialized keyboard or None
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT keyboard FROM keyboards WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, keyboard: str) -> None:
+        """
+        :param key:
+        :param keyboard: serialized keyboard
+        :return:
+        """
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO keyboards (key, keyboard) VALUES (?, ?)",
+                (key, keyboard),
+            )
+
+    def clear(self) -> None:
+        """
+        :return:
+        """
+        with self._lock:
+            self.connection.execute("DELETE FROM keyboards")
+
+    def render(
+        self,
+        keyboa: Keyboa,
+        slice_: slice = slice(None, None, None),
+        *,
+        as_json: bool = False,
+    ) -> Union["InlineKeyboardMarkup", str]:
+        """
+        Take the keyboard from the cache or render and put it there.
+        :param keyboa:
+        :param slice_: items to render
+        :param as_json: return serialized keyboard instead of InlineKeyboardMarkup
+        :return:
+        """
+        key = self.key(keyboa, slice_)
+        keyboard = self.get(key)
+        if keyboard is None:
+            keyboard = keyboa.to_json(slice_)
+            self.put(key, keyboard)
+        if as_json:
+            return keyboard
+        return telebot_types().InlineKeyboardMarkup.de_json(keyboard)
@@ -0,0 +1,164 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains renderers that turn verified buttons
+into markup objects of different Telegram libraries.
+"""
+
+from abc import ABC, abstractmethod
+from importlib import import_module
+from typing import Any, Iterable, List, Union
+
+from keyboa.button import ButtonSpec
+from keyboa.serializer import Serializer
+from keyboa.lazy_types import inline_markup
+
+
+class Renderer(ABC):
+    """
+    Base class for renderers.
+    Keyboa lays out and verifies buttons once, and a renderer only wraps
+    the ready ButtonSpec rows into objects of the target library,
+    so no intermediate telebot objects are created for other libraries.
+    Libraries are imported on the first render.
+    """
+
+    def markup(self, rows: Iterable[Iterable[ButtonSpec]]) -> Any:
+        """
+        :param rows: rows of verified buttons
+        :return: markup of the target library
+        """
+        return self.keyboard([[self.button(spec) for spec in row] for row in rows])
+
+    @abstractmethod
+    def button(self, spec: ButtonSpec) -> Any:
+        """
+        :param spec:
+        :return: button of the target library
+        """
+
+    @abstractmethod
+    def keyboard(self, rows: List[list]) -> Any:
+        """
+        :param rows: rows of buttons made by button()
+        :return: markup of the target library
+        """
+
+
+class DictRenderer(Renderer):
+    """The same dictionary as InlineKeyboardMarkup.to_dict() returns"""
+
+    def button(self, spec: ButtonSpec) -> dict:
+        return spec.to_dict()
+
+    def keyboard(self, rows: List[list]) -> dict:
+        return {"inline_keyboard": rows}
+
+
+class JsonRenderer(Renderer):
+    """The same string as InlineKeyboardMarkup.to_json() returns"""
+
+    def button(self, spec: ButtonSpec) -> str:
+        return spec.to_json()
+
+    def keyboard(self, rows: List[list]) -> str:
+        return Serializer.keyboard(rows)
+
+
+class TelebotRenderer(Renderer):
+    """telebot.types.InlineKeyboardMarkup from pyTelegramBotAPI"""
+
+    def button(self, spec: ButtonSpec):
+        return spec.to_button()
+
+    def keyboard(self, rows: List[list]):
+        keyboard = inline_markup()
+        for row in rows:
+            keyboard.row(*row)
+        return keyboard
+
+
+class LibraryRenderer:  # pylint: disable = R0903
+    """
+    Mixin for renderers of optional libraries.
+
+    :module: str - name of the module with markup types.
+    """
+
+    module = None
+    _types = None
+
+    @property
+    def types(self):
+        """
+        :return: the module, resolved once per renderer
+        """
+        if self._types is None:
+            self._types = import_module(self.module)
+        return self._types
+
+
+class AiogramRenderer(LibraryRenderer, Renderer):
+    """aiogram.types.InlineKeyboardMarkup"""
+
+    module = "aiogram.types"
+
+    def button(self, spec: ButtonSpec):
+        if spec.button is None:
+            return self.types.InlineKeyboardButton(
+                text=spec.text, callback_data=spec.callback_data
+            )
+        return self.types.InlineKeyboardButton(**spec.to_dict())
+
+    def keyboard(self, rows: List[list]):
+        return self.types.InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+class PtbRenderer(LibraryRenderer, Renderer):
+    """telegram.InlineKeyboardMarkup from python-telegram-bot"""
+
+    module = "telegram"
+
+    def button(self, spec: ButtonSpec):
+        if spec.button is None:
+            return self.types.InlineKeyboardButton(
+                spec.text, callback_data=spec.callback_data
+            )
+        return self.types.InlineKeyboardButton.de_json(spec.to_dict(), None)
+
+    def keyboard(self, rows: List[list]):
+        return self.types.InlineKeyboardMarkup(rows)
+
+
+RENDERERS = {
+    "telebot": TelebotRenderer,
+    "aiogram": AiogramRenderer,
+    "ptb": PtbRenderer,
+    "python-telegram-bot": PtbRenderer,
+    "dict": DictRenderer,
+    "json": JsonRenderer,
+}
+
+INSTANCES = {}
+
+
+def get_renderer(renderer: Union[str, Renderer]) -> Renderer:
+    """
+    Renderers of built-in names are made once and shared,
+    so library types are resolved once per process.
+    :param renderer: name from RENDERERS or Renderer object
+    :return: Renderer object
+    """
+    if isinstance(renderer, Renderer):
+        return renderer
+    if not isinstance(renderer, str):
+        raise TypeError(
+            f"Renderer cannot be {type(renderer)}. Only str or Renderer allowed."
+        )
+    if renderer not in RENDERERS:
+        raise ValueError(
+            f"Unknown renderer {renderer!r}. Use one of {sorted(RENDERERS)}."
+        )
+    instance = INSTANCES.get(renderer)
+    if instance is None:
+        instance = INSTANCES[renderer] = RENDERERS[renderer]()
+    return instance
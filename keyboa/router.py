@@ -0,0 +1,96 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a router that dispatches received callback data
+to handlers by front markers used to create the keyboards.
+"""
+
+from collections import namedtuple
+from typing import Any, Callable, Optional
+
+RouteMatch = namedtuple("RouteMatch", ["handler", "prefix", "value"])
+
+HANDLER = None
+
+
+class CallbackRouter:
+    """
+    Handlers are registered for callback data prefixes, usually front markers.
+    Prefixes are stored in a trie, so the lookup time depends only on
+    the length of the data, not on the number of routes.
+    If several prefixes match, the longest one wins.
+    An empty prefix matches any data and may be used as a fallback.
+    """
+
+    def __init__(self) -> None:
+        self._root = {}
+        self._routes = 0
+
+    def __len__(self) -> int:
+        return self._routes
+
+    def register(self, prefix: str, handler: Callable) -> None:
+        """
+        :param prefix: beginning of callback data, e.g. a front marker
+        :param handler: function which will be called with the rest of the data
+        :return:
+        """
+        if not isinstance(prefix, str):
+            raise TypeError(f"Prefix cannot be {type(prefix)}. Only str allowed.")
+        if not callable(handler):
+            raise TypeError(f"Handler should be callable. You passed {type(handler)}.")
+
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        if HANDLER in node:
+            raise ValueError(f"Prefix {prefix!r} is already registered.")
+        node[HANDLER] = handler
+        self._routes += 1
+
+    def route(self, prefix: str) -> Callable:
+        """
+        Decorator version of register()
+        :param prefix:
+        :return:
+        """
+
+        def decorator(handler: Callable) -> Callable:
+            self.register(prefix, handler)
+            return handler
+
+        return decorator
+
+    def resolve(self, data: str) -> Optional[RouteMatch]:
+        """
+        :param data: received callback data
+        :return: handler, matched prefix and the rest of the data,
+            or None if no prefix matches
+        """
+        node = self._root
+        match = None
+        if HANDLER in node:
+            match = (node[HANDLER], 0)
+
+        for position, char in enumerate(data, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if HANDLER in node:
+                match = (node[HANDLER], position)
+
+        if match is None:
+            return None
+        handler, length = match
+        return RouteMatch(handler, data[:length], data[length:])
+
+    def dispatch(self, data: str, *args, **kwargs) -> Any:
+        """
+        Call the handler of the longest matching prefix
+        with the rest of the data and all other arguments.
+        :param data: received callback data
+        :return: the result of the handler
+        """
+        match = self.resolve(data)
+        if match is None:
+            raise ValueError(f"There is no route for callback data {data!r}.")
+        return match.handler(match.value, *args, **kwargs)
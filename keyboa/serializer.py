@@ -0,0 +1,73 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains functions for serializing keyboards to JSON
+without creating telebot objects.
+"""
+# pylint: disable = C0116
+
+from json.encoder import encode_basestring_ascii
+from typing import Iterable, Optional
+
+KEYBOARD_START = '{"inline_keyboard": ['
+KEYBOARD_END = "]}"
+ROW_START = "["
+ROW_END = "]"
+SEPARATOR = ", "
+TEXT_START = '{"text": '
+CALLBACK_DATA_START = ', "callback_data": '
+BUTTON_END = "}"
+
+
+class Serializer:
+    """
+    Builds the same JSON as InlineKeyboardMarkup.to_json() does,
+    i.e. json.dumps with default settings, from precomputed string fragments.
+    """
+
+    @classmethod
+    def button(cls, text: str, callback_data: str) -> str:
+        return cls.button_start(text) + cls.button_end(callback_data)
+
+    @staticmethod
+    def button_start(text: str) -> str:
+        return TEXT_START + encode_basestring_ascii(text) + CALLBACK_DATA_START
+
+    @staticmethod
+    def button_end(callback_data: str) -> str:
+        return encode_basestring_ascii(callback_data) + BUTTON_END
+
+    @staticmethod
+    def row(buttons: Iterable[str]) -> str:
+        return ROW_START + SEPARATOR.join(buttons) + ROW_END
+
+    @classmethod
+    def keyboard(cls, rows: Iterable[Iterable[str]]) -> str:
+        return KEYBOARD_START + SEPARATOR.join(map(cls.row, rows)) + KEYBOARD_END
+
+    @staticmethod
+    def keyboard_rows(keyboard: str) -> Optional[str]:
+        """
+        :param keyboard: serialized keyboard
+        :return: serialized rows without the enclosing object,
+            None if the keyboard has no rows
+        """
+        if not (
+            isinstance(keyboard, str)
+            and keyboard.startswith(KEYBOARD_START)
+            and keyboard.endswith(KEYBOARD_END)
+        ):
+            raise ValueError(
+                "Only keyboards serialized by Keyboa or telebot can be combined."
+            )
+        return keyboard[len(KEYBOARD_START) : -len(KEYBOARD_END)] or None
+
+    @staticmethod
+    def buttons_in(rows: str) -> int:
+        """
+        Every button starts a row or follows another button in a row.
+        Quotes inside values are escaped, and nested objects follow a key,
+        so these fragments cannot appear anywhere else.
+        :param rows: serialized rows
+        :return: the number of buttons
+        """
+        return rows.count(ROW_START + TEXT_START) + rows.count(SEPARATOR + TEXT_START)
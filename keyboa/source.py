@@ -0,0 +1,174 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a wrapper for lazily consumed items,
+such as generators or database cursors.
+"""
+
+from itertools import islice
+from threading import Lock
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from keyboa.base_check import BaseCheck
+from keyboa.constants import (
+    InlineButtonData,
+    FlatSequence,
+    MAXIMUM_ITEMS_IN_KEYBOARD,
+)
+
+
+class BaseItemSource(BaseCheck):
+    """
+    Common part of sources that keep consumed items for further slices.
+    Subclasses consume items from their iterators.
+    """
+
+    def __init__(self) -> None:
+        self._consumed = []
+        self.exhausted = False
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(consumed={len(self._consumed)}, "
+            f"exhausted={self.exhausted})"
+        )
+
+    @property
+    def consumed(self) -> int:
+        """
+        :return: the number of items consumed from the iterable
+        """
+        return len(self._consumed)
+
+    @staticmethod
+    def forward_slice(slice_: slice) -> Optional[Tuple[int, Optional[int], int]]:
+        """
+        :param slice_:
+        :return: start, stop and step of a slice that can be consumed
+            item by item, or None if the slice needs all items
+        """
+        start = 0 if slice_.start is None else slice_.start
+        step = 1 if slice_.step is None else slice_.step
+        if step == 0:
+            raise ValueError("slice step cannot be zero")
+        if start < 0 or step < 0 or (slice_.stop is not None and slice_.stop < 0):
+            return None
+        return start, slice_.stop, step
+
+    def _consumed_slice(self, slice_: slice) -> list:
+        """
+        :param slice_: slice of the items consumed so far
+        :return: items of the slice, checked against Telegram limits
+        """
+        items = self._consumed[slice_]
+        self.is_all_items_in_limits(items)
+        return items
+
+
+class StreamedSlice(BaseCheck):
+    """
+    Items of a slice, which are consumed one by one.
+    Telegram limits are checked as soon as the slice may exceed them,
+    so an endless iterable is not consumed any further.
+    """
+
+    def __init__(self) -> None:
+        self.items = []
+        self._buttons = 0
+
+    def append(self, item: Union[InlineButtonData, FlatSequence]) -> None:
+        """
+        :param item: item or row of the slice
+        :return:
+        """
+        self.items.append(item)
+        self._buttons += len(item) if isinstance(item, list) else 1
+        if self._buttons > MAXIMUM_ITEMS_IN_KEYBOARD:
+            self.is_all_items_in_limits(self.items)
+
+
+class ItemSource(BaseItemSource):
+    """
+    Items are consumed from the iterable only when a slice needs them,
+    and are kept for further slices. Telegram limits are checked
+    for the requested slice only, while it is being consumed,
+    so an endless iterable fails as soon as the slice exceeds them.
+
+    :iterable: Iterable - any iterable of InlineButtonData objects or rows.
+        It is consumed under a lock, so the source may be sliced
+        from several threads, e.g. by Keyboa.arender().
+    """
+
+    def __init__(self, iterable: Iterable) -> None:
+        super().__init__()
+        self._iterator = iter(iterable)
+        self._lock = Lock()
+
+    def has_index(self, index: int) -> bool:
+        """
+        :param index: non-negative index
+        :return: True if the iterable has at least index + 1 items
+        """
+        self._fill(index + 1)
+        return index < len(self._consumed)
+
+    def __iter__(self) -> Iterator[Union[InlineButtonData, FlatSequence]]:
+        """
+        Items are consumed one by one, as they are iterated
+        :return:
+        """
+        position = 0
+        while self.has_index(position):
+            yield self._consumed[position]
+            position += 1
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[InlineButtonData, FlatSequence]:
+        if isinstance(index, int):
+            self._fill(None if index < 0 else index + 1)
+            return self._consumed[index]
+
+        bounds = self.forward_slice(index)
+        if bounds is None:
+            self._fill(None)
+            items = self._consumed_slice(index)
+        else:
+            items = self._streamed(*bounds)
+
+        self.is_row_in_limits(items)
+        return items
+
+    def _streamed(self, start: int, stop: Optional[int], step: int) -> list:
+        """
+        :param start:
+        :param stop:
+        :param step:
+        :return: items of the slice, consumed one by one
+        """
+        streamed = StreamedSlice()
+        position = start
+        while (stop is None or position < stop) and self.has_index(position):
+            streamed.append(self._consumed[position])
+            position += step
+        return streamed.items
+
+    def _fill(self, count: Optional[int]) -> None:
+        """
+        Consume items until there are count of them, or all if count is None
+        :param count:
+        :return:
+        """
+        if self.exhausted or (count is not None and count <= len(self._consumed)):
+            return
+
+        with self._lock:
+            if self.exhausted:
+                return
+            needed = None if count is None else count - len(self._consumed)
+            if needed is not None and needed <= 0:
+                return
+
+            consumed = len(self._consumed)
+            self._consumed.extend(islice(self._iterator, needed))
+            if needed is None or len(self._consumed) - consumed < needed:
+                self.exhausted = True
@@ -0,0 +1,50 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains a base class for stores in a local SQLite file.
+"""
+
+import os
+import sqlite3
+from threading import Lock
+
+
+class SqliteDatabase:
+    """
+    A local SQLite file, which can be shared by several
+    worker processes and survives restarts.
+
+    :path: str - path to the database file.
+    """
+
+    schema = ""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = Lock()
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Connections are not shared between processes,
+        so a new one is opened after fork.
+        :return:
+        """
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(self.schema)
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        """
+        :return:
+        """
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
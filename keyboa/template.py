@@ -0,0 +1,211 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains keyboard templates, which are compiled once
+and rendered for many records with different callback fields.
+"""
+
+from string import Formatter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+
+from keyboa.base_check import BaseCheck
+from keyboa.button import Button, build_button
+from keyboa.keyboard import Keyboa
+from keyboa.serializer import Serializer
+from keyboa.constants import (
+    BlockItems,
+    CallbackDataMarker,
+    callback_data_types,
+    MAXIMUM_CBD_LENGTH,
+)
+from keyboa.lazy_types import inline_button, inline_markup, is_button
+
+if TYPE_CHECKING:  # pragma: no cover
+    from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+FIELD_PLACEHOLDER = "\x00"
+
+
+class KeyboaTemplate(BaseCheck):
+    """
+    Markers may contain fields in str.format syntax, e.g. back_marker="&id={id}$".
+    Layout, texts and the static parts of callbacks are built and validated once.
+    Rendering only substitutes the fields and checks their length in bytes.
+    Literal braces in markers should be doubled, as in str.format.
+
+    Parameters are the same as for Keyboa.
+    """
+
+    def __init__(  # pylint: disable = R0913
+        self,
+        items: BlockItems,
+        *,
+        items_in_row: int = None,
+        front_marker: CallbackDataMarker = "",
+        back_marker: CallbackDataMarker = "",
+        copy_text_to_callback: Optional[bool] = True,
+        alignment: Union[bool, Iterable] = None,
+        alignment_reverse: Optional[bool] = None,
+        row_width: Optional[int] = None,
+    ) -> None:
+        front_marker = str(Button.get_checked_marker(front_marker))
+        back_marker = str(Button.get_checked_marker(back_marker))
+
+        self.fields: Dict[str, int] = {}
+        self._count_fields(front_marker)
+        self._count_fields(back_marker)
+
+        front_probe = self._probe(front_marker)
+        back_probe = self._probe(back_marker)
+
+        rows = Keyboa(
+            items=items,
+            items_in_row=items_in_row,
+            alignment=alignment,
+            alignment_reverse=alignment_reverse,
+            row_width=row_width,
+        ).layout(slice(None))
+
+        self._static_bytes = 0
+        self._rows: List[List[Tuple[str, Union[str, "InlineKeyboardButton"], str]]] = [
+            [
+                self._compiled_cell(
+                    item,
+                    front_marker,
+                    back_marker,
+                    front_probe,
+                    back_probe,
+                    copy_text_to_callback,
+                )
+                for item in row
+            ]
+            for row in rows
+        ]
+
+    def __call__(self, **fields) -> "InlineKeyboardMarkup":
+        return self.render(**fields)
+
+    def render(self, **fields) -> "InlineKeyboardMarkup":
+        """
+        :param fields: values of marker fields
+        :return: InlineKeyboardMarkup
+        """
+        fields = self._verified_fields(fields)
+        keyboard = inline_markup()
+        for row in self._rows:
+            keyboard.row(
+                *[
+                    inline_button(
+                        text=text, callback_data=callback.format_map(fields)
+                    )
+                    if isinstance(callback, str)
+                    else callback
+                    for text, callback, _fragment in row
+                ]
+            )
+        return keyboard
+
+    def render_json(self, **fields) -> str:
+        """
+        :param fields: values of marker fields
+        :return: the same as render(**fields).to_json()
+        """
+        fields = self._verified_fields(fields)
+        return Serializer.keyboard(
+            [
+                fragment + Serializer.button_end(callback.format_map(fields))
+                if isinstance(callback, str)
+                else fragment
+                for _text, callback, fragment in row
+            ]
+            for row in self._rows
+        )
+
+    def _verified_fields(self, fields: dict) -> dict:
+        """
+        :param fields:
+        :return: fields converted to strings
+        """
+        missing = set(self.fields) - set(fields)
+        if missing:
+            raise ValueError(f"Values for fields {sorted(missing)} are missing.")
+
+        converted = {}
+        variable_bytes = 0
+        for name, occurrences in self.fields.items():
+            value = fields[name]
+            if not isinstance(value, callback_data_types) or value is None:
+                raise TypeError(
+                    f"Field '{name}' cannot be {type(value)}. Only str or int allowed."
+                )
+            converted[name] = str(value)
+            variable_bytes += len(converted[name].encode()) * occurrences
+
+        if self._static_bytes + variable_bytes > MAXIMUM_CBD_LENGTH:
+            size_error_message = (
+                "The callback data cannot be more than "
+                f"{MAXIMUM_CBD_LENGTH} bytes for one button. "
+                f"The longest one would be {self._static_bytes + variable_bytes}"
+            )
+            raise ValueError(size_error_message)
+        return converted
+
+    def _compiled_cell(  # pylint: disable = R0913, R0917
+        self,
+        item,
+        front_marker: str,
+        back_marker: str,
+        front_probe: str,
+        back_probe: str,
+        copy_text_to_callback: Optional[bool],
+    ) -> Tuple[str, Union[str, "InlineKeyboardButton"], str]:
+        """
+        :return: text, callback format string (or a ready button for items
+            which are passed to telebot as is) and JSON fragment
+        """
+        if is_button(item) or (isinstance(item, dict) and item.get("text")):
+            button = build_button(item)
+            return button.text, button, button.to_json()
+
+        text, callback_data = Button.prepare(
+            item, front_probe, back_probe, copy_text_to_callback
+        )
+        raw_callback = callback_data[
+            len(front_probe) : len(callback_data) - len(back_probe)
+        ]
+        self._static_bytes = max(
+            self._static_bytes,
+            len(callback_data.encode()) - callback_data.count(FIELD_PLACEHOLDER),
+        )
+        callback = (
+            front_marker
+            + raw_callback.replace("{", "{{").replace("}", "}}")
+            + back_marker
+        )
+        return text, callback, Serializer.button_start(text)
+
+    def _count_fields(self, marker: str) -> None:
+        """
+        :param marker:
+        :return:
+        """
+        for _literal, name, format_spec, conversion in Formatter().parse(marker):
+            if name is None:
+                continue
+            if not name.isidentifier() or format_spec or conversion:
+                raise ValueError(
+                    f"Only named fields like '{{id}}' are allowed in markers. "
+                    f"You entered '{marker}'."
+                )
+            self.fields[name] = self.fields.get(name, 0) + 1
+
+    @staticmethod
+    def _probe(marker: str) -> str:
+        """
+        :param marker:
+        :return: marker with one-byte placeholders instead of fields
+        """
+        return "".join(
+            literal + ("" if name is None else FIELD_PLACEHOLDER)
+            for literal, name, _format_spec, _conversion in Formatter().parse(marker)
+        )
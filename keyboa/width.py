@@ -0,0 +1,77 @@
+# -*- coding:utf-8 -*-
+"""
+This module contains measuring of button texts and packing
+buttons into rows by their display width.
+"""
+
+from functools import lru_cache
+from typing import Iterable, Iterator, List
+from unicodedata import category, combining, east_asian_width
+
+from keyboa.constants import BUTTON_PADDING_WIDTH, MAXIMUM_ITEMS_IN_LINE
+
+ZERO_WIDTH_JOINER = "\u200d"
+EMOJI_PRESENTATION_SELECTOR = "\ufe0f"
+EMOJI_MODIFIERS = range(0x1F3FB, 0x1F400)
+
+
+@lru_cache(maxsize=4096)
+def display_width(text: str) -> int:
+    """
+    Approximate width of the text in monospace columns, as terminals
+    and mobile clients render it: East Asian wide and fullwidth characters
+    and emoji take two columns, combining and format characters take none.
+    Emoji sequences joined with ZWJ or modified with skin tones count as one emoji.
+    :param text:
+    :return:
+    """
+    width = 0
+    previous = 0
+    joined = False
+    for char in text:
+        if char == EMOJI_PRESENTATION_SELECTOR:
+            if previous == 1:
+                width += 1
+                previous = 2
+            continue
+        if char == ZERO_WIDTH_JOINER:
+            joined = True
+            continue
+        if joined or ord(char) in EMOJI_MODIFIERS:
+            joined = False
+            continue
+        if combining(char) or category(char) in ("Mn", "Me", "Cf"):
+            continue
+
+        previous = 2 if east_asian_width(char) in ("W", "F") else 1
+        width += previous
+    return width
+
+
+def packed_rows(
+    items: list,
+    texts: Iterable[str],
+    row_width: int,
+    items_in_row: int = MAXIMUM_ITEMS_IN_LINE,
+) -> Iterator[List]:
+    """
+    Greedy line breaking in a single pass: a new row is started when the next
+    button does not fit into row_width or the row already has items_in_row buttons.
+    A button wider than row_width takes a row alone.
+    Every button takes BUTTON_PADDING_WIDTH columns in addition to its text.
+    :param items:
+    :param texts: texts of the items in the same order
+    :param row_width: the maximum width of a row in columns
+    :param items_in_row: the maximum number of buttons in a row
+    :return:
+    """
+    row, used = [], 0
+    for item, text in zip(items, texts):
+        width = display_width(text) + BUTTON_PADDING_WIDTH
+        if row and (used + width > row_width or len(row) == items_in_row):
+            yield row
+            row, used = [], 0
+        row.append(item)
+        used += width
+    if row:
+        yield row
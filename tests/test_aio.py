@@ -0,0 +1,106 @@
+# -*- coding:utf-8 -*-
+"""
+Test for asyncio helpers
+"""
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa
+from keyboa.aio import AsyncItemSource, arender, arender_source
+
+
+async def numbers(count=None):
+    number = 0
+    while count is None or number < count:
+        yield number
+        number += 1
+
+
+@pytest.mark.parametrize("threshold", [0, 100])
+def test_arender_matches_slice(threshold):
+    keyboa = Keyboa(items=list(range(60)), alignment=True, front_marker="&n=")
+    keyboard = asyncio.run(arender(keyboa, slice(5, 37), threshold=threshold))
+    assert keyboard.to_dict() == keyboa(slice(5, 37)).to_dict()
+
+    serialized = asyncio.run(keyboa.arender(as_json=True))
+    assert serialized == keyboa(as_json=True)
+
+
+def test_arender_concurrently():
+    keyboa = Keyboa(items=list(range(100)), items_in_row=5)
+    expected = keyboa.to_json()
+
+    async def handlers():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return await asyncio.gather(
+                *[
+                    arender(keyboa, as_json=True, executor=executor, threshold=0)
+                    for _ in range(20)
+                ]
+            )
+
+    assert asyncio.run(handlers()) == [expected] * 20
+
+
+def test_arender_lazy_items_in_process_pool():
+    keyboa = Keyboa(items=(number for number in range(1000)), items_in_row=4)
+
+    async def render():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return await keyboa.arender(slice(10, 30), executor=executor)
+
+    keyboard = asyncio.run(render())
+    assert keyboard.to_dict() == Keyboa(
+        items=list(range(10, 30)), items_in_row=4
+    ).keyboard.to_dict()
+    assert keyboa.items.consumed == 30
+
+
+def test_arender_lazy_items_in_default_executor():
+    keyboa = Keyboa(items=(number for number in range(1000)), items_in_row=4)
+    keyboard = asyncio.run(keyboa.arender(slice(10, 30)))
+    assert keyboard.to_dict() == Keyboa(
+        items=list(range(10, 30)), items_in_row=4
+    ).keyboard.to_dict()
+    assert keyboa.items.consumed == 30
+
+    serialized = asyncio.run(keyboa.arender(slice(0, 8), as_json=True))
+    assert serialized == Keyboa(items=list(range(8)), items_in_row=4).to_json()
+
+
+def test_async_item_source():
+    async def collect():
+        source = AsyncItemSource(numbers())
+        assert await source.collect(slice(0, 10, 3)) == [0, 3, 6, 9]
+        assert source.consumed == 10
+        assert not source.exhausted
+
+        with pytest.raises(ValueError):
+            await source.collect(slice(5, None))
+        assert source.consumed == 106
+
+    asyncio.run(collect())
+
+    source = AsyncItemSource(numbers(5))
+    assert asyncio.run(source.collect(slice(-2, None))) == [3, 4]
+    assert source.exhausted
+
+
+def test_arender_source():
+    source = AsyncItemSource(numbers(50))
+
+    keyboard = asyncio.run(
+        arender_source(source, slice(10, 20), items_in_row=5, front_marker="&n=")
+    )
+    assert keyboard.to_dict() == Keyboa(
+        items=list(range(10, 20)), items_in_row=5, front_marker="&n="
+    ).keyboard.to_dict()
+    assert source.consumed == 20
+
+    serialized = asyncio.run(arender_source(numbers(3), as_json=True))
+    assert serialized == Keyboa(items=[0, 1, 2]).to_json()
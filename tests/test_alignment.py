@@ -0,0 +1,44 @@
+# -*- coding:utf-8 -*-
+"""
+Test for AlignmentPlanner object
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa.alignment import AlignmentPlanner
+from keyboa.constants import AUTO_ALIGNMENT_RANGE, MAXIMUM_ITEMS_IN_KEYBOARD
+
+
+def legacy_items_in_row(alignment_range, count):
+    for divider in alignment_range:
+        if not count % divider:
+            return divider
+    return None
+
+
+@pytest.mark.parametrize(
+    "alignment_range",
+    [
+        tuple(AUTO_ALIGNMENT_RANGE),
+        tuple(reversed(AUTO_ALIGNMENT_RANGE)),
+        (3, 5),
+        (7,),
+    ],
+)
+def test_table_matches_divider_loop(alignment_range):
+    table = AlignmentPlanner.table(alignment_range)
+    assert len(table) == MAXIMUM_ITEMS_IN_KEYBOARD + 1
+    for count in range(MAXIMUM_ITEMS_IN_KEYBOARD + 1):
+        assert table[count] == legacy_items_in_row(alignment_range, count)
+
+
+def test_table_is_shared():
+    assert AlignmentPlanner.table((3, 4)) is AlignmentPlanner.table((3, 4))
+
+
+def test_items_in_row_beyond_table():
+    assert AlignmentPlanner.items_in_row((3, 5), 105) == 3
+    assert AlignmentPlanner.items_in_row((4,), 101) is None
@@ -0,0 +1,68 @@
+# -*- coding:utf-8 -*-
+"""
+Test for batch rendering
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from telebot.types import InlineKeyboardButton
+from keyboa import Keyboa
+
+ITEMS = ["Edit", ("Delete", "del"), {"Pin": 1}, {"text": "Link", "url": "https://t.me"}]
+
+
+def test_render_many_is_the_same_as_keyboa():
+    keyboa = Keyboa(items=ITEMS, front_marker="&a=", items_in_row=2)
+    variants = [
+        {"back_marker": f"&user={user}$"} for user in range(5)
+    ] + [{"front_marker": "f", "back_marker": 7}, {}, {"items": [1, 2, 3]}]
+
+    result = list(keyboa.render_many(variants))
+    serialized = list(keyboa.render_many(iter(variants), as_json=True))
+    assert len(result) == len(serialized) == len(variants)
+
+    for variant, keyboard, keyboard_json in zip(variants, result, serialized):
+        expected = Keyboa(**{**keyboa.options, "items": ITEMS, **variant}).keyboard
+        assert keyboard.to_json() == expected.to_json()
+        assert keyboard_json == expected.to_json()
+
+
+def test_render_many_validation():
+    keyboa = Keyboa(items=["a", "bb"], back_marker="_b", copy_text_to_callback=False)
+    markers = list(keyboa.render_many([{"front_marker": "f"}]))
+    assert markers[0].to_dict()["inline_keyboard"][0][0]["callback_data"] == "f_b"
+
+    with pytest.raises(ValueError) as _:
+        next(keyboa.render_many([{"back_marker": ""}]))
+
+    keyboa = Keyboa(items=["a", "bb"])
+    next(keyboa.render_many([{"back_marker": "x" * 62}]))
+    with pytest.raises(ValueError) as _:
+        next(keyboa.render_many([{"back_marker": "x" * 63}]))
+    with pytest.raises(TypeError) as _:
+        next(keyboa.render_many([{"back_marker": [1]}]))
+    with pytest.raises(ValueError) as _:
+        next(keyboa.render_many([{"alignment": True}]))
+
+
+def test_render_many_is_updated_with_attributes():
+    keyboa = Keyboa(items=[1, 2])
+    assert next(keyboa.render_many([{}], as_json=True)) == keyboa.to_json()
+    keyboa.items = [InlineKeyboardButton(text="t", callback_data="c")]
+    assert next(keyboa.render_many([{}], as_json=True)) == keyboa.to_json()
+
+
+def test_render_many_in_processes():
+    keyboa = Keyboa(items=ITEMS, items_in_row=3)
+    variants = [{"back_marker": f"&user={user}$"} for user in range(25)]
+    expected = list(keyboa.render_many(variants, as_json=True))
+    result = list(
+        keyboa.render_many(variants, as_json=True, processes=2, chunksize=4)
+    )
+    assert result == expected
+
+    keyboards = keyboa.render_many(variants[:3], processes=2)
+    assert [keyboard.to_json() for keyboard in keyboards] == expected[:3]
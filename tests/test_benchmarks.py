@@ -0,0 +1,22 @@
+# -*- coding:utf-8 -*-
+"""
+Smoke test for the benchmark suite
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../benchmarks" % os.path.dirname(os.path.abspath(__file__)))
+
+import suite
+
+
+def test_every_scenario_runs():
+    for function in suite.scenarios().values():
+        function()
+
+
+def test_compared_with_baseline():
+    baseline = {"fast": 100.0, "slow": 100.0}
+    results = {"fast": 110.0, "slow": 130.0, "new": 50.0}
+    assert suite.compared(results, baseline, threshold=0.2) == ["slow"]
+    assert suite.compared(results, baseline, threshold=0.5) == []
@@ -9,7 +9,7 @@ sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
 
 import pytest
 from telebot.types import InlineKeyboardButton
-from keyboa import Button
+from keyboa import Button, ButtonSpec, build_button
 
 BUTTON_SOURCE_TYPES_ACCEPTABLE_WITH_COPY_TO_CALLBACK = (
     2,
@@ -289,3 +289,44 @@ def test_button_property():
 def test_button_call_method():
     btn = Button(button_data="button_text", copy_text_to_callback=True)
     assert isinstance(btn(), InlineKeyboardButton)
+
+
+@pytest.mark.parametrize(
+    "button_data", BUTTON_SOURCE_TYPES_ACCEPTABLE_WITH_COPY_TO_CALLBACK + COMBO_BUTTON_DATA
+)
+def test_build_button_is_the_same_as_generate(button_data):
+    expected = Button(button_data=button_data, front_marker="f_").generate()
+    button = build_button(button_data, front_marker="f_")
+    assert button.to_dict() == expected.to_dict()
+
+    spec = ButtonSpec.from_data(button_data, front_marker="f_")
+    assert spec.to_dict() == expected.to_dict()
+    assert spec.to_json() == expected.to_json()
+    assert spec.to_button().to_dict() == expected.to_dict()
+
+
+@pytest.mark.parametrize("button_data", UNACCEPTABLE_BUTTON_SOURCE_TYPES)
+def test_build_button_unacceptable_source_types(button_data):
+    with pytest.raises(Exception) as _:
+        build_button(button_data)
+    with pytest.raises(Exception) as _:
+        ButtonSpec.from_data(button_data)
+
+
+def test_button_spec_from_button():
+    button = InlineKeyboardButton(text="text", url="https://t.me")
+    spec = ButtonSpec.from_data(button)
+    assert spec.to_button() is button
+    assert spec.to_json() == button.to_json()
+    assert build_button(button) is button
+
+
+def test_button_spec_is_immutable():
+    spec = ButtonSpec.from_data(("text", "callback"))
+    assert spec == ButtonSpec("text", "callback")
+    assert hash(spec) == hash(ButtonSpec("text", "callback"))
+    assert not hasattr(spec, "__dict__")
+    with pytest.raises(AttributeError) as _:
+        spec.text = "other"
+    with pytest.raises(AttributeError) as _:
+        del spec.callback_data
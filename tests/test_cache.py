@@ -0,0 +1,33 @@
+# -*- coding:utf-8 -*-
+"""
+Test for LRUCache object
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import LRUCache
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert tuple(cache.info) == (2, 1, 1, 2, 2)
+
+    cache.clear()
+    assert tuple(cache.info) == (0, 0, 0, 2, 0)
+
+
+@pytest.mark.parametrize("maxsize", [0, -1, "1", None])
+def test_lru_cache_wrong_size(maxsize):
+    with pytest.raises(ValueError) as _:
+        LRUCache(maxsize=maxsize)
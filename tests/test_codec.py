@@ -0,0 +1,110 @@
+# -*- coding:utf-8 -*-
+"""
+Test for callback codec and stores
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa
+from keyboa.codec import (
+    CallbackCodec,
+    CallbackStore,
+    MemoryCallbackStore,
+    SqliteCallbackStore,
+)
+
+PAIRS = {"city": "London", "street": "Baker St", "house": 221, "shift": -70000}
+
+
+@pytest.mark.parametrize("keys", [(), ("street", "city", "house")])
+def test_codec_round_trip(keys):
+    codec = CallbackCodec(keys)
+    data = codec.encode(PAIRS)
+    assert len(data) <= 64
+    assert codec.decode(data) == PAIRS
+    assert list(codec.decode(data)) == list(PAIRS)
+    assert codec.decode(codec.encode(list(PAIRS.items()))) == PAIRS
+
+
+def test_codec_keys_make_data_shorter():
+    assert len(CallbackCodec(["street", "city"]).encode(PAIRS)) < len(
+        CallbackCodec().encode(PAIRS)
+    )
+
+
+def test_codec_extend():
+    codec = CallbackCodec(["city", "street", "apartments"])
+    data = codec.encode({"city": "London"})
+    data = codec.extend(data, {"street": "Baker Street"})
+    data = codec.extend(data, [("apartments", "221b")])
+    assert codec.decode(data) == {
+        "city": "London",
+        "street": "Baker Street",
+        "apartments": "221b",
+    }
+
+
+def test_codec_errors():
+    codec = CallbackCodec()
+    with pytest.raises(TypeError) as _:
+        codec.encode({"a": None})
+    with pytest.raises(TypeError) as _:
+        codec.encode({"a": True})
+    with pytest.raises(TypeError) as _:
+        codec.encode({1: "a"})
+    with pytest.raises(ValueError) as _:
+        codec.encode({"long": "x" * 64})
+    with pytest.raises(ValueError) as _:
+        codec.decode("&city=London$")
+    with pytest.raises(ValueError) as _:
+        codec.decode("~Bw")
+    for malformed in ("~!!", "~a b", "~AA+/", "~AA=="):
+        with pytest.raises(ValueError) as _:
+            codec.decode(malformed)
+    with pytest.raises(ValueError) as _:
+        codec.decode("!token")
+
+
+@pytest.mark.parametrize("store_type", ["memory", "sqlite"])
+def test_codec_store(store_type, tmp_path):
+    store = (
+        MemoryCallbackStore(maxsize=2)
+        if store_type == "memory"
+        else SqliteCallbackStore(str(tmp_path / "callbacks.sqlite"))
+    )
+    codec = CallbackCodec(store=store)
+    pairs = {"street": "Baker Street" * 5, "city": "London"}
+
+    data = codec.encode(pairs)
+    assert data.startswith("!")
+    assert len(data) == 13
+    assert data == codec.encode(pairs)
+    assert codec.decode(data) == pairs
+    assert codec.encode({"city": "London"}).startswith("~")
+
+    with pytest.raises(ValueError) as _:
+        codec.decode("!" + "A" * 12)
+
+    keyboa = Keyboa(items=[("Next", data)])
+    assert keyboa.to_dict()["inline_keyboard"][0][0]["callback_data"] == data
+
+
+def test_incomplete_store():
+    class PutOnlyStore(CallbackStore):
+        def put(self, payload):
+            return self.token(payload)
+
+    with pytest.raises(TypeError) as _:
+        PutOnlyStore()
+
+
+def test_sqlite_store_is_shared(tmp_path):
+    path = str(tmp_path / "callbacks.sqlite")
+    token = SqliteCallbackStore(path).put("~payload")
+    store = SqliteCallbackStore(path)
+    assert store.get(token) == "~payload"
+    store.close()
+    assert store.get(token) == "~payload"
@@ -0,0 +1,108 @@
+# -*- coding:utf-8 -*-
+"""
+Test for CompiledKeyboa object
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa.base_check import BaseCheck
+from keyboa.button_check import ButtonCheck
+from telebot.types import InlineKeyboardButton
+from keyboa import Keyboa, CompiledKeyboa
+
+
+@pytest.mark.parametrize(
+    "items, options",
+    [
+        (list(range(23)), {"alignment": True, "front_marker": "&n="}),
+        (list(range(23)), {"items_in_row": 4, "back_marker": "$"}),
+        (["Yes", "No", "Maybe", "北京", "Shanghai"], {"row_width": 16}),
+        (
+            [[1, 2], 3, ("text", "data"), {"a": "b"}, {"text": "url", "url": "t.me"}],
+            {"front_marker": "&"},
+        ),
+    ],
+)
+def test_compiled_renders_as_keyboa(items, options):
+    keyboa = Keyboa(items=items, **options)
+    compiled = keyboa.compile()
+
+    assert compiled.keyboard.to_dict() == keyboa.keyboard.to_dict()
+    assert compiled(as_json=True) == keyboa(as_json=True)
+    assert compiled.to_dict(slice(1, 4)) == keyboa.to_dict(slice(1, 4))
+
+
+def test_compiled_is_frozen():
+    items = [[1, 2], 3]
+    compiled = Keyboa(items=items).compile()
+    items[0].append(4)
+
+    assert compiled.to_dict() == {
+        "inline_keyboard": [
+            [{"text": "1", "callback_data": "1"}, {"text": "2", "callback_data": "2"}],
+            [{"text": "3", "callback_data": "3"}],
+        ]
+    }
+    with pytest.raises(AttributeError):
+        compiled.debug = True
+
+
+def test_compiled_validates_once():
+    with pytest.raises(ValueError):
+        Keyboa(items=[("text", "x" * 65)]).compile()
+    with pytest.raises(TypeError):
+        Keyboa(items=[[1.5]]).compile()
+    with pytest.raises(TypeError) as error:
+        Keyboa(items=[[1, 2], 3], items_in_row=2).compile()
+    with pytest.raises(TypeError) as expected:
+        Keyboa(items=[[1, 2], 3], items_in_row=2).keyboard
+    assert str(error.value) == str(expected.value)
+
+
+def test_compiled_skips_checks(monkeypatch):
+    keyboa = Keyboa(items=list(range(10)) + [("a", "b")], items_in_row=3)
+    compiled = keyboa.compile()
+    expected = keyboa.to_dict()
+
+    def failed(*args, **kwargs):
+        raise AssertionError("Compiled keyboards should not be checked")
+
+    for check in (BaseCheck, ButtonCheck):
+        for name in dir(check):
+            if name.startswith("is_"):
+                monkeypatch.setattr(check, name, failed)
+
+    assert compiled.to_dict() == expected
+    assert compiled.keyboard.to_dict() == expected
+    assert compiled.render("json", slice(2, 5)) == compiled.to_json(slice(2, 5))
+
+
+def test_compiled_rows_are_immutable():
+    compiled = Keyboa(items=[[1, 2], 3]).compile()
+    rows = compiled.rows()
+    assert isinstance(rows, tuple) and all(isinstance(row, tuple) for row in rows)
+    with pytest.raises(TypeError):
+        rows[0][0] = rows[1][0]
+    assert compiled.rows() is rows
+    assert compiled.ir() == Keyboa(items=[[1, 2], 3]).ir()
+
+
+def test_compiled_debug(monkeypatch):
+    keyboa = Keyboa(items=list(range(10)), items_in_row=5)
+    assert not keyboa.compile().is_debug
+    assert keyboa.compile(debug=True).is_debug
+
+    monkeypatch.setattr(CompiledKeyboa, "debug", True)
+    compiled = keyboa.compile()
+    assert compiled.is_debug
+    assert compiled.keyboard.to_dict() == keyboa.keyboard.to_dict()
+    assert compiled(slice(2, 4), as_json=True) == keyboa(slice(2, 4), as_json=True)
+
+
+def test_compiled_keeps_buttons():
+    button = InlineKeyboardButton(text="url", url="https://t.me")
+    compiled = Keyboa(items=[button, "next"], items_in_row=2).compile()
+    assert compiled.keyboard.keyboard[0][0] is button
@@ -0,0 +1,65 @@
+# -*- coding:utf-8 -*-
+"""
+Test for keyboard diff
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa, KeyboardDiff, diff_keyboards
+from keyboa.diff import CellChange
+
+
+def test_unchanged_keyboards():
+    keyboa = Keyboa(items=[["☐ milk", "☐ eggs"], "Done"], front_marker="&")
+    same = Keyboa(items=[["☐ milk", "☐ eggs"], "Done"], front_marker="&")
+
+    assert diff_keyboards(keyboa, same).unchanged
+    assert diff_keyboards(keyboa.keyboard, same.keyboard).unchanged
+    assert diff_keyboards(keyboa.to_dict(), same).unchanged
+    assert not diff_keyboards(keyboa.keyboard, same.keyboard)
+    assert str(KeyboardDiff()) == ""
+
+
+def test_changed_cells():
+    old = Keyboa(items=[["☐ milk", "☐ eggs"], "Done"]).keyboard
+    new = Keyboa(items=[["☐ milk", ("☑ eggs", "☐ eggs")], "Done", "Clear"]).keyboard
+
+    diff = diff_keyboards(old, new)
+    assert not diff.unchanged
+    assert list(diff) == [
+        CellChange(
+            0,
+            1,
+            {"text": "☐ eggs", "callback_data": "☐ eggs"},
+            {"text": "☑ eggs", "callback_data": "☐ eggs"},
+        ),
+        CellChange(2, 0, None, {"text": "Clear", "callback_data": "Clear"}),
+    ]
+    assert len(diff_keyboards(new, old)) == 2
+    assert str(diff).startswith("[0][1] ")
+
+
+def test_diff_of_lazy_keyboards():
+    old = Keyboa(items=iter(range(4)), items_in_row=2)
+    new = Keyboa(items=iter(range(4)), items_in_row=2)
+    assert diff_keyboards(old, new).unchanged
+
+
+def test_diff_with_no_keyboard():
+    keyboard = Keyboa(items=[1, 2], items_in_row=2)
+    added = diff_keyboards(None, keyboard)
+    assert [(change.row, change.column, change.old) for change in added] == [
+        (0, 0, None),
+        (0, 1, None),
+    ]
+    removed = diff_keyboards(keyboard.keyboard, None)
+    assert [change.new for change in removed] == [None, None]
+    assert diff_keyboards(None, None).unchanged
+
+
+def test_diff_of_unknown_type():
+    with pytest.raises(TypeError):
+        diff_keyboards("keyboard", Keyboa(items=[1]))
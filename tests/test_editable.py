@@ -0,0 +1,123 @@
+# -*- coding:utf-8 -*-
+"""
+Test for EditableKeyboard object
+"""
+import logging
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import EditableKeyboard, Keyboa
+
+
+def texts(editable):
+    return [
+        [button["text"] for button in row]
+        for row in editable.keyboard.to_dict()["inline_keyboard"]
+    ]
+
+
+def test_editable_initial_keyboard():
+    items = [["☐ milk", "☐ eggs"], "Done"]
+    editable = EditableKeyboard(items, front_marker="&toggle=")
+    assert editable.keyboard.to_dict() == Keyboa(
+        items=[["☐ milk", "☐ eggs"], "Done"], front_marker="&toggle="
+    ).keyboard.to_dict()
+    assert len(editable) == 3
+    assert editable.rows == 2
+    assert not editable.is_dirty
+
+
+def test_editable_set_button():
+    editable = EditableKeyboard([["☐ milk", "☐ eggs"], "Done"])
+    untouched = editable[0, 1]
+    editable.set_button(0, 0, ("☑ milk", "milk"))
+
+    assert editable.dirty == {(0, 0)}
+    assert editable[0, 0].callback_data == "milk"
+    assert editable[0, 1] is untouched
+
+    markup = editable.commit()
+    assert texts(editable) == [["☑ milk", "☐ eggs"], ["Done"]]
+    assert markup.to_dict() == editable.keyboard.to_dict()
+    assert not editable.is_dirty
+
+    editable.set_button(0, 0, ("☑ milk", "milk"))
+    editable.set_button(1, 0, "Done")
+    assert not editable.is_dirty
+
+
+def test_editable_insert_and_remove():
+    editable = EditableKeyboard([[1, 2, 3], [4]])
+    editable.insert_button(0, 1, "x")
+    assert texts(editable) == [["1", "x", "2", "3"], ["4"]]
+    assert editable.dirty == {(0, 1), (0, 2), (0, 3)}
+    editable.commit()
+
+    editable.insert_button(-1, None, "y")
+    assert editable.dirty == {(1, 1)}
+    assert editable.remove_button(0, -1).text == "3"
+    assert len(editable) == 5
+
+    editable.commit()
+    editable.remove_button(1, 0)
+    editable.remove_button(1, 0)
+    assert texts(editable) == [["1", "x", "2"]]
+    assert editable.dirty == {(1, 0), (1, 1)}
+    assert len(editable) == 3
+
+
+def test_editable_rows():
+    editable = EditableKeyboard([[1, 2, 3], [4]])
+    editable.insert_row(0, ["new"])
+    assert texts(editable) == [["new"], ["1", "2", "3"], ["4"]]
+    assert (0, 2) in editable.dirty
+
+    editable.replace_row(1, ["a", "b"])
+    editable.remove_row(-1)
+    editable.insert_row(None, "last")
+    assert texts(editable) == [["new"], ["a", "b"], ["last"]]
+    assert len(editable) == 4
+
+
+def test_editable_limits():
+    editable = EditableKeyboard([list(range(8))] + [[index] for index in range(92)])
+    assert len(editable) == 100
+    with pytest.raises(ValueError):
+        editable.insert_button(1, 0, "x")
+    with pytest.raises(ValueError):
+        editable.insert_button(0, 0, "x")
+    with pytest.raises(ValueError):
+        editable.replace_row(1, ["a", "b"])
+    with pytest.raises(ValueError):
+        editable.replace_row(0, list(range(9)))
+
+    editable.replace_row(0, ["a", "b"])
+    editable.insert_row(0, list(range(6)))
+    assert len(editable) == 100
+    with pytest.raises(ValueError):
+        EditableKeyboard(["only"]).remove_row(0)
+    with pytest.raises(IndexError):
+        editable.set_button(0, 6, "x")
+    with pytest.raises(IndexError):
+        editable.set_button(200, 0, "x")
+
+
+def test_editable_from_markup(caplog):
+    markup = Keyboa(
+        items=[("Like", "like"), ("Dislike", "dislike")], items_in_row=2
+    ).keyboard
+    caplog.set_level(logging.WARNING, logger="TeleBot")
+    editable = EditableKeyboard.from_markup(markup, front_marker="&vote=")
+    assert "deprecated" not in caplog.text
+    editable.set_button(0, 0, ("Like 1", "like"))
+    assert editable.commit().to_dict() == {
+        "inline_keyboard": [
+            [
+                {"text": "Like 1", "callback_data": "&vote=like"},
+                {"text": "Dislike", "callback_data": "dislike"},
+            ]
+        ]
+    }
@@ -0,0 +1,90 @@
+# -*- coding:utf-8 -*-
+"""
+Test for Keyboa.fingerprint()
+"""
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa
+from keyboa import base
+
+ITEMS = [[1, 2], ("a", "b"), {"c": "d"}, {"text": "e", "url": "https://t.me"}]
+
+
+def test_fingerprint_is_stable():
+    keyboa = Keyboa(items=ITEMS, front_marker="&")
+    assert keyboa.fingerprint() == Keyboa(items=ITEMS, front_marker="&").fingerprint()
+    assert len(keyboa.fingerprint()) == 32
+    assert Keyboa(items=[1]).fingerprint() != Keyboa(items=["1"]).fingerprint()
+
+    script = (
+        "from keyboa import Keyboa; "
+        f"print(Keyboa(items={ITEMS!r}, front_marker='&').fingerprint())"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd="%s/../" % os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, "PYTHONHASHSEED": "123"},
+    ).stdout.strip()
+    assert output == keyboa.fingerprint()
+
+
+def test_fingerprint_ignores_option_sequence_type():
+    fingerprint = Keyboa(items=list(range(10)), alignment=[2, 3]).fingerprint()
+    assert Keyboa(items=list(range(10)), alignment=(2, 3)).fingerprint() == fingerprint
+    assert Keyboa(items=list(range(10)), alignment=range(2, 4)).fingerprint() == (
+        fingerprint
+    )
+    assert Keyboa(items=[[1, 2]]).fingerprint() != Keyboa(items=[(1, 2)]).fingerprint()
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [
+        ("items", ITEMS[:-1]),
+        ("items_in_row", 2),
+        ("front_marker", "&&"),
+        ("back_marker", "$"),
+        ("copy_text_to_callback", False),
+        ("alignment", True),
+        ("alignment_reverse", True),
+        ("row_width", 20),
+    ],
+)
+def test_fingerprint_follows_setters(attribute, value):
+    keyboa = Keyboa(items=ITEMS, front_marker="&")
+    fingerprint = keyboa.fingerprint()
+    setattr(keyboa, attribute, value)
+    assert keyboa.fingerprint() != fingerprint
+
+
+def test_fingerprint_is_incremental(monkeypatch):
+    hashed = []
+    digest = base.digest
+    monkeypatch.setattr(
+        base,
+        "digest",
+        lambda value, *args: hashed.append(value) or digest(value, *args),
+    )
+
+    keyboa = Keyboa(items=ITEMS)
+    keyboa.fingerprint()
+    keyboa.fingerprint()
+    assert len(hashed) == len(base.FINGERPRINTED)
+
+    keyboa.back_marker = "$"
+    keyboa.fingerprint()
+    assert hashed[-1] == "$"
+    assert len(hashed) == len(base.FINGERPRINTED) + 1
+
+
+def test_fingerprint_of_lazy_items():
+    with pytest.raises(TypeError):
+        Keyboa(items=iter(range(3))).fingerprint()
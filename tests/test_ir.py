@@ -0,0 +1,120 @@
+# -*- coding:utf-8 -*-
+"""
+Test for the immutable keyboard representation
+"""
+import os
+import sys
+from itertools import count
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa, KeyboardIR
+
+
+def test_ir_is_immutable():
+    keyboard = Keyboa(items=list(range(5)), items_in_row=2).ir()
+    assert isinstance(keyboard.rows, tuple)
+    assert all(isinstance(row, tuple) for row in keyboard.rows)
+    with pytest.raises(AttributeError):
+        keyboard.rows = ()
+
+
+def test_ir_shares_buttons_between_slices():
+    keyboa = Keyboa(items=list(range(10)), items_in_row=3, cache_markup=True)
+    full = keyboa.ir()
+    part = keyboa.ir(slice(3, 6))
+    assert keyboa.ir() is full
+    assert part.rows[0][0] is full.rows[1][0]
+    assert [len(row) for row in part.rows] == [3]
+
+
+def test_ir_buttons_are_interned():
+    first = Keyboa(items=["a", "b"], front_marker="&").ir()
+    second = Keyboa(items=[["a"], "c"], front_marker="&").ir()
+    assert first.rows[0][0] is second.rows[0][0]
+
+
+def test_ir_preformatted_rows_are_not_copied():
+    items = [[1, 2], 3]
+    keyboa = Keyboa(items=items, cache_markup=True)
+    rows = keyboa.ir().rows
+    assert rows == keyboa.ir(slice(None)).rows
+    assert rows[0] is keyboa._ir_cells[0]
+    assert [len(row) for row in rows] == [2, 1]
+    assert items == [[1, 2], 3]
+
+
+def test_ir_of_endless_source():
+    keyboa = Keyboa(items=(number for number in count()), items_in_row=4)
+    keyboard = keyboa.ir(slice(4, 12))
+    assert keyboard == Keyboa(items=list(range(4, 12)), items_in_row=4).ir()
+    assert keyboa.items.consumed == 12
+
+
+@pytest.mark.parametrize("cache_markup", [False, True])
+def test_ir_verifies_only_the_slice(cache_markup):
+    keyboa = Keyboa(items=[1, 2, ("x", "y" * 70)], cache_markup=cache_markup)
+    assert keyboa.to_json(slice(0, 2)) == keyboa.slice(slice(0, 2)).to_json()
+    assert sorted(keyboa._ir_cells) == ([0, 1] if cache_markup else [])
+    with pytest.raises(ValueError):
+        keyboa.to_json()
+    with pytest.raises(ValueError):
+        keyboa.keyboard
+
+
+def test_ir_follows_items_changed_in_place():
+    keyboa = Keyboa(items=["a", "b", "c"], items_in_row=2)
+    keyboa.to_json()
+    keyboa.items.append("d")
+    keyboa.items[0] = "z"
+
+    expected = keyboa.keyboard
+    assert keyboa.ir() is not keyboa.ir()
+    assert keyboa.to_json() == expected.to_json()
+    assert keyboa(as_json=True) == expected.to_json()
+    assert keyboa.render("dict") == expected.to_dict()
+    assert [[spec.text for spec in row] for row in keyboa.spec_rows()] == [
+        ["z", "b"],
+        ["c", "d"],
+    ]
+
+
+def test_ir_cache_is_bounded():
+    keyboa = Keyboa(items=list(range(20)), cache_markup=True)
+    for start in range(20):
+        for stop in range(start + 1, 21):
+            keyboa.ir(slice(start, stop))
+    assert len(keyboa._irs) == keyboa._irs.maxsize
+
+
+def test_ir_slice_and_combine_share_rows():
+    first = Keyboa(items=list(range(4)), items_in_row=2).ir()
+    second = Keyboa(items=["a", "b"], items_in_row=1).ir()
+    combined = KeyboardIR.combine((first, None, second))
+    assert combined.size == 6
+    assert combined.rows[0] is first.rows[0]
+    assert combined.rows[2] is second.rows[0]
+    assert (first + second) == combined
+    assert combined[2:].rows == second.rows
+    assert combined[2:].rows[0] is second.rows[0]
+
+
+def test_ir_combine_limits():
+    with pytest.raises(ValueError):
+        KeyboardIR.combine([None])
+    with pytest.raises(TypeError):
+        KeyboardIR.combine([[1]])
+    keyboard = Keyboa(items=list(range(100)), items_in_row=8).ir()
+    with pytest.raises(ValueError):
+        KeyboardIR.combine((keyboard, keyboard))
+    with pytest.raises(TypeError):
+        keyboard[0]
+
+
+def test_ir_render():
+    keyboa = Keyboa(items=list(range(5)), items_in_row=2)
+    keyboard = keyboa.ir()
+    assert keyboard.to_dict() == keyboa.to_dict()
+    assert keyboard.to_json() == keyboa.to_json()
+    assert keyboard.render("dict") == keyboa.render("dict")
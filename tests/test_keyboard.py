@@ -9,6 +9,7 @@ sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
 
 import pytest
 from keyboa.keyboard import Keyboa
+from keyboa.cache import LRUCache
 from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 
@@ -39,6 +40,42 @@ def test_keyboards_is_multi_keyboards():
         Keyboa.combine(keyboards=(kb_1, 1))
 
 
+def test_combine_generator_of_keyboards():
+    kb_1 = Keyboa(items=list(range(0, 4)), items_in_row=2).keyboard
+    kb_2 = Keyboa(items=[["a", "b"], "c"]).keyboard
+
+    result = Keyboa.combine(keyboard for keyboard in (kb_1, None, kb_2))
+    assert result.to_dict() == {
+        "inline_keyboard": kb_1.to_dict()["inline_keyboard"]
+        + kb_2.to_dict()["inline_keyboard"]
+    }
+    assert result.keyboard[0] is not kb_1.keyboard[0]
+    assert result.keyboard[0][0] is kb_1.keyboard[0][0]
+
+    with pytest.raises(ValueError):
+        Keyboa.combine(keyboards=(None, None))
+
+
+def test_combine_json():
+    k1 = Keyboa(items=list(range(0, 4)), items_in_row=2)
+    k2 = Keyboa(
+        items=[("a", "1"), {"text": "b", "url": "https://t.me", "callback_data": "2"}]
+    )
+    expected = Keyboa.combine((k1.keyboard, k2.keyboard)).to_json()
+
+    assert Keyboa.combine_json((k1.to_json(), None, k2.keyboard.to_json())) == expected
+    assert Keyboa.combine_json(iter([k1(as_json=True)])) == k1.to_json()
+    assert Keyboa.combine_json() == InlineKeyboardMarkup().to_json()
+
+    with pytest.raises(ValueError):
+        Keyboa.combine_json((None, InlineKeyboardMarkup().to_json()))
+    with pytest.raises(ValueError):
+        Keyboa.combine_json('{"keyboard": []}')
+    with pytest.raises(ValueError):
+        Keyboa.combine_json((k1.to_json(), Keyboa(items=list(range(97))).to_json()))
+    assert Keyboa.combine_json((k1.to_json(), Keyboa(items=list(range(96))).to_json()))
+
+
 def test_not_keyboard_for_merge():
     """
 
@@ -696,3 +733,67 @@ def test_kb_is_callable():
     assert keyboa.keyboard.to_json() == keyboa().to_json() == keyboa.slice().to_json()
     assert keyboa.slice(slice(3)).to_json() == keyboa(slice(3)).to_json()
     assert keyboa.slice(slice(2, 4, 2)).to_json() == keyboa(slice(2, 4, 2)).to_json()
+
+
+@pytest.mark.parametrize("items_in_row", [1, 3, 5, 8])
+def test_chunked(items_in_row):
+    items = list(range(23))
+    rows = list(Keyboa.chunked(items, items_in_row))
+    assert [item for row in rows for item in row] == items
+    assert all(len(row) == items_in_row for row in rows[:-1])
+    assert 0 < len(rows[-1]) <= items_in_row
+
+
+def test_button_cache():
+    cache = LRUCache(maxsize=4)
+    items = [1, "1", True, (2, "two"), {"three": 3}, {"text": "four", "url": "x.y"}]
+
+    keyboa = Keyboa(items=items, front_marker="f_", button_cache=cache)
+    expected = Keyboa(items=items, front_marker="f_").keyboard.to_json()
+    assert keyboa.keyboard.to_json() == expected
+    assert cache.info.misses == 6
+    assert cache.info.evictions == 2
+
+    keyboa.items = items[2:]
+    assert keyboa.keyboard.to_json() == Keyboa(items=items[2:], front_marker="f_").keyboard.to_json()
+    assert cache.info.hits == 4
+
+    keyboa.back_marker = "_b"
+    assert keyboa.keyboard.to_dict()["inline_keyboard"][0][0]["callback_data"] == "f_True_b"
+
+
+def test_button_cache_unhashable_item():
+    keyboa = Keyboa(items=[("a", "b")], button_cache=LRUCache())
+    assert keyboa.button_cache_key({"text": "a", "url": ["unhashable"]}) is None
+    assert keyboa.button_cache_key(InlineKeyboardButton(text="a")) is None
+
+
+def test_button_cache_wrong_type():
+    with pytest.raises(TypeError) as _:
+        Keyboa(items=[1], button_cache={})
+
+
+def test_cache_markup():
+    keyboa = Keyboa(items=list(range(12)), items_in_row=3, cache_markup=True)
+    assert keyboa.keyboard is keyboa() is keyboa.slice()
+    assert keyboa.slice(slice(3)) is keyboa(slice(3))
+    assert keyboa.slice(slice(3)) is not keyboa.slice(slice(4))
+
+    serialized = keyboa(as_json=True)
+    assert serialized is keyboa.slice(as_json=True)
+    assert serialized == Keyboa(items=list(range(12)), items_in_row=3)(as_json=True)
+
+    keyboard = keyboa.keyboard
+    keyboa.items_in_row = 4
+    assert keyboa.keyboard is not keyboard
+    assert len(keyboa.keyboard.to_dict()["inline_keyboard"]) == 3
+    assert keyboa(as_json=True) != serialized
+
+
+def test_cache_markup_disabled():
+    keyboa = Keyboa(items=list(range(12)))
+    assert keyboa.keyboard is not keyboa.keyboard
+    assert keyboa(as_json=True) == keyboa.keyboard.to_json()
+
+    with pytest.raises(TypeError) as _:
+        Keyboa(items=list(range(12)), cache_markup="yes")
@@ -0,0 +1,86 @@
+# -*- coding:utf-8 -*-
+"""
+Test that keyboa imports pyTelegramBotAPI only when it is needed
+"""
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+import keyboa
+from keyboa.lazy_types import inline_button, is_button, is_markup
+
+
+def loaded_modules(script: str, package: str = "telebot") -> list:
+    """
+    :param script: code which is run in a fresh interpreter
+    :param package: top level package of modules to list
+    :return: names of imported modules of the package
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {script}; "
+            f"print(' '.join(m for m in sys.modules if m.split('.')[0] == {package!r}))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd="%s/../" % os.path.dirname(os.path.abspath(__file__)),
+    )
+    return output.stdout.split()
+
+
+def test_import_does_not_load_telebot():
+    assert loaded_modules("import keyboa") == []
+
+
+def test_json_does_not_load_telebot():
+    script = (
+        "from keyboa import Keyboa; "
+        "keyboa = Keyboa(items=[1, ('a', 'b'), {'c': 'd'}], items_in_row=2); "
+        "keyboa.to_json(); keyboa.to_dict(); keyboa(as_json=True); "
+        "keyboa.fingerprint(); keyboa.compile().to_json(); keyboa.render('dict')"
+    )
+    assert loaded_modules(script) == []
+
+
+def test_import_does_not_load_multiprocessing():
+    assert loaded_modules("import keyboa.keyboard", "multiprocessing") == []
+
+
+def test_markup_loads_telebot():
+    assert "telebot.types" in loaded_modules(
+        "from keyboa import Keyboa; Keyboa(items=[1]).keyboard"
+    )
+
+
+def test_constants_button_loads_telebot():
+    assert loaded_modules("import keyboa.constants") == []
+    assert "telebot.types" in loaded_modules(
+        "from keyboa.constants import InlineKeyboardButton"
+    )
+
+    from keyboa.constants import InlineKeyboardButton
+    from telebot.types import InlineKeyboardButton as TelebotButton
+
+    assert InlineKeyboardButton is TelebotButton
+
+
+def test_type_checks():
+    button = inline_button(text="a", callback_data="b")
+    assert is_button(button)
+    assert not is_button({"text": "a"})
+    assert is_markup(keyboa.Keyboa(items=[button]).keyboard)
+    assert not is_markup(button)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        getattr(keyboa, "Unknown")
+    assert "Keyboa" in dir(keyboa)
+    keyboa.Keyboa
+    assert dir(keyboa).count("Keyboa") == 1
@@ -0,0 +1,82 @@
+# -*- coding:utf-8 -*-
+"""
+Test for instrumentation hooks
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+from keyboa import Button, Keyboa
+from keyboa import metrics
+from keyboa.metrics import Metrics, profiled
+
+
+def test_profiled_stages():
+    with profiled() as collected:
+        keyboard = Keyboa(items=list(range(10)), items_in_row=5).keyboard
+        Keyboa(items=[[1, 2], 3]).keyboard
+        Keyboa(items=[4]).to_json()
+        Keyboa.combine((keyboard, keyboard))
+        Button(button_data="text").generate()
+
+    assert not metrics.HOOKS
+    assert collected.calls == {
+        "validation": 3,
+        "buttons": 3,
+        "rows": 2,
+        "json": 1,
+        "combine": 1,
+        "button": 14,
+    }
+    assert all(collected.nanoseconds[stage] > 0 for stage in collected.calls)
+
+    Keyboa(items=[1]).keyboard
+    assert collected.calls["validation"] == 3
+
+
+def test_custom_hook():
+    durations = []
+
+    def hook(stage, nanoseconds):
+        durations.append((stage, nanoseconds))
+
+    metrics.add_hook(hook)
+    try:
+        Keyboa.combine(Keyboa(items=[1]).keyboard)
+    finally:
+        metrics.remove_hook(hook)
+    assert [stage for stage, _ in durations] == [
+        "validation",
+        "button",
+        "buttons",
+        "rows",
+        "combine",
+    ]
+
+
+def test_exporters():
+    collected = Metrics()
+    collected("rows", 1500)
+    collected("rows", 500)
+    collected("validation", 100)
+
+    assert collected.to_prometheus() == (
+        "# HELP keyboa_stage_calls_total Calls of the render stage.\n"
+        "# TYPE keyboa_stage_calls_total counter\n"
+        'keyboa_stage_calls_total{stage="rows"} 2\n'
+        'keyboa_stage_calls_total{stage="validation"} 1\n'
+        "# HELP keyboa_stage_nanoseconds_total Time spent in the render stage.\n"
+        "# TYPE keyboa_stage_nanoseconds_total counter\n"
+        'keyboa_stage_nanoseconds_total{stage="rows"} 2000\n'
+        'keyboa_stage_nanoseconds_total{stage="validation"} 100\n'
+    )
+    assert collected.to_statsd("bot") == (
+        "bot.rows.calls:2|c\n"
+        "bot.rows.nanoseconds:2000|c\n"
+        "bot.validation.calls:1|c\n"
+        "bot.validation.nanoseconds:100|c"
+    )
+
+    collected.reset()
+    assert collected.to_statsd() == ""
@@ -0,0 +1,81 @@
+# -*- coding:utf-8 -*-
+"""
+Test for Paginator object
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from telebot.types import InlineKeyboardMarkup
+from keyboa import Keyboa, Paginator
+
+
+def test_paginator_pages():
+    paginator = Paginator(list(range(1000)), 30, items_in_row=5)
+    assert len(paginator) == 34
+
+    rows = paginator.page(0).to_dict()["inline_keyboard"]
+    assert len(rows) == 7
+    assert rows[0][0] == {"text": "0", "callback_data": "0"}
+    assert [button["callback_data"] for button in rows[-1]] == ["page=0", "page=1"]
+
+    rows = paginator.page(33).to_dict()["inline_keyboard"]
+    assert [button["text"] for button in rows[0]] == ["990", "991", "992", "993", "994"]
+    assert [button["callback_data"] for button in rows[-1]] == ["page=32", "page=33"]
+
+    rows = paginator(10).to_dict()["inline_keyboard"]
+    assert [button["text"] for button in rows[-1]] == ["‹", "11/34", "›"]
+
+
+def test_paginator_caches_pages():
+    paginator = Paginator(list(range(100)), 10)
+    assert paginator.page(3) is paginator.page(3)
+    assert paginator.page(3) is not paginator.page(4)
+
+
+def test_paginator_single_page_has_no_navigation():
+    rows = Paginator(list(range(5)), 10).page(0).to_dict()["inline_keyboard"]
+    assert len(rows) == 5
+
+
+def test_paginator_parse():
+    paginator = Paginator(list(range(100)), 10, navigation_marker="p:")
+    assert paginator.parse("p:12") == 12
+    assert paginator.parse("p:") is None
+    assert paginator.parse("other") is None
+    assert paginator.parse("p:²") is None
+    assert paginator.parse("p:٣") is None
+
+
+@pytest.mark.parametrize("page_size", [0, -1, "10", None])
+def test_paginator_wrong_page_size(page_size):
+    with pytest.raises(ValueError) as _:
+        Paginator(list(range(100)), page_size)
+
+
+@pytest.mark.parametrize("number", [-1, 10, "1"])
+def test_paginator_wrong_page_number(number):
+    with pytest.raises(ValueError) as _:
+        Paginator(list(range(100)), 10).page(number)
+
+
+def test_paginator_page_out_of_limits():
+    with pytest.raises(ValueError) as _:
+        Paginator(list(range(1000)), 100).page(0)
+
+
+def test_keyboa_page():
+    keyboa = Keyboa(items=list(range(30)), front_marker="item=", items_in_row=3)
+    result = keyboa.page(1, 9)
+    assert isinstance(result, InlineKeyboardMarkup)
+    assert result is keyboa.page(1, 9)
+
+    rows = result.to_dict()["inline_keyboard"]
+    assert rows[0][0]["callback_data"] == "item=9"
+    assert len(rows) == 4
+
+    keyboa.front_marker = "other="
+    rows = keyboa.page(1, 9).to_dict()["inline_keyboard"]
+    assert rows[0][0]["callback_data"] == "other=9"
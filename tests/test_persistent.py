@@ -0,0 +1,55 @@
+# -*- coding:utf-8 -*-
+"""
+Test for SqliteKeyboardCache object
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from telebot.types import InlineKeyboardButton
+from keyboa import Keyboa, SqliteKeyboardCache
+from keyboa.persistent import content_hash
+
+
+def test_content_hash():
+    keyboa = Keyboa(items=[[1, 2], ("a", "b"), {"c": "d"}], front_marker="&")
+    same = Keyboa(items=[[1, 2], ("a", "b"), {"c": "d"}], front_marker="&")
+
+    assert content_hash(keyboa) == content_hash(same)
+    assert content_hash(keyboa) != content_hash(keyboa, slice(1, None))
+    assert content_hash(keyboa) != content_hash(
+        Keyboa(items=[[1, 2], ("a", "b"), {"c": "d"}], front_marker="&", back_marker="$")
+    )
+    assert content_hash(Keyboa(items=[1])) != content_hash(Keyboa(items=["1"]))
+    assert content_hash(Keyboa(items=list(range(9)), alignment=range(3, 5))) == (
+        content_hash(Keyboa(items=list(range(9)), alignment=(3, 4)))
+    )
+
+    button = InlineKeyboardButton(text="url", url="https://t.me")
+    copy = InlineKeyboardButton(text="url", url="https://t.me")
+    assert content_hash(Keyboa(items=button)) == content_hash(Keyboa(items=copy))
+
+    with pytest.raises(TypeError):
+        content_hash(Keyboa(items=iter(range(3))))
+
+
+def test_keyboard_cache(tmp_path):
+    path = str(tmp_path / "keyboards.sqlite")
+    cache = SqliteKeyboardCache(path)
+    keyboa = Keyboa(items=list(range(12)), items_in_row=4, front_marker="&n=")
+
+    assert cache.render(keyboa, as_json=True) == keyboa.to_json()
+    assert cache.render(keyboa).to_dict() == keyboa.keyboard.to_dict()
+    assert cache.render(keyboa, slice(2, 6)).to_dict() == keyboa(slice(2, 6)).to_dict()
+    assert len(cache) == 2
+    cache.close()
+
+    restarted = SqliteKeyboardCache(path)
+    restarted.put(restarted.key(keyboa), '{"inline_keyboard": []}')
+    assert restarted.render(keyboa, as_json=True) == '{"inline_keyboard": []}'
+
+    restarted.clear()
+    assert restarted.get(restarted.key(keyboa)) is None
+    assert len(restarted) == 0
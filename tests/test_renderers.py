@@ -0,0 +1,112 @@
+# -*- coding:utf-8 -*-
+"""
+Test for markup renderers
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa
+from keyboa import renderers
+from keyboa.renderers import Renderer, get_renderer
+
+ITEMS = [[1, 2], ("a", "b"), {"c": "d"}, {"text": "e", "url": "https://t.me"}]
+
+
+class FakeObject:
+    """Records arguments of a constructor"""
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+    @classmethod
+    def de_json(cls, data, bot):
+        return cls(data, bot)
+
+
+def fake_module(monkeypatch, name: str) -> None:
+    monkeypatch.setattr(renderers, "INSTANCES", {})
+    monkeypatch.setitem(
+        sys.modules,
+        name,
+        SimpleNamespace(InlineKeyboardButton=FakeObject, InlineKeyboardMarkup=FakeObject),
+    )
+
+
+def test_builtin_renderers():
+    keyboa = Keyboa(items=ITEMS, front_marker="&")
+    assert keyboa.render("telebot").to_dict() == keyboa.keyboard.to_dict()
+    assert keyboa.render("dict") == keyboa.keyboard.to_dict()
+    assert keyboa.render("json") == keyboa.keyboard.to_json()
+    assert keyboa.render("json", slice(1, 3)) == keyboa.to_json(slice(1, 3))
+    assert keyboa.compile().render("dict", slice(1, 3)) == keyboa.to_dict(slice(1, 3))
+
+
+def test_spec_rows_are_made_once():
+    keyboa = Keyboa(items=list(range(10)), items_in_row=3, cache_markup=True)
+    rows = keyboa.spec_rows()
+    assert keyboa.spec_rows() is rows
+    assert keyboa.spec_rows(slice(2, 5)) is not rows
+    assert [len(row) for row in rows] == [3, 3, 3, 1]
+
+    keyboa.front_marker = "&"
+    assert keyboa.spec_rows() is not rows
+    assert keyboa.spec_rows()[0][0].callback_data == "&0"
+
+
+def test_aiogram_renderer(monkeypatch):
+    fake_module(monkeypatch, "aiogram.types")
+    markup = Keyboa(items=ITEMS, front_marker="&").render("aiogram")
+
+    rows = markup.kwargs["inline_keyboard"]
+    assert [len(row) for row in rows] == [2, 1, 1, 1]
+    assert rows[0][0].kwargs == {"text": "1", "callback_data": "&1"}
+    assert rows[3][0].kwargs == {"text": "e", "url": "https://t.me"}
+
+
+def test_library_types_are_resolved_once(monkeypatch):
+    fake_module(monkeypatch, "aiogram.types")
+    imported = []
+    monkeypatch.setattr(
+        renderers,
+        "import_module",
+        lambda name: imported.append(name) or sys.modules[name],
+    )
+    Keyboa(items=ITEMS).render("aiogram")
+    Keyboa(items=ITEMS).render("aiogram")
+    assert imported == ["aiogram.types"]
+    assert get_renderer("aiogram") is get_renderer("aiogram")
+
+
+def test_ptb_renderer(monkeypatch):
+    fake_module(monkeypatch, "telegram")
+    markup = Keyboa(items=ITEMS).render("python-telegram-bot")
+
+    rows = markup.args[0]
+    assert rows[1][0].args == ("a",)
+    assert rows[1][0].kwargs == {"callback_data": "b"}
+    assert rows[3][0].args == ({"text": "e", "url": "https://t.me"}, None)
+
+
+def test_custom_renderer():
+    class TextRenderer(Renderer):
+        def button(self, spec):
+            return spec.text
+
+        def keyboard(self, rows):
+            return "\n".join(" ".join(row) for row in rows)
+
+    assert Keyboa(items=[1, 2, 3], items_in_row=2).render(TextRenderer()) == "1 2\n3"
+
+
+def test_unknown_renderer():
+    with pytest.raises(ValueError):
+        get_renderer("discord")
+    with pytest.raises(TypeError):
+        get_renderer(None)
+    with pytest.raises(TypeError):
+        Renderer()
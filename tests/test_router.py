@@ -0,0 +1,63 @@
+# -*- coding:utf-8 -*-
+"""
+Test for CallbackRouter object
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa, CallbackRouter
+
+
+def test_router_longest_prefix():
+    router = CallbackRouter()
+    router.register("&city=", lambda value: ("city", value))
+    router.register("&city=Lon", lambda value: ("london", value))
+
+    @router.route("&street=")
+    def street(value, suffix=""):
+        return "street", value + suffix
+
+    assert len(router) == 3
+    assert router.dispatch("&city=Tokyo$") == ("city", "Tokyo$")
+    assert router.dispatch("&city=London$") == ("london", "don$")
+    assert router.dispatch("&street=Baker", suffix="!") == ("street", "Baker!")
+    assert router.resolve("&cit") is None
+    assert router.resolve("&city=").value == ""
+
+    with pytest.raises(ValueError) as _:
+        router.dispatch("unknown")
+
+
+def test_router_fallback():
+    router = CallbackRouter()
+    router.register("", lambda value: "fallback")
+    router.register("a", lambda value: "a")
+    assert router.dispatch("abc") == "a"
+    assert router.dispatch("bc") == "fallback"
+    assert router.dispatch("") == "fallback"
+
+
+def test_router_errors():
+    router = CallbackRouter()
+    router.register("a", print)
+    with pytest.raises(ValueError) as _:
+        router.register("a", print)
+    with pytest.raises(TypeError) as _:
+        router.register(1, print)
+    with pytest.raises(TypeError) as _:
+        router.register("b", "not callable")
+
+
+def test_router_with_keyboa_markers():
+    router = CallbackRouter()
+    keyboards = {}
+    for kind in ("city", "street"):
+        keyboa = Keyboa(items=["a", "b"], front_marker=f"&{kind}=", back_marker="$")
+        router.register(keyboa.front_marker, lambda value, kind=kind: (kind, value))
+        keyboards[kind] = keyboa.to_dict()["inline_keyboard"]
+
+    data = keyboards["street"][1][0]["callback_data"]
+    assert router.dispatch(data) == ("street", "b$")
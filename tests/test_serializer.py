@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+"""
+Test that Keyboa.to_json() and Keyboa.to_dict() give the same result as telebot
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from telebot.types import InlineKeyboardButton
+from keyboa import Keyboa
+
+ITEMS = [
+    list(range(12)),
+    ["Moscow", "London", "Tokyo"],
+    ["Ünïcödé", "日本語", "emoji 🕵🏻‍♂️", 'quote " and \\ slash', "new\nline"],
+    [(1, "a"), ("b", 2), ("c", None), {"d": "e"}, {5: 6}],
+    [{"text": "url", "url": "https://t.me"}, InlineKeyboardButton("btn", callback_data="cbd")],
+    [[1, 2, 3], ["a", ("b", "c")], "row", {"text": "link", "url": "https://t.me"}],
+    "single",
+]
+
+OPTIONS = [
+    {},
+    {"front_marker": "&city=", "back_marker": "$"},
+    {"items_in_row": 3},
+    {"alignment": True},
+    {"alignment": [2, 4], "alignment_reverse": True, "front_marker": "f_"},
+]
+
+
+@pytest.mark.parametrize("items", ITEMS)
+@pytest.mark.parametrize("options", OPTIONS)
+def test_to_json_is_identical(items, options):
+    keyboa = Keyboa(items=items, **options)
+    try:
+        expected = keyboa.keyboard
+    except TypeError:
+        with pytest.raises(TypeError) as _:
+            keyboa.to_json()
+        return
+
+    assert keyboa.to_json() == expected.to_json()
+    assert keyboa.to_dict() == expected.to_dict()
+
+
+@pytest.mark.parametrize("slice_", [slice(2), slice(1, None), slice(None, None, 2)])
+def test_to_json_slice_is_identical(slice_):
+    keyboa = Keyboa(items=list(range(10)), items_in_row=4, back_marker="_b")
+    assert keyboa.to_json(slice_) == keyboa.slice(slice_).to_json()
+    assert keyboa(slice_, as_json=True) == keyboa.slice(slice_).to_json()
+
+
+def test_to_json_errors():
+    with pytest.raises(ValueError) as _:
+        Keyboa(items=list(range(3)), copy_text_to_callback=False).to_json()
+
+    with pytest.raises(ValueError) as _:
+        Keyboa(items=["a"], back_marker="b" * 64).to_json()
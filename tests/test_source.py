@@ -0,0 +1,85 @@
+# -*- coding:utf-8 -*-
+"""
+Test for lazy item sources
+"""
+import os
+import sys
+from itertools import count
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa, Paginator
+from keyboa.source import ItemSource
+
+
+def test_source_consumes_only_needed_items():
+    source = ItemSource(count())
+    assert source[5:10] == [5, 6, 7, 8, 9]
+    assert source.consumed == 10
+    assert source[2] == 2
+    assert source[0:10:3] == [0, 3, 6, 9]
+    assert source.consumed == 10
+    assert not source.exhausted
+
+
+def test_source_negative_slice():
+    source = ItemSource(iter(range(20)))
+    assert source[-3:] == [17, 18, 19]
+    assert source[::-5] == [19, 14, 9, 4]
+    assert source.exhausted
+
+
+def test_source_limits_are_checked_incrementally():
+    source = ItemSource(count())
+    with pytest.raises(ValueError) as _:
+        source[:]
+    assert source.consumed == 101
+
+    with pytest.raises(ValueError) as _:
+        ItemSource([list(range(9))])[:]
+
+    with pytest.raises(ValueError) as _:
+        ItemSource(count())[::0]
+
+
+def test_keyboa_from_item_source():
+    source = ItemSource(iter(range(5)))
+    keyboa = Keyboa(items=source, items_in_row=2)
+    assert keyboa.items is source
+    assert keyboa.keyboard.to_json() == Keyboa(items=list(range(5)), items_in_row=2).keyboard.to_json()
+
+    source = ItemSource(count())
+    assert list(zip(range(3), source)) == [(0, 0), (1, 1), (2, 2)]
+    assert source.consumed == 3
+
+
+def test_keyboa_from_generator():
+    keyboa = Keyboa(items=(number * 2 for number in count()), items_in_row=4)
+    expected = Keyboa(items=list(range(0, 24, 2)), items_in_row=4)
+    assert keyboa.slice(slice(12)).to_json() == expected.keyboard.to_json()
+    assert keyboa.to_json(slice(4, 8)) == expected.to_json(slice(4, 8))
+
+    keyboa = Keyboa(items=range(10), front_marker="f_")
+    assert keyboa.keyboard.to_json() == Keyboa(items=list(range(10)), front_marker="f_").keyboard.to_json()
+
+    with pytest.raises(ValueError) as _:
+        Keyboa(items=range(0))
+
+
+def test_paginator_from_generator():
+    paginator = Paginator((f"item {number}" for number in range(95)), 10)
+    assert paginator.pages is None
+
+    rows = paginator.page(3).to_dict()["inline_keyboard"]
+    assert rows[0][0]["text"] == "item 30"
+    assert [button["text"] for button in rows[-1]] == ["‹", "4", "›"]
+    assert paginator.items.consumed == 41
+
+    rows = paginator.page(9).to_dict()["inline_keyboard"]
+    assert len(rows) == 6
+    assert [button["text"] for button in rows[-1]] == ["‹", "10/10"]
+    assert len(paginator) == 10
+
+    with pytest.raises(ValueError) as _:
+        paginator.page(10)
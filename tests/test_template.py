@@ -0,0 +1,66 @@
+# -*- coding:utf-8 -*-
+"""
+Test for KeyboaTemplate object
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
+from keyboa import Keyboa, KeyboaTemplate
+
+ITEMS = ["Edit", ("Delete", "del"), {"Pin {x}": "pin{x}"}, {"text": "Link", "url": "https://t.me"}]
+
+
+@pytest.mark.parametrize("record_id", [1, "123", "ключ"])
+def test_template_is_the_same_as_keyboa(record_id):
+    template = KeyboaTemplate(
+        items=ITEMS, front_marker="&a=", back_marker="&id={id}$", items_in_row=2
+    )
+    expected = Keyboa(
+        items=ITEMS, front_marker="&a=", back_marker=f"&id={record_id}$", items_in_row=2
+    ).keyboard
+
+    result = template.render(id=record_id)
+    assert isinstance(result, InlineKeyboardMarkup)
+    assert result.to_json() == expected.to_json()
+    assert template(id=record_id).to_json() == expected.to_json()
+    assert template.render_json(id=record_id) == expected.to_json()
+
+
+def test_template_fields():
+    template = KeyboaTemplate(
+        items=[1, 2], front_marker="{kind}:{{", back_marker="}}:{id}:{kind}"
+    )
+    assert template.fields == {"kind": 2, "id": 1}
+    rows = template.render(kind="k", id=7).to_dict()["inline_keyboard"]
+    assert rows[1][0]["callback_data"] == "k:{2}:7:k"
+
+    with pytest.raises(ValueError) as _:
+        template.render(kind="k")
+    with pytest.raises(TypeError) as _:
+        template.render(kind="k", id=None)
+
+    for marker in ("{}", "{0}", "{id!r}", "{id:>5}", "{id.real}"):
+        with pytest.raises(ValueError) as _:
+            KeyboaTemplate(items=[1], back_marker=marker)
+
+
+def test_template_callback_limit():
+    template = KeyboaTemplate(items=["a", "bbbb"], back_marker="&id={id}")
+    template.render(id="x" * 56)
+    with pytest.raises(ValueError) as _:
+        template.render(id="x" * 57)
+    with pytest.raises(ValueError) as _:
+        template.render_json(id="я" * 29)
+
+    with pytest.raises(ValueError) as _:
+        KeyboaTemplate(items=["a"], back_marker="x" * 64 + "{id}")
+
+
+def test_template_keeps_passed_buttons():
+    button = InlineKeyboardButton(text="text", callback_data="cbd")
+    template = KeyboaTemplate(items=[button, 1], back_marker="{id}")
+    assert template.render(id=2).keyboard[0][0] is button
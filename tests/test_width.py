@@ -0,0 +1,63 @@
+# -*- coding:utf-8 -*-
+"""
+Test for display width and packing of rows
+"""
+import os
+import sys
+
+sys.path.insert(0, "%s/../" % os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from keyboa import Keyboa
+from keyboa.width import display_width, packed_rows
+
+
+@pytest.mark.parametrize(
+    "text, width",
+    [
+        ("", 0),
+        ("Baker", 5),
+        ("北京", 4),
+        ("ｆｕｌｌ", 8),
+        ("é", 1),
+        ("\U0001f600", 2),
+        ("☀️", 2),
+        ("\U0001f44d\U0001f3fd", 2),
+        ("\U0001f575\U0001f3fb‍♂️", 2),
+    ],
+)
+def test_display_width(text, width):
+    assert display_width(text) == width
+
+
+def test_packed_rows():
+    items = ["a", "bb", "ccc", "dddd", "eeeeeeeeee"]
+    rows = list(packed_rows(items, items, row_width=12))
+    assert rows == [["a", "bb", "ccc"], ["dddd"], ["eeeeeeeeee"]]
+
+    rows = list(packed_rows(items, items, row_width=100, items_in_row=2))
+    assert rows == [["a", "bb"], ["ccc", "dddd"], ["eeeeeeeeee"]]
+
+
+def test_keyboa_row_width():
+    items = ["Yes", "No", "Maybe", "北京", "Shanghai", "東京"]
+    keyboa = Keyboa(items=items, row_width=16)
+    rows = [
+        [button["text"] for button in row] for row in keyboa.to_dict()["inline_keyboard"]
+    ]
+    assert rows == [["Yes", "No", "Maybe"], ["北京", "Shanghai"], ["東京"]]
+    assert keyboa().to_dict() == keyboa.to_dict()
+    assert Keyboa(items=items, row_width=100, items_in_row=4).to_dict()[
+        "inline_keyboard"
+    ][1] == [
+        {"text": "Shanghai", "callback_data": "Shanghai"},
+        {"text": "東京", "callback_data": "東京"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "row_width, error", [(0, ValueError), ("10", TypeError), (True, TypeError)]
+)
+def test_keyboa_row_width_invalid(row_width, error):
+    with pytest.raises(error):
+        Keyboa(items=["a"], row_width=row_width)